@@ -1,5 +1,42 @@
 """Módulo de algoritmos para BFS Visualizer."""
 
-from .bfs import generate_bfs_steps
+from importlib import import_module
 
-__all__ = ['generate_bfs_steps']
+from .bfs import (
+    STOP_EXHAUSTED, STOP_MAX_DEPTH, STOP_MAX_VISITED, STOP_TARGET,
+    BFSResult, bfs_search, generate_bfs_steps, iter_bfs_forest_steps, iter_bfs_steps,
+    neighbor_function
+)
+from .bfs_tree import BFSTreeIndex, TreeIndex
+from .grid_bfs import GridBFS, GridBFSResult, grid_bfs
+from .implicit import ImplicitBFSResult, VisitedBitset, VisitedSet, implicit_bfs
+from .level_stats import LevelStats, LevelStatsRecorder
+from .producer import StepProducer
+
+# multiprocessing y shared_memory solo se importan si se usa el motor paralelo
+_LAZY_ATTRS = {
+    'ENGINES': '.engines',
+    'register_engine': '.engines',
+    'ParallelBFS': '.parallel_bfs',
+    'parallel_bfs': '.parallel_bfs',
+}
+
+__all__ = [
+    'STOP_EXHAUSTED', 'STOP_MAX_DEPTH', 'STOP_MAX_VISITED', 'STOP_TARGET',
+    'BFSResult', 'bfs_search', 'generate_bfs_steps', 'iter_bfs_forest_steps', 'iter_bfs_steps',
+    'neighbor_function', 'BFSTreeIndex', 'TreeIndex', 'GridBFS', 'GridBFSResult', 'grid_bfs', 'ImplicitBFSResult', 'VisitedBitset', 'VisitedSet', 'implicit_bfs',
+    'LevelStats', 'LevelStatsRecorder', 'ENGINES', 'register_engine', 'ParallelBFS', 'parallel_bfs', 'StepProducer'
+]
+
+
+def __getattr__(name):
+    """Importa el submódulo de un nombre exportado la primera vez que se usa."""
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_ATTRS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,39 +1,332 @@
 """Implementación del algoritmo BFS (Breadth-First Search)."""
 
-from collections import deque
+from collections import deque, namedtuple
 
+from .bfs_tree import BFSTreeIndex
+from .level_stats import LevelTracker
 
-def generate_bfs_steps(graph, start_node):
+
+# Motivos por los que termina un BFS
+STOP_EXHAUSTED = 'exhausted'      # Se recorrió toda la componente alcanzable
+STOP_TARGET = 'target'            # Se descubrió el nodo objetivo
+STOP_MAX_DEPTH = 'max_depth'      # Se alcanzó la profundidad máxima
+STOP_MAX_VISITED = 'max_visited'  # Se agotó el presupuesto de nodos descubiertos
+
+
+class BFSResult(namedtuple(
+    'BFSResult', ['order', 'distances', 'parents', 'stop_reason'],
+    defaults=(STOP_EXHAUSTED,)
+)):
     """
-    Genera los pasos del algoritmo BFS para animación.
+    Resultado de un BFS sin animación: orden de visita, distancia en saltos
+    desde el origen, padre en el árbol BFS (None para el origen) y motivo
+    de término.
+    """
+    
+    __slots__ = ()
+    
+    def tree_index(self, lifting=True):
+        """
+        Construye el índice de ancestros del árbol BFS.
+        
+        Args:
+            lifting: Si es True, incluye la tabla de binary lifting
+                (ancestro común y k-ésimo ancestro en O(log profundidad))
+                
+        Returns:
+            BFSTreeIndex con el array de padres del árbol
+        """
+        return BFSTreeIndex(self, lifting)
+
+
+def neighbor_function(graph):
+    """
+    Retorna una función estado -> vecinos en orden determinista.
     
     Args:
-        graph: Objeto Graph con los nodos y adyacencias
-        start_node: ID del nodo inicial
+        graph: Objeto Graph (sus vecinos se ordenan por ID) o una función
+            que genere los vecinos de un estado hashable al vuelo; en ese
+            caso se respeta el orden que ella entregue
+            
+    Returns:
+        Función que recibe un nodo o estado y retorna un iterable de vecinos
+    """
+    if callable(graph):
+        return graph
+    get_neighbors = graph.get_neighbors
+    return lambda node: sorted(get_neighbors(node))
+
+
+def _target_predicate(target):
+    """Convierte un ID de nodo o un predicado en una función nodo -> bool."""
+    if target is None or callable(target):
+        return target
+    return lambda node: node == target
+
+
+def _no_queue(bfs_queue):
+    """Sustituto de `list` cuando los pasos no llevan copia de la cola."""
+    return None
+
+
+def _has_undiscovered(get_neighbors, pending, queued, visited, depth_of, max_depth):
+    """
+    Indica si al detenerse quedaba algún nodo por descubrir.
+    
+    Args:
+        get_neighbors: Función nodo -> vecinos
+        pending: Iterador de los vecinos del nodo actual aún no examinados
+        queued: Nodos en la cola (visitados pero sin expandir)
+        visited: Nodos ya descubiertos
+        depth_of: Distancia de cada nodo, o None si no hay límite de profundidad
+        max_depth: Profundidad máxima (los nodos a esa distancia no se expanden)
         
     Returns:
-        Lista de tuplas representando cada paso del algoritmo:
-        - ('visit', node_id, queue_list): Nodo siendo visitado
-        - ('enqueue', node_id, from_node_id, queue_list): Nodo agregado a la cola
-        - ('done', node_id, queue_list): Nodo terminado de procesar
+        True si algún vecino pendiente o de un nodo en la cola no fue descubierto
     """
-    steps = []
-    bfs_queue = deque([start_node])
+    for neighbor in pending:
+        if neighbor not in visited:
+            return True
+    for node in queued:
+        if depth_of is not None and depth_of[node] >= max_depth:
+            continue
+        for neighbor in get_neighbors(node):
+            if neighbor not in visited:
+                return True
+    return False
+
+
+def iter_bfs_steps(graph, start_node, max_depth=None, target=None, max_visited=None,
+                   with_queues=True, on_level=None):
+    """
+    Genera perezosamente los pasos del algoritmo BFS para animación.
+    
+    Los límites detienen tanto la traza como el recorrido: con ellos el
+    costo es proporcional al vecindario explorado, no a la componente. Un
+    límite solo se informa como motivo de término si dejó nodos alcanzables
+    sin descubrir; si no, el recorrido termina como STOP_EXHAUSTED.
+    
+    Args:
+        graph: Objeto Graph o función estado -> vecinos (ver neighbor_function)
+        start_node: ID del nodo (o estado) inicial
+        max_depth: Distancia máxima a explorar (los nodos a esa distancia se
+            visitan pero no se expanden); None para no limitar
+        target: ID del nodo objetivo o predicado nodo -> bool; el BFS se
+            detiene al descubrirlo
+        max_visited: Cantidad máxima de nodos descubiertos (incluido el origen)
+        with_queues: Si es False, el último elemento de cada paso es None en
+            lugar de una copia de la cola (evita el costo O(cola) por paso
+            cuando la cola se reconstruye después, p. ej. al grabar trazas)
+        on_level: Función opcional que recibe un LevelStats al cerrarse
+            cada nivel (después del último paso del nivel); sin ella no se
+            lleva ninguna cuenta
+            
+    Yields:
+        Tuplas con el mismo formato que generate_bfs_steps
+    """
+    snapshot = list if with_queues else _no_queue
+    tracker = LevelTracker(on_level) if on_level is not None else None
+    is_target = _target_predicate(target)
+    if is_target is not None and is_target(start_node):
+        yield ('stop', STOP_TARGET, start_node, snapshot([start_node]))
+        if tracker is not None:
+            tracker.finish(1)
+        return
+    get_neighbors = neighbor_function(graph)
     visited = {start_node}
+    if max_visited is not None and max_visited <= 1 and (
+        _has_undiscovered(get_neighbors, (), (start_node,), visited, None, None)
+    ):
+        yield ('stop', STOP_MAX_VISITED, None, snapshot([start_node]))
+        if tracker is not None:
+            tracker.finish(1)
+        return
+    
+    bfs_queue = deque([start_node])
+    depths = {start_node: 0} if max_depth is not None else None
+    stop_reason = STOP_EXHAUSTED
     
     while bfs_queue:
         current = bfs_queue.popleft()
-        steps.append(('visit', current, list(bfs_queue)))
+        if tracker is not None:
+            tracker.visit(len(visited))
+        yield ('visit', current, snapshot(bfs_queue))
         
-        # Obtener vecinos ordenados
-        neighbors = sorted(graph.get_neighbors(current))
+        if depths is not None and depths[current] >= max_depth:
+            # Nodo en el borde: no se expanden sus vecinos; el límite solo
+            # cortó el recorrido si alguno quedó sin descubrir
+            if stop_reason == STOP_EXHAUSTED and any(
+                neighbor not in visited for neighbor in get_neighbors(current)
+            ):
+                stop_reason = STOP_MAX_DEPTH
+            yield ('done', current, snapshot(bfs_queue))
+            continue
         
-        for neighbor in neighbors:
+        # Obtener vecinos ordenados
+        neighbors = get_neighbors(current)
+        if tracker is not None:
+            neighbors = tracker.examine(neighbors)
+        pending = iter(neighbors)
+        for neighbor in pending:
             if neighbor not in visited:
                 visited.add(neighbor)
                 bfs_queue.append(neighbor)
-                steps.append(('enqueue', neighbor, current, list(bfs_queue)))
+                if depths is not None:
+                    depths[neighbor] = depths[current] + 1
+                yield ('enqueue', neighbor, current, snapshot(bfs_queue))
+                
+                if is_target is not None and is_target(neighbor):
+                    yield ('stop', STOP_TARGET, neighbor, snapshot(bfs_queue))
+                    if tracker is not None:
+                        tracker.finish(len(visited), neighbors, neighbor)
+                    return
+                if max_visited is not None and len(visited) >= max_visited and (
+                    _has_undiscovered(
+                        get_neighbors, pending, bfs_queue, visited, depths, max_depth
+                    )
+                ):
+                    yield ('stop', STOP_MAX_VISITED, None, snapshot(bfs_queue))
+                    if tracker is not None:
+                        tracker.finish(len(visited), neighbors, neighbor)
+                    return
         
-        steps.append(('done', current, list(bfs_queue)))
+        yield ('done', current, snapshot(bfs_queue))
+    
+    if stop_reason != STOP_EXHAUSTED:
+        yield ('stop', stop_reason, None, snapshot([]))
+    if tracker is not None:
+        tracker.finish(len(visited))
+
+
+def iter_bfs_forest_steps(graph, start_node, with_queues=True, on_level=None):
+    """
+    Genera los pasos de un bosque BFS que cubre todas las componentes.
+    
+    Recorre primero la componente de `start_node` y luego cada componente
+    restante desde su nodo de menor ID, usando las componentes que el
+    grafo mantiene con union-find (sin recorridos extra para hallarlas;
+    una GraphSnapshot las calcula una sola vez).
+    
+    Args:
+        graph: Objeto Graph con los nodos y adyacencias
+        start_node: ID del nodo inicial
+        with_queues: Si es False, los pasos no llevan copia de la cola (ver
+            iter_bfs_steps)
+        on_level: Función opcional que recibe un LevelStats por nivel; los
+            niveles de cada árbol vuelven a empezar en 0
+            
+    Yields:
+        Los pasos de generate_bfs_steps, más al inicio de cada árbol nuevo:
+        - ('root', node_id, queue_list): Raíz de un nuevo árbol agregada a la cola
+    """
+    yield from iter_bfs_steps(graph, start_node, with_queues=with_queues, on_level=on_level)
+    
+    for component in graph.components():
+        if start_node in component:
+            continue
+        root = min(component)
+        yield ('root', root, [root] if with_queues else None)
+        yield from iter_bfs_steps(graph, root, with_queues=with_queues, on_level=on_level)
+
+
+def generate_bfs_steps(graph, start_node, max_depth=None, target=None, max_visited=None,
+                       on_level=None):
+    """
+    Genera los pasos del algoritmo BFS para animación.
+    
+    Args:
+        graph: Objeto Graph con los nodos y adyacencias
+        start_node: ID del nodo inicial
+        max_depth, target, max_visited: Límites opcionales (ver iter_bfs_steps)
+        on_level: Función opcional que recibe un LevelStats por nivel
+        
+    Returns:
+        Lista de tuplas representando cada paso del algoritmo:
+        - ('visit', node_id, queue_list): Nodo siendo visitado
+        - ('enqueue', node_id, from_node_id, queue_list): Nodo agregado a la cola
+        - ('done', node_id, queue_list): Nodo terminado de procesar
+        - ('stop', reason, node_id, queue_list): Solo si un límite detuvo el
+          BFS; reason es una constante STOP_* y node_id el objetivo hallado
+          (o None)
+    """
+    return list(iter_bfs_steps(
+        graph, start_node, max_depth, target, max_visited, on_level=on_level
+    ))
+
+
+def bfs_search(graph, start_node, max_depth=None, target=None, max_visited=None,
+               on_level=None):
+    """
+    Ejecuta BFS sin generar pasos de animación.
+    
+    Recorre los vecinos en el mismo orden que generate_bfs_steps, así que el
+    orden de visita y los padres coinciden con los de la animación.
+    
+    Args:
+        graph: Objeto Graph o función estado -> vecinos (ver neighbor_function)
+        start_node: ID del nodo (o estado) inicial
+        max_depth, target, max_visited: Límites opcionales (ver iter_bfs_steps)
+        on_level: Función opcional que recibe un LevelStats por nivel
+        
+    Returns:
+        BFSResult con el orden de descubrimiento, distancias, padres y el
+        motivo de término
+    """
+    order = [start_node]
+    distances = {start_node: 0}
+    parents = {start_node: None}
+    tracker = LevelTracker(on_level) if on_level is not None else None
+    
+    is_target = _target_predicate(target)
+    if is_target is not None and is_target(start_node):
+        if tracker is not None:
+            tracker.finish(1)
+        return BFSResult(order, distances, parents, STOP_TARGET)
+    get_neighbors = neighbor_function(graph)
+    if max_visited is not None and max_visited <= 1 and (
+        _has_undiscovered(get_neighbors, (), order, distances, None, None)
+    ):
+        if tracker is not None:
+            tracker.finish(1)
+        return BFSResult(order, distances, parents, STOP_MAX_VISITED)
+    
+    stop_reason = STOP_EXHAUSTED
+    head = 0
+    while head < len(order):
+        current = order[head]
+        head += 1
+        if tracker is not None:
+            tracker.visit(len(order))
+        if max_depth is not None and distances[current] >= max_depth:
+            if stop_reason == STOP_EXHAUSTED and any(
+                neighbor not in distances for neighbor in get_neighbors(current)
+            ):
+                stop_reason = STOP_MAX_DEPTH
+            continue
+        next_distance = distances[current] + 1
+        neighbors = get_neighbors(current)
+        if tracker is not None:
+            neighbors = tracker.examine(neighbors)
+        pending = iter(neighbors)
+        for neighbor in pending:
+            if neighbor not in distances:
+                distances[neighbor] = next_distance
+                parents[neighbor] = current
+                order.append(neighbor)
+                if is_target is not None and is_target(neighbor):
+                    if tracker is not None:
+                        tracker.finish(len(order), neighbors, neighbor)
+                    return BFSResult(order, distances, parents, STOP_TARGET)
+                if max_visited is not None and len(order) >= max_visited and (
+                    _has_undiscovered(
+                        get_neighbors, pending, order[head:], distances,
+                        distances if max_depth is not None else None, max_depth
+                    )
+                ):
+                    if tracker is not None:
+                        tracker.finish(len(order), neighbors, neighbor)
+                    return BFSResult(order, distances, parents, STOP_MAX_VISITED)
     
-    return steps
+    if tracker is not None:
+        tracker.finish(len(order))
+    return BFSResult(order, distances, parents, stop_reason)
@@ -0,0 +1,216 @@
+"""Consultas de ancestros sobre árboles BFS (binary lifting)."""
+
+from array import array
+
+
+class TreeIndex:
+    """
+    Árbol (o bosque) BFS sobre índices densos con consultas de ancestros.
+    
+    Guarda el padre de cada índice en un array, con un centinela (el
+    índice `size`) como padre de las raíces y de los no alcanzados. La
+    tabla de binary lifting es opcional: `up[j][i]` es el ancestro
+    2^j de i, y con ella el k-ésimo ancestro y el ancestro común más
+    bajo cuestan O(log profundidad) a cambio de 4 bytes por nodo y por
+    nivel de la tabla. Sin la tabla, las mismas consultas suben de padre
+    en padre en O(profundidad).
+    """
+    
+    def __init__(self, parent, depth, lifting=True):
+        """
+        Inicializa el índice.
+        
+        Args:
+            parent: Secuencia con el índice del padre de cada nodo (-1 para
+                las raíces y los no alcanzados)
+            depth: Secuencia con la profundidad de cada nodo (-1 si no fue
+                alcanzado)
+            lifting: Si es True, construye la tabla de binary lifting
+        """
+        size = len(parent)
+        self.size = size
+        self.depth = depth
+        self.parent = array('i', [p if p >= 0 else size for p in parent])
+        self.parent.append(size)  # El centinela es su propio padre
+        self.up = None
+        if lifting:
+            self.build_lifting()
+    
+    def build_lifting(self):
+        """Construye la tabla de binary lifting (una sola vez)."""
+        if self.up is not None:
+            return
+        up = [self.parent]
+        span = max(self.depth, default=0)
+        while (1 << len(up)) <= span:
+            prev = up[-1]
+            up.append(array('i', [prev[p] for p in prev]))
+        self.up = up
+    
+    def ancestor(self, i, k):
+        """
+        Retorna el k-ésimo ancestro de un índice.
+        
+        Args:
+            i: Índice del nodo
+            k: Cantidad de niveles a subir (0 retorna el mismo nodo)
+            
+        Returns:
+            Índice del ancestro, o None si el nodo está a menos de k niveles
+            de su raíz o no fue alcanzado
+        """
+        if k < 0 or self.depth[i] < k:
+            return None
+        if self.up is None:
+            parent = self.parent
+            for _ in range(k):
+                i = parent[i]
+            return i
+        j = 0
+        while k:
+            if k & 1:
+                i = self.up[j][i]
+            k >>= 1
+            j += 1
+        return i
+    
+    def lca(self, a, b):
+        """
+        Retorna el ancestro común más bajo de dos índices.
+        
+        Returns:
+            Índice del ancestro común, o None si están en árboles distintos
+            o alguno no fue alcanzado
+        """
+        depth = self.depth
+        if depth[a] < 0 or depth[b] < 0:
+            return None
+        if depth[a] < depth[b]:
+            a, b = b, a
+        a = self.ancestor(a, depth[a] - depth[b])
+        if a == b:
+            return a
+        
+        parent = self.parent
+        if self.up is None:
+            # Misma profundidad: suben juntos hasta coincidir (o hasta el centinela)
+            while a != b:
+                a = parent[a]
+                b = parent[b]
+        else:
+            for level in reversed(self.up):
+                if level[a] != level[b]:
+                    a = level[a]
+                    b = level[b]
+            a = parent[a]
+        return a if a != self.size else None
+    
+    def path(self, i):
+        """
+        Retorna el camino desde la raíz hasta un índice.
+        
+        Returns:
+            Lista de índices (raíz primero), o None si no fue alcanzado
+        """
+        if self.depth[i] < 0:
+            return None
+        parent = self.parent
+        size = self.size
+        path = [i]
+        i = parent[i]
+        while i != size:
+            path.append(i)
+            i = parent[i]
+        path.reverse()
+        return path
+    
+    def path_between(self, a, b):
+        """
+        Retorna el camino entre dos índices dentro del árbol, pasando por su LCA.
+        
+        Returns:
+            Lista de índices de `a` a `b`, o None si no comparten árbol
+        """
+        top = self.lca(a, b)
+        if top is None:
+            return None
+        parent = self.parent
+        up_part = [a]
+        while a != top:
+            a = parent[a]
+            up_part.append(a)
+        down_part = []
+        while b != top:
+            down_part.append(b)
+            b = parent[b]
+        down_part.reverse()
+        return up_part + down_part
+
+
+class BFSTreeIndex:
+    """
+    Índice de ancestros de un BFSResult, consultado por ID de nodo.
+    
+    Los nodos se numeran en orden de descubrimiento y las consultas se
+    resuelven con un TreeIndex. Los nodos que no están en el árbol dan
+    None en todas las consultas.
+    """
+    
+    def __init__(self, result, lifting=True):
+        """
+        Construye el índice.
+        
+        Args:
+            result: BFSResult (sus padres y distancias; un bosque BFS tiene
+                una raíz con padre None por componente)
+            lifting: Si es True, construye la tabla de binary lifting
+        """
+        parents = result.parents
+        self.ids = list(parents)
+        self.index = index = {node: i for i, node in enumerate(self.ids)}
+        self.tree = TreeIndex(
+            [index[p] if p is not None else -1 for p in parents.values()],
+            array('i', [result.distances[node] for node in self.ids]),
+            lifting
+        )
+    
+    def __contains__(self, node):
+        """Retorna True si el nodo está en el árbol."""
+        return node in self.index
+    
+    def depth(self, node):
+        """Retorna la profundidad de un nodo, o None si no está en el árbol."""
+        i = self.index.get(node)
+        return self.tree.depth[i] if i is not None else None
+    
+    def ancestor(self, node, k):
+        """Retorna el k-ésimo ancestro de un nodo, o None (ver TreeIndex.ancestor)."""
+        i = self.index.get(node)
+        if i is None:
+            return None
+        found = self.tree.ancestor(i, k)
+        return self.ids[found] if found is not None else None
+    
+    def lca(self, a, b):
+        """Retorna el ancestro común más bajo de dos nodos, o None."""
+        i = self.index.get(a)
+        j = self.index.get(b)
+        if i is None or j is None:
+            return None
+        found = self.tree.lca(i, j)
+        return self.ids[found] if found is not None else None
+    
+    def path(self, node):
+        """Retorna el camino desde la raíz hasta un nodo, o None."""
+        i = self.index.get(node)
+        path = self.tree.path(i) if i is not None else None
+        return [self.ids[k] for k in path] if path is not None else None
+    
+    def path_between(self, a, b):
+        """Retorna el camino de `a` a `b` dentro del árbol, o None."""
+        i = self.index.get(a)
+        j = self.index.get(b)
+        if i is None or j is None:
+            return None
+        path = self.tree.path_between(i, j)
+        return [self.ids[k] for k in path] if path is not None else None
@@ -0,0 +1,86 @@
+"""BFS bidireccional para consultas de camino más corto entre dos nodos."""
+
+from collections import namedtuple
+
+
+# Resultado de una consulta punto a punto: camino (lista de IDs desde el
+# origen hasta el destino, o None si no hay camino), cantidad de nodos
+# explorados por ambas búsquedas y pasos para animación.
+BidirectionalResult = namedtuple('BidirectionalResult', ['path', 'explored', 'steps'])
+
+SIDES = ('source', 'target')
+
+
+def bidirectional_bfs(graph, source, target, record_steps=False):
+    """
+    Busca el camino con menos aristas entre dos nodos con BFS desde ambos extremos.
+    
+    En cada iteración se expande un nivel completo de la frontera más
+    pequeña; al terminar el nivel en que las búsquedas se encuentran se
+    elige el punto de encuentro que da el camino más corto.
+    
+    Args:
+        graph: Objeto Graph con los nodos y adyacencias
+        source: ID del nodo origen
+        target: ID del nodo destino
+        record_steps: Si es True, registra los pasos para animación:
+            - ('expand', side, node_id): Nodo de la frontera siendo expandido
+            - ('discover', side, node_id, from_node_id): Nodo descubierto
+            - ('path', path): Camino encontrado
+            
+    Returns:
+        BidirectionalResult con el camino, nodos explorados y pasos
+    """
+    steps = []
+    if source == target:
+        if record_steps:
+            steps.append(('path', [source]))
+        return BidirectionalResult([source], 1, steps)
+    
+    parents = ({source: None}, {target: None})
+    distances = ({source: 0}, {target: 0})
+    frontiers = [[source], [target]]
+    best = None  # (longitud, nodo de encuentro)
+    
+    while frontiers[0] and frontiers[1] and best is None:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        own_parents, other_parents = parents[side], parents[1 - side]
+        own_distances, other_distances = distances[side], distances[1 - side]
+        
+        next_frontier = []
+        for node in frontiers[side]:
+            if record_steps:
+                steps.append(('expand', SIDES[side], node))
+            next_distance = own_distances[node] + 1
+            for neighbor in sorted(graph.get_neighbors(node)):
+                if neighbor in own_parents:
+                    continue
+                own_parents[neighbor] = node
+                own_distances[neighbor] = next_distance
+                next_frontier.append(neighbor)
+                if record_steps:
+                    steps.append(('discover', SIDES[side], neighbor, node))
+                
+                if neighbor in other_parents:
+                    length = next_distance + other_distances[neighbor]
+                    if best is None or length < best[0]:
+                        best = (length, neighbor)
+        frontiers[side] = next_frontier
+    
+    explored = len(parents[0].keys() | parents[1].keys())
+    if best is None:
+        return BidirectionalResult(None, explored, steps)
+    
+    path = _walk(parents[0], best[1])[::-1] + _walk(parents[1], best[1])[1:]
+    if record_steps:
+        steps.append(('path', path))
+    return BidirectionalResult(path, explored, steps)
+
+
+def _walk(parents, node):
+    """Sigue los punteros a padre desde `node` hasta la raíz de la búsqueda."""
+    path = []
+    while node is not None:
+        path.append(node)
+        node = parents[node]
+    return path
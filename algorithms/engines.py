@@ -0,0 +1,126 @@
+"""Registro de motores BFS intercambiables para compararlos entre sí."""
+
+from .bfs import STOP_EXHAUSTED, BFSResult, bfs_search, generate_bfs_steps
+from .producer import StepProducer
+
+
+# Nombre -> función (graph, start_node) -> (BFSResult, pasos o None)
+ENGINES = {}
+
+# Motor contra el que se comparan los demás
+REFERENCE_ENGINE = 'reference'
+
+
+def register_engine(name):
+    """
+    Decorador que registra un motor BFS.
+    
+    El motor recibe (graph, start_node) y retorna una tupla
+    (BFSResult, steps), donde steps es la lista de pasos con el formato de
+    generate_bfs_steps o None si el motor no produce traza.
+    """
+    def decorator(func):
+        ENGINES[name] = func
+        return func
+    return decorator
+
+
+def result_from_steps(steps, start_node):
+    """
+    Deriva orden de visita, distancias y padres de una traza de pasos.
+    
+    Args:
+        steps: Lista de pasos con el formato de generate_bfs_steps (o de
+            iter_bfs_forest_steps)
+        start_node: ID del nodo inicial
+        
+    Returns:
+        BFSResult equivalente
+    """
+    stop_reason = STOP_EXHAUSTED
+    order = []
+    distances = {start_node: 0}
+    parents = {start_node: None}
+    for step in steps:
+        if step[0] == 'visit':
+            order.append(step[1])
+        elif step[0] == 'enqueue':
+            _, node, from_node, _ = step
+            parents[node] = from_node
+            distances[node] = distances[from_node] + 1
+        elif step[0] == 'root':
+            # Bosque BFS: raíz de otra componente
+            parents[step[1]] = None
+            distances[step[1]] = 0
+        elif step[0] == 'stop':
+            stop_reason = step[1]
+    return BFSResult(order, distances, parents, stop_reason)
+
+
+def steps_from_result(result):
+    """
+    Reconstruye una traza animable a partir del resultado de un motor sin traza.
+    
+    Los pasos siguen el orden de visita del resultado y encolan a los hijos
+    de cada nodo en el orden en que fueron descubiertos, así que para un
+    BFSResult completo coinciden con los de generate_bfs_steps salvo por
+    la cola, que no se copia (el último elemento de cada paso es None).
+    
+    Args:
+        result: BFSResult con orden, padres y motivo de término
+        
+    Returns:
+        Lista de pasos con el formato de generate_bfs_steps
+    """
+    children = {}
+    for node in result.order:
+        parent = result.parents.get(node)
+        if parent is not None:
+            children.setdefault(parent, []).append(node)
+    
+    steps = []
+    for node in result.order:
+        steps.append(('visit', node, None))
+        for child in children.get(node, ()):
+            steps.append(('enqueue', child, node, None))
+        steps.append(('done', node, None))
+    if result.stop_reason != STOP_EXHAUSTED:
+        steps.append(('stop', result.stop_reason, None, None))
+    return steps
+
+
+@register_engine('reference')
+def _reference_engine(graph, start_node):
+    """generate_bfs_steps: la implementación original."""
+    steps = generate_bfs_steps(graph, start_node)
+    return result_from_steps(steps, start_node), steps
+
+
+@register_engine('producer')
+def _producer_engine(graph, start_node):
+    """StepProducer: los mismos pasos generados en un hilo y entregados por bloques."""
+    producer = StepProducer(graph, start_node, chunk_size=64)
+    producer.start()
+    steps = []
+    while not producer.finished:
+        chunk = producer.chunks.get()
+        if chunk is None:
+            producer.finished = True
+        else:
+            steps.extend(chunk)
+    return result_from_steps(steps, start_node), steps
+
+
+@register_engine('search')
+def _search_engine(graph, start_node):
+    """bfs_search: BFS sin traza."""
+    return bfs_search(graph, start_node), None
+
+
+@register_engine('parallel')
+def _parallel_engine(graph, start_node):
+    """ParallelBFS con dos procesos, paralelizando todas las fronteras."""
+    from .parallel_bfs import ParallelBFS
+    
+    with ParallelBFS(graph, workers=2, min_parallel_frontier=1) as engine:
+        return engine.search(start_node), None
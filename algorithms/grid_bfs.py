@@ -0,0 +1,110 @@
+"""BFS sobre una grilla con obstáculos usando índices de celda."""
+
+from array import array
+from collections import namedtuple
+
+
+# Resultado de grid_bfs: distancia al destino (None si no es alcanzable o
+# no se indicó destino), camino como lista de índices de celda, cantidad
+# de celdas descubiertas y cantidad de niveles expandidos.
+GridBFSResult = namedtuple('GridBFSResult', ['distance', 'path', 'visited_count', 'levels'])
+
+
+class GridBFS:
+    """
+    BFS por niveles sobre una Grid que avanza de a un nivel por llamada.
+    
+    Los padres se guardan en un array('i') indexado por celda (-1 = no
+    descubierta), que hace a la vez de conjunto de visitados. Como la
+    grilla tiene un borde de muros, expandir una celda es sumar los
+    offsets precalculados y mirar un byte, sin comprobar límites.
+    """
+    
+    def __init__(self, grid, start):
+        """
+        Inicializa el recorrido desde una celda libre.
+        
+        Args:
+            grid: Objeto Grid
+            start: Índice de la celda inicial
+        """
+        self.grid = grid
+        self.start = start
+        self.parents = array('i', [-1]) * grid.size
+        self.parents[start] = start
+        self.frontier = [start]
+        self.depth = 0
+        self.visited_count = 1
+    
+    def is_finished(self):
+        """Retorna True si ya no quedan celdas por expandir."""
+        return not self.frontier
+    
+    def step_level(self):
+        """
+        Expande la frontera actual un nivel.
+        
+        Returns:
+            Lista con los índices de las celdas descubiertas en este nivel
+        """
+        cells = self.grid.cells
+        parents = self.parents
+        offsets = self.grid.neighbor_offsets
+        next_frontier = []
+        append = next_frontier.append
+        for cell in self.frontier:
+            for offset in offsets:
+                neighbor = cell + offset
+                if not cells[neighbor] and parents[neighbor] < 0:
+                    parents[neighbor] = cell
+                    append(neighbor)
+        
+        self.frontier = next_frontier
+        if next_frontier:
+            self.depth += 1
+            self.visited_count += len(next_frontier)
+        return next_frontier
+    
+    def reached(self, cell):
+        """Retorna True si la celda ya fue descubierta."""
+        return self.parents[cell] >= 0
+    
+    def path_to(self, cell):
+        """
+        Reconstruye el camino desde el inicio hasta una celda descubierta.
+        
+        Returns:
+            Lista de índices de celda, o None si la celda no fue descubierta
+        """
+        if self.parents[cell] < 0:
+            return None
+        path = [cell]
+        while cell != self.start:
+            cell = self.parents[cell]
+            path.append(cell)
+        path.reverse()
+        return path
+
+
+def grid_bfs(grid, start, target=None):
+    """
+    Ejecuta un BFS completo sobre la grilla.
+    
+    Args:
+        grid: Objeto Grid
+        start: Índice de la celda inicial
+        target: Índice de la celda destino; el BFS se detiene al descubrirla
+        
+    Returns:
+        GridBFSResult con la distancia y el camino al destino
+    """
+    search = GridBFS(grid, start)
+    if target == start:
+        return GridBFSResult(0, [start], 1, 0)
+    
+    while not search.is_finished():
+        search.step_level()
+        if target is not None and search.reached(target):
+            path = search.path_to(target)
+            return GridBFSResult(len(path) - 1, path, search.visited_count, search.depth)
+    return GridBFSResult(None, None, search.visited_count, search.depth)
@@ -0,0 +1,235 @@
+"""BFS sobre grafos implícitos: los vecinos se generan al vuelo."""
+
+from collections import namedtuple
+
+from .bfs import (
+    STOP_EXHAUSTED, STOP_MAX_DEPTH, STOP_MAX_VISITED, STOP_TARGET,
+    _target_predicate, neighbor_function
+)
+from .level_stats import LevelTracker
+
+
+# Resultado de un BFS implícito: motivo de término, estado objetivo hallado
+# (o None), camino desde el origen hasta él (None si no se halló o si sus
+# padres no se guardaron), profundidad alcanzada, cantidad de estados
+# descubiertos y cantidad de estados en cada nivel.
+ImplicitBFSResult = namedtuple(
+    'ImplicitBFSResult',
+    ['stop_reason', 'found', 'path', 'depth', 'visited_count', 'level_sizes']
+)
+
+
+class VisitedBitset:
+    """
+    Conjunto de visitados de un bit por estado.
+    
+    Requiere una función que numere los estados en [0, size). Un millón de
+    estados ocupa 125 KB, frente a decenas de MB de un set de Python.
+    """
+    
+    def __init__(self, size, encode):
+        """
+        Inicializa el conjunto vacío.
+        
+        Args:
+            size: Cantidad total de estados posibles
+            encode: Función estado -> entero en [0, size)
+        """
+        self.bits = bytearray((size + 7) // 8)
+        self.encode = encode
+        self.count = 0
+    
+    def __len__(self):
+        """Retorna la cantidad de estados marcados."""
+        return self.count
+    
+    def __contains__(self, state):
+        """Retorna True si el estado ya fue marcado."""
+        index = self.encode(state)
+        return bool(self.bits[index >> 3] & (1 << (index & 7)))
+    
+    def add_new(self, state):
+        """
+        Marca un estado.
+        
+        Returns:
+            True si el estado no estaba marcado
+        """
+        index = self.encode(state)
+        byte = index >> 3
+        mask = 1 << (index & 7)
+        if self.bits[byte] & mask:
+            return False
+        self.bits[byte] |= mask
+        self.count += 1
+        return True
+
+
+class VisitedSet(set):
+    """Conjunto de visitados genérico para estados hashables sin numeración."""
+    
+    def add_new(self, state):
+        """
+        Marca un estado.
+        
+        Returns:
+            True si el estado no estaba marcado
+        """
+        if state in self:
+            return False
+        self.add(state)
+        return True
+
+
+def implicit_bfs(start, neighbors, target=None, max_depth=None, max_visited=None,
+                 encode=None, size=None, max_parents=None, on_level=None):
+    """
+    Ejecuta un BFS por niveles sin materializar el grafo.
+    
+    Solo se guardan la frontera actual, la siguiente, el conjunto de
+    visitados y (opcionalmente) los padres: no hay diccionario de
+    distancias, ya que la profundidad la da el nivel en curso.
+    
+    Args:
+        start: Estado inicial (cualquier valor hashable)
+        neighbors: Función estado -> iterable de estados vecinos, o un Graph
+        target: Estado objetivo o predicado estado -> bool
+        max_depth: Profundidad máxima a explorar
+        max_visited: Cantidad máxima de estados descubiertos
+        encode: Función estado -> entero en [0, size); si se indica, los
+            visitados se guardan en un VisitedBitset de un bit por estado
+        size: Cantidad de estados posibles (requerido con `encode`)
+        max_parents: Cantidad máxima de padres a guardar; al superarla se
+            dejan de registrar y el camino al objetivo puede quedar en None.
+            0 desactiva el registro de padres; None no pone límite
+        on_level: Función opcional que recibe un LevelStats por nivel
+        
+    Returns:
+        ImplicitBFSResult con el motivo de término y el objetivo hallado
+    """
+    get_neighbors = neighbor_function(neighbors)
+    is_target = _target_predicate(target)
+    if encode is not None:
+        if size is None:
+            raise ValueError("'size' es obligatorio cuando se indica 'encode'")
+        visited = VisitedBitset(size, encode)
+    else:
+        visited = VisitedSet()
+    visited.add_new(start)
+    
+    parents = {start: None} if max_parents != 0 else None
+    parents_complete = parents is not None
+    level_sizes = [1]
+    tracker = LevelTracker(on_level) if on_level is not None else None
+    
+    if is_target is not None and is_target(start):
+        if tracker is not None:
+            tracker.close(1, 0)
+        return ImplicitBFSResult(STOP_TARGET, start, [start], 0, 1, level_sizes)
+    if max_visited is not None and max_visited <= 1 and (
+        _has_undiscovered(get_neighbors, (), (start,), visited)
+    ):
+        if tracker is not None:
+            tracker.close(1, 0)
+        return ImplicitBFSResult(STOP_MAX_VISITED, None, None, 0, 1, level_sizes)
+    
+    mark_new = visited.add_new
+    frontier = [start]
+    depth = 0
+    while frontier:
+        if max_depth is not None and depth >= max_depth:
+            if tracker is not None:
+                tracker.close(len(frontier), 0)
+            # El límite solo cortó el recorrido si quedaron estados sin descubrir
+            stop_reason = (
+                STOP_MAX_DEPTH if _has_undiscovered(get_neighbors, (), frontier, visited)
+                else STOP_EXHAUSTED
+            )
+            return ImplicitBFSResult(
+                stop_reason, None, None, depth, len(visited), level_sizes
+            )
+        
+        depth += 1
+        next_frontier = []
+        for index, state in enumerate(frontier):
+            neighbors = get_neighbors(state)
+            if tracker is not None:
+                neighbors = tracker.examine(neighbors)
+            pending = iter(neighbors)
+            for neighbor in pending:
+                if not mark_new(neighbor):
+                    continue
+                next_frontier.append(neighbor)
+                if parents_complete:
+                    if max_parents is None or len(parents) < max_parents:
+                        parents[neighbor] = state
+                    else:
+                        parents_complete = False
+                
+                if is_target is not None and is_target(neighbor):
+                    level_sizes.append(len(next_frontier))
+                    if tracker is not None:
+                        tracker.skip_rest(neighbors, neighbor)
+                        tracker.close(len(frontier), len(next_frontier))
+                    path = _build_path(parents, neighbor) if parents_complete else None
+                    return ImplicitBFSResult(
+                        STOP_TARGET, neighbor, path, depth, len(visited), level_sizes
+                    )
+                if max_visited is not None and len(visited) >= max_visited and (
+                    _has_undiscovered(
+                        get_neighbors, pending, frontier[index + 1:], visited
+                    ) or (
+                        (max_depth is None or depth < max_depth)
+                        and _has_undiscovered(get_neighbors, (), next_frontier, visited)
+                    )
+                ):
+                    level_sizes.append(len(next_frontier))
+                    if tracker is not None:
+                        tracker.skip_rest(neighbors, neighbor)
+                        tracker.close(len(frontier), len(next_frontier))
+                    return ImplicitBFSResult(
+                        STOP_MAX_VISITED, None, None, depth, len(visited), level_sizes
+                    )
+        
+        if tracker is not None:
+            tracker.close(len(frontier), len(next_frontier))
+        if not next_frontier:
+            depth -= 1
+            break
+        level_sizes.append(len(next_frontier))
+        frontier = next_frontier
+    
+    return ImplicitBFSResult(STOP_EXHAUSTED, None, None, depth, len(visited), level_sizes)
+
+
+def _has_undiscovered(get_neighbors, pending, states, visited):
+    """
+    Indica si al detenerse quedaba algún estado por descubrir.
+    
+    Args:
+        get_neighbors: Función estado -> vecinos
+        pending: Iterador de vecinos del estado actual aún no examinados
+        states: Estados descubiertos que todavía no se expandieron
+        visited: Conjunto de visitados
+        
+    Returns:
+        True si algún vecino pendiente o de `states` no fue descubierto
+    """
+    for neighbor in pending:
+        if neighbor not in visited:
+            return True
+    for state in states:
+        for neighbor in get_neighbors(state):
+            if neighbor not in visited:
+                return True
+    return False
+
+
+def _build_path(parents, state):
+    """Reconstruye el camino desde el origen siguiendo los padres."""
+    path = []
+    while state is not None:
+        path.append(state)
+        state = parents[state]
+    path.reverse()
+    return path
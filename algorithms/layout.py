@@ -0,0 +1,466 @@
+"""Distribución automática de nodos por fuerzas con aproximación Barnes–Hut."""
+
+import threading
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: solo lo necesita la distribución automática
+    np = None
+
+
+def numpy_available():
+    """Retorna True si NumPy está instalado."""
+    return np is not None
+
+
+def _require_numpy():
+    """Lanza un error claro si NumPy no está instalado."""
+    if np is None:
+        raise RuntimeError("La distribución automática requiere NumPy (pip install numpy)")
+
+
+def _spread_bits(values):
+    """Intercala ceros entre los bits de enteros de 16 bits (para códigos Morton)."""
+    values = values.astype(np.uint32)
+    values = (values | (values << 8)) & 0x00FF00FF
+    values = (values | (values << 4)) & 0x0F0F0F0F
+    values = (values | (values << 2)) & 0x33333333
+    values = (values | (values << 1)) & 0x55555555
+    return values
+
+
+class _QuadTree:
+    """
+    Quadtree implícito construido con códigos Morton ordenados.
+    
+    Las celdas de cada nivel son los prefijos distintos de los códigos; como
+    los nodos están ordenados por código, cada celda es un tramo contiguo y
+    su masa y centro de masa se obtienen con `np.add.reduceat`. Los hijos de
+    una celda son también un tramo contiguo de celdas del nivel siguiente.
+    """
+    
+    def __init__(self, positions, depth):
+        """
+        Construye el árbol para un arreglo (n, 2) de posiciones.
+        
+        Args:
+            positions: Posiciones de los nodos
+            depth: Cantidad de niveles bajo la raíz (máximo 16)
+        """
+        low = positions.min(axis=0)
+        span = max(float((positions.max(axis=0) - low).max()), 1e-9)
+        scale = ((1 << depth) - 1) / span
+        cells = ((positions - low) * scale).astype(np.int64)
+        codes = _spread_bits(cells[:, 0]) | (_spread_bits(cells[:, 1]) << 1)
+        
+        self.order = np.argsort(codes, kind='stable')
+        # float32 e int32 reducen a la mitad el tráfico de memoria del recorrido
+        self.positions = positions[self.order].astype(np.float32)
+        codes = codes[self.order]
+        self.depth = depth
+        self.sizes = [span / (1 << level) for level in range(depth + 1)]
+        
+        # Por nivel: centro de masa y masa de cada celda, celda de cada nodo
+        # y tramo [inicio, fin) de sus hijos en el nivel siguiente
+        self.com = []
+        self.mass = []
+        self.node_cell = []
+        self._first_node = []
+        self.child_start = []
+        self.child_end = []
+        keys_by_level = []
+        for level in range(depth + 1):
+            keys = codes >> np.uint32(2 * (depth - level))
+            first = np.empty(len(keys), dtype=bool)
+            first[0] = True
+            np.not_equal(keys[1:], keys[:-1], out=first[1:])
+            starts = np.flatnonzero(first)
+            mass = np.diff(np.append(starts, len(keys))).astype(np.float32)
+            self.mass.append(mass)
+            self.com.append(np.add.reduceat(self.positions, starts, axis=0) / mass[:, None])
+            self.node_cell.append((np.cumsum(first) - 1).astype(np.int32))
+            self._first_node.append(starts.astype(np.int32))
+            keys_by_level.append(keys[starts])
+        
+        for level in range(depth):
+            parents_of_children = keys_by_level[level + 1] >> np.uint32(2)
+            self.child_start.append(np.searchsorted(
+                parents_of_children, keys_by_level[level], 'left'
+            ).astype(np.int32))
+            self.child_end.append(np.searchsorted(
+                parents_of_children, keys_by_level[level], 'right'
+            ).astype(np.int32))
+    
+    def repulsion(self, strength, theta, group_size=8):
+        """
+        Calcula la fuerza de repulsión k²/d sobre cada nodo (en orden Morton).
+        
+        El recorrido se hace en dos etapas: primero cada celda "grupo" (del
+        primer nivel con unos `group_size` nodos por celda) acepta las
+        celdas lejanas a todo el grupo y su fuerza se aplica a todos sus
+        nodos; luego cada nodo recorre solo las celdas cercanas a su grupo.
+        
+        Args:
+            strength: k² de Fruchterman–Reingold
+            theta: Criterio de apertura (tamaño de celda / distancia)
+            group_size: Nodos por celda buscados para el nivel de grupos
+            
+        Returns:
+            Arreglo (n, 2) con la fuerza sobre cada nodo ordenado
+        """
+        n = len(self.positions)
+        group_level = next(
+            (level for level in range(self.depth + 1)
+             if len(self.mass[level]) * group_size >= n),
+            self.depth
+        )
+        group_force, near_groups, near_cells = self._group_walk(
+            strength, theta, group_level
+        )
+        
+        # Cada par (grupo, celda cercana) se expande a (nodo del grupo, celda)
+        first = self._first_node[group_level]
+        counts = self.mass[group_level][near_groups].astype(np.int64)
+        offsets = np.repeat(np.cumsum(counts) - counts - first[near_groups], counts)
+        nodes = (np.arange(int(counts.sum())) - offsets).astype(np.int32)
+        cells = np.repeat(near_cells, counts)
+        
+        force = group_force[self.node_cell[group_level]]
+        force += self._node_walk(nodes, cells, group_level, strength, theta)
+        return force
+    
+    def _group_walk(self, strength, theta, group_level):
+        """
+        Recorre el árbol para las celdas grupo hasta su propio nivel.
+        
+        Returns:
+            Tupla (fuerza por grupo, grupos y celdas del nivel de grupos que
+            quedaron cercanos y deben recorrerse nodo por nodo)
+        """
+        group_com = self.com[group_level]
+        group_count = len(group_com)
+        reach = self.sizes[group_level]
+        first = self._first_node[group_level]
+        groups = np.arange(group_count, dtype=np.int32)
+        cells = np.zeros(group_count, dtype=np.int32)
+        hit_groups = []
+        hit_forces = []
+        
+        for level in range(group_level):
+            com = self.com[level][cells]
+            delta = group_com[groups] - com
+            dist2 = np.einsum('ij,ij->i', delta, delta)
+            # Un ancestro del grupo nunca se acepta (contendría a sus nodos)
+            ancestor = self.node_cell[level][first[groups]] == cells
+            accept = ~ancestor & ((self.sizes[level] + reach) ** 2 < theta * theta * dist2)
+            if accept.any():
+                scale = strength * self.mass[level][cells[accept]] / dist2[accept]
+                hit_groups.append(groups[accept])
+                hit_forces.append(delta[accept] * scale[:, None])
+            
+            keep = ~accept
+            groups, cells = self._open(groups[keep], cells[keep], level)
+        
+        force = np.zeros((group_count, 2), dtype=np.float32)
+        if hit_groups:
+            force = _accumulate(hit_groups, hit_forces, group_count)
+        return force, groups, cells
+    
+    def _node_walk(self, nodes, cells, start_level, strength, theta):
+        """Recorre el árbol por nodo desde `start_level` y retorna la fuerza."""
+        positions = self.positions
+        n = len(positions)
+        hit_nodes = []
+        hit_forces = []
+        
+        for level in range(start_level, self.depth + 1):
+            if not len(nodes):
+                break
+            com = self.com[level][cells]
+            mass = self.mass[level][cells]
+            
+            # Si la celda contiene al propio nodo, se lo excluye de ella
+            own = self.node_cell[level][nodes] == cells
+            alone = mass == 1
+            shared = own & ~alone
+            rest = mass[shared] - 1
+            com[shared] = (com[shared] * mass[shared][:, None] - positions[nodes[shared]]) / rest[:, None]
+            mass[shared] = rest
+            
+            delta = positions[nodes] - com
+            dist2 = np.einsum('ij,ij->i', delta, delta)
+            last = level == self.depth
+            # Se acepta la celda si está lejos, si es un único nodo ajeno o si
+            # solo contiene al propio nodo (no aporta fuerza)
+            if last:
+                accept = np.ones(len(nodes), dtype=bool)
+            else:
+                accept = (self.sizes[level] ** 2 < theta * theta * dist2) | alone
+            hit = accept & ~(own & alone)
+            if hit.any():
+                scale = strength * mass[hit] / np.maximum(dist2[hit], 1e-6)
+                hit_nodes.append(nodes[hit])
+                hit_forces.append(delta[hit] * scale[:, None])
+            
+            if last:
+                break
+            keep = ~accept
+            nodes, cells = self._open(nodes[keep], cells[keep], level)
+        
+        if not hit_nodes:
+            return np.zeros((n, 2), dtype=np.float32)
+        return _accumulate(hit_nodes, hit_forces, n)
+    
+    def _open(self, owners, cells, level):
+        """Reemplaza cada celda de `level` por sus hijas, repitiendo su dueño."""
+        start = self.child_start[level][cells]
+        counts = self.child_end[level][cells] - start
+        offsets = np.repeat(np.cumsum(counts) - counts - start, counts)
+        children = np.arange(int(counts.sum()), dtype=np.int32) - offsets
+        return np.repeat(owners, counts), children.astype(np.int32)
+
+
+def _accumulate(indices, forces, size):
+    """Suma las contribuciones de fuerza por índice."""
+    indices = np.concatenate(indices)
+    forces = np.concatenate(forces)
+    total = np.empty((size, 2), dtype=np.float32)
+    total[:, 0] = np.bincount(indices, forces[:, 0], minlength=size)
+    total[:, 1] = np.bincount(indices, forces[:, 1], minlength=size)
+    return total
+
+
+class ForceLayout:
+    """
+    Simulación de fuerzas de Fruchterman–Reingold vectorizada con NumPy.
+    
+    La repulsión entre todos los pares se aproxima con Barnes–Hut sobre un
+    quadtree (O(n log n) por iteración) y la atracción se calcula sobre las
+    aristas. La temperatura limita el desplazamiento por iteración y se
+    enfría geométricamente; `fit_schedule` acelera el enfriamiento para
+    converger dentro de una cantidad de iteraciones (o de un tiempo).
+    """
+    
+    def __init__(self, node_count, edges, width, height, positions=None,
+                 theta=1.2, depth=12, cooling=0.95, seed=0):
+        """
+        Inicializa la simulación.
+        
+        Args:
+            node_count: Cantidad de nodos (índices 0..n-1)
+            edges: Secuencia de pares (i, j) de índices de nodo
+            width: Ancho del área de dibujo
+            height: Alto del área de dibujo
+            positions: Posiciones iniciales (n, 2); por defecto, al azar
+            theta: Criterio de apertura de Barnes–Hut (mayor = más rápido)
+            depth: Niveles del quadtree
+            cooling: Factor de enfriamiento de la temperatura por iteración
+            seed: Semilla para las posiciones iniciales y para separar
+                nodos superpuestos
+        """
+        _require_numpy()
+        self.width = width
+        self.height = height
+        self.theta = theta
+        self.depth = depth
+        self.cooling = cooling
+        self.edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        self.k = (width * height / max(node_count, 1)) ** 0.5
+        self.temperature = max(width, height) / 10
+        self.iterations = 0
+        self._rng = np.random.default_rng(seed)
+        
+        if positions is None:
+            positions = self._rng.random((node_count, 2)) * (width, height)
+        self.positions = np.array(positions, dtype=np.float64).reshape(-1, 2)
+    
+    def fit_schedule(self, iterations, tolerance):
+        """
+        Acelera el enfriamiento para converger en `iterations` iteraciones más.
+        
+        Como el desplazamiento por iteración no supera la temperatura, la
+        simulación converge cuando esta baja de `tolerance`. El enfriamiento
+        nunca se hace más lento que el actual.
+        
+        Args:
+            iterations: Iteraciones restantes disponibles
+            tolerance: Desplazamiento máximo para considerar convergencia
+        """
+        if iterations < 1 or self.temperature <= tolerance:
+            return
+        self.cooling = min(self.cooling, (tolerance / self.temperature) ** (1 / iterations))
+    
+    def _separate_coincident(self):
+        """
+        Desplaza al azar los nodos con la misma posición que otro.
+        
+        Entre nodos superpuestos la repulsión no tiene dirección (la
+        diferencia de posiciones es cero), así que sin esto nunca se separan.
+        """
+        positions = self.positions
+        order = np.lexsort((positions[:, 1], positions[:, 0]))
+        ordered = positions[order]
+        repeated = np.flatnonzero(np.all(ordered[1:] == ordered[:-1], axis=1))
+        if len(repeated):
+            nodes = order[repeated + 1]
+            positions[nodes] += self._rng.uniform(-0.05, 0.05, (len(nodes), 2)) * self.k
+            np.clip(positions, (0, 0), (self.width, self.height), out=positions)
+    
+    def step(self):
+        """
+        Ejecuta una iteración de la simulación.
+        
+        Returns:
+            Desplazamiento máximo de un nodo en esta iteración
+        """
+        positions = self.positions
+        n = len(positions)
+        if n < 2:
+            return 0.0
+        
+        self._separate_coincident()
+        tree = _QuadTree(positions, self.depth)
+        displacement = np.empty_like(positions)
+        displacement[tree.order] = tree.repulsion(self.k * self.k, self.theta)
+        
+        if len(self.edges):
+            i, j = self.edges[:, 0], self.edges[:, 1]
+            delta = positions[i] - positions[j]
+            dist = np.sqrt(np.einsum('ij,ij->i', delta, delta)) + 1e-9
+            pull = delta * (dist / self.k)[:, None]
+            for axis in (0, 1):
+                displacement[:, axis] -= np.bincount(i, pull[:, axis], minlength=n)
+                displacement[:, axis] += np.bincount(j, pull[:, axis], minlength=n)
+        
+        length = np.sqrt(np.einsum('ij,ij->i', displacement, displacement)) + 1e-9
+        moved = np.minimum(length, self.temperature)
+        positions += displacement * (moved / length)[:, None]
+        np.clip(positions, (0, 0), (self.width, self.height), out=positions)
+        
+        self.temperature *= self.cooling
+        self.iterations += 1
+        return float(moved.max())
+    
+    def run(self, max_iterations=300, time_budget=None, tolerance=0.5):
+        """
+        Itera hasta converger, agotar las iteraciones o el tiempo.
+        
+        El enfriamiento se ajusta para converger antes de agotar las
+        iteraciones o el tiempo (ver fit_schedule).
+        
+        Args:
+            max_iterations: Cantidad máxima de iteraciones
+            time_budget: Segundos máximos (None = sin límite)
+            tolerance: Desplazamiento máximo por debajo del cual se detiene
+            
+        Returns:
+            Posiciones finales (n, 2)
+        """
+        start = time.perf_counter()
+        self.fit_schedule(max_iterations, tolerance)
+        for done in range(1, max_iterations + 1):
+            if self.step() < tolerance:
+                break
+            if time_budget is not None and not _fit_to_budget(
+                self, start, time_budget, done, max_iterations, tolerance
+            ):
+                break
+        return self.positions
+
+
+def _fit_to_budget(layout, start, time_budget, done, max_iterations, tolerance):
+    """
+    Ajusta el enfriamiento a las iteraciones que caben en el tiempo restante.
+    
+    La estimación usa el tiempo medio de las iteraciones hechas, así que se
+    corrige sola si las iteraciones se vuelven más caras o más baratas; se
+    deja un margen para que la convergencia no coincida con el límite.
+    
+    Returns:
+        False si el tiempo ya se agotó
+    """
+    elapsed = time.perf_counter() - start
+    if elapsed >= time_budget:
+        return False
+    remaining = 0.9 * (time_budget - elapsed) * done / elapsed - 1
+    layout.fit_schedule(int(min(remaining, max_iterations - done)), tolerance)
+    return True
+
+
+class LayoutWorker:
+    """
+    Ejecuta una ForceLayout en un hilo y publica instantáneas de posiciones.
+    
+    El hilo de Tk consulta `poll` periódicamente: recibe la última
+    instantánea (si hubo una nueva) sin esperar a que termine la simulación.
+    El enfriamiento se ajusta al tiempo disponible, así que incluso con
+    decenas de miles de nodos la simulación converge dentro de `time_budget`.
+    """
+    
+    def __init__(self, layout, max_iterations=300, time_budget=10.0,
+                 tolerance=0.5, snapshot_interval=0.1):
+        """
+        Inicializa el trabajador (no arranca el hilo).
+        
+        Args:
+            layout: Objeto ForceLayout
+            max_iterations: Cantidad máxima de iteraciones
+            time_budget: Segundos máximos de simulación
+            tolerance: Desplazamiento máximo para considerar convergencia
+            snapshot_interval: Segundos mínimos entre instantáneas publicadas
+        """
+        self.layout = layout
+        self.max_iterations = max_iterations
+        self.time_budget = time_budget
+        self.tolerance = tolerance
+        self.snapshot_interval = snapshot_interval
+        self.finished = False
+        
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+    
+    def start(self):
+        """Arranca el hilo de simulación."""
+        self._thread.start()
+    
+    def cancel(self):
+        """Detiene la simulación en cuanto termine la iteración en curso."""
+        self._cancelled.set()
+    
+    def _publish(self):
+        """Publica una copia de las posiciones actuales."""
+        with self._lock:
+            self._snapshot = self.layout.positions.copy()
+    
+    def _run(self):
+        """Cuerpo del hilo: itera y publica instantáneas periódicas."""
+        layout = self.layout
+        start = last_publish = time.perf_counter()
+        layout.fit_schedule(self.max_iterations, self.tolerance)
+        for done in range(1, self.max_iterations + 1):
+            if self._cancelled.is_set():
+                break
+            if layout.step() < self.tolerance or not _fit_to_budget(
+                layout, start, self.time_budget, done, self.max_iterations, self.tolerance
+            ):
+                break
+            now = time.perf_counter()
+            if now - last_publish >= self.snapshot_interval:
+                self._publish()
+                last_publish = now
+        self._publish()
+        self.finished = True
+    
+    def poll(self):
+        """
+        Retorna la última instantánea publicada, o None si no hay una nueva.
+        
+        Returns:
+            Arreglo (n, 2) de posiciones o None
+        """
+        with self._lock:
+            snapshot, self._snapshot = self._snapshot, None
+        return snapshot
@@ -0,0 +1,208 @@
+"""Estadísticas por nivel emitidas por los motores BFS mientras recorren."""
+
+import time
+from bisect import bisect_right
+from collections import namedtuple
+
+
+# Resumen de un nivel del BFS:
+# - level: distancia desde el origen (en un bosque, desde la raíz del árbol)
+# - frontier: nodos del nivel
+# - discovered: nodos nuevos descubiertos desde el nivel (la próxima frontera)
+# - edges: aristas examinadas al expandir el nivel
+# - duplicates: aristas que llevaron a un nodo ya descubierto (incluye la
+#   arista de regreso al padre en grafos no dirigidos)
+# - seconds: tiempo de reloj del nivel; en los generadores de pasos incluye
+#   lo que el consumidor tarda entre paso y paso
+LevelStats = namedtuple(
+    'LevelStats', ['level', 'frontier', 'discovered', 'edges', 'duplicates', 'seconds']
+)
+
+
+class LevelTracker:
+    """
+    Acumula los contadores del nivel en curso y emite un LevelStats al cerrarlo.
+    
+    Los motores solo lo crean si se pidió la estadística (`on_level`), así
+    que sin ella el recorrido no paga nada. Los motores por niveles llaman
+    a `close` al terminar cada frontera; los que sacan nodos de una cola de
+    a uno llaman a `visit` con la cantidad de nodos descubiertos y el
+    rastreador detecta solo dónde termina cada nivel.
+    """
+    
+    __slots__ = ('on_level', 'level', 'edges', 'clock', '_start', '_end', '_processed')
+    
+    def __init__(self, on_level):
+        """
+        Inicializa el rastreador en el nivel 0 (solo el origen descubierto).
+        
+        Args:
+            on_level: Función que recibe cada LevelStats
+        """
+        self.on_level = on_level
+        self.level = 0
+        self.edges = 0
+        self.clock = time.perf_counter()
+        # Límites del nivel en curso en el orden de descubrimiento
+        self._start = 0
+        self._end = 1
+        self._processed = 0
+    
+    def examine(self, neighbors):
+        """
+        Cuenta los vecinos que se van a examinar.
+        
+        Returns:
+            Los mismos vecinos como lista (un generador se materializa)
+        """
+        if not isinstance(neighbors, list):
+            neighbors = list(neighbors)
+        self.edges += len(neighbors)
+        return neighbors
+    
+    def skip_rest(self, neighbors, stopped_at):
+        """
+        Descuenta los vecinos que no se examinaron porque el recorrido se detuvo.
+        
+        Args:
+            neighbors: Lista retornada por `examine`
+            stopped_at: Vecino en el que se detuvo el recorrido
+        """
+        self.edges -= len(neighbors) - neighbors.index(stopped_at) - 1
+    
+    def close(self, frontier, discovered):
+        """
+        Emite las estadísticas del nivel en curso y pasa al siguiente.
+        
+        Args:
+            frontier: Nodos del nivel
+            discovered: Nodos nuevos descubiertos desde el nivel
+        """
+        now = time.perf_counter()
+        edges = self.edges
+        self.on_level(LevelStats(
+            self.level, frontier, discovered, edges, edges - discovered, now - self.clock
+        ))
+        self.level += 1
+        self.edges = 0
+        self.clock = now
+    
+    def visit(self, discovered):
+        """
+        Registra que se saca un nodo de la cola.
+        
+        Args:
+            discovered: Nodos descubiertos hasta ahora (incluido el origen)
+        """
+        if self._processed == self._end:
+            self.close(self._end - self._start, discovered - self._end)
+            self._start, self._end = self._end, discovered
+        self._processed += 1
+    
+    def finish(self, discovered, neighbors=None, stopped_at=None):
+        """
+        Cierra el último nivel (completo o interrumpido por un límite).
+        
+        Args:
+            discovered: Nodos descubiertos en total
+            neighbors: Vecinos que se estaban examinando al detenerse
+            stopped_at: Vecino en el que se detuvo el recorrido; los
+                siguientes no se llegaron a examinar
+        """
+        if stopped_at is not None:
+            self.skip_rest(neighbors, stopped_at)
+        self.close(self._end - self._start, discovered - self._end)
+
+
+class LevelStatsRecorder:
+    """
+    Guarda las estadísticas que emite un motor y las consulta por paso.
+    
+    Es invocable, así que se pasa directamente como `on_level`. El
+    StepProducer agrega además el índice del primer paso posterior a cada
+    nivel, con lo que la interfaz puede ubicar en O(log niveles) el nivel
+    del paso que se está animando. Se puede leer desde otro hilo mientras
+    el motor agrega niveles.
+    """
+    
+    def __init__(self):
+        """Inicializa el registro vacío."""
+        self.levels = []
+        self.end_steps = []  # Pasos emitidos al cerrar cada nivel (si se conocen)
+    
+    def __len__(self):
+        """Retorna la cantidad de niveles registrados."""
+        return len(self.levels)
+    
+    def __call__(self, stats, end_step=None):
+        """
+        Agrega las estadísticas de un nivel.
+        
+        Args:
+            stats: LevelStats del nivel
+            end_step: Índice del primer paso de la traza posterior al nivel
+        """
+        # El nivel se agrega antes que su límite: un lector en otro hilo
+        # nunca ve un límite sin su nivel
+        self.levels.append(stats)
+        if end_step is not None:
+            self.end_steps.append(end_step)
+    
+    def progress_at(self, position):
+        """
+        Retorna el nivel y la frontera del paso que se está mostrando.
+        
+        Args:
+            position: Cantidad de pasos aplicados de la traza
+            
+        Returns:
+            Tupla (nivel, tamaño de la frontera); si el nivel aún no se
+            cerró, se deduce del anterior
+        """
+        count = len(self.end_steps)
+        index = bisect_right(self.end_steps, max(position - 1, 0), 0, count)
+        if index < count:
+            stats = self.levels[index]
+            return stats.level, stats.frontier
+        if not count or not self.levels[count - 1].discovered:
+            # Sin niveles cerrados, o el árbol anterior terminó (bosque BFS)
+            return 0, 1
+        last = self.levels[count - 1]
+        return last.level + 1, last.discovered
+    
+    def totals(self):
+        """
+        Retorna los totales del recorrido.
+        
+        Returns:
+            Diccionario con niveles, aristas examinadas, repetidos y segundos
+        """
+        levels = self.levels
+        return {
+            'levels': len(levels),
+            'edges': sum(stats.edges for stats in levels),
+            'duplicates': sum(stats.duplicates for stats in levels),
+            'seconds': sum(stats.seconds for stats in levels),
+        }
+    
+    def histogram(self, field='frontier', width=40):
+        """
+        Dibuja una tabla de texto con una barra por nivel.
+        
+        Args:
+            field: Campo de LevelStats que determina el largo de las barras
+            width: Largo de la barra más larga, en caracteres
+            
+        Returns:
+            Texto con una línea por nivel
+        """
+        levels = self.levels
+        peak = max((getattr(stats, field) for stats in levels), default=0) or 1
+        lines = [f"{'nivel':>5} {'frontera':>9} {'aristas':>9} {'repetidos':>9} {'ms':>8}"]
+        for stats in levels:
+            bar = '█' * round(getattr(stats, field) * width / peak)
+            lines.append(
+                f"{stats.level:>5} {stats.frontier:>9} {stats.edges:>9} "
+                f"{stats.duplicates:>9} {stats.seconds * 1000:>8.2f} {bar}"
+            )
+        return '\n'.join(lines)
@@ -0,0 +1,288 @@
+"""BFS paralelo por niveles sobre un grafo CSR en memoria compartida."""
+
+import multiprocessing
+import os
+from array import array
+from multiprocessing import shared_memory
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él los reclamos se fusionan en Python
+    np = None
+
+from models.csr import CSRGraph
+from .bfs import BFSResult
+from .level_stats import LevelTracker
+
+
+# Vistas de la memoria compartida dentro de cada proceso trabajador
+_worker = {}
+
+
+def _attach(name):
+    """Adjunta un bloque de memoria compartida creado por el proceso principal."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13: el bloque lo libera el proceso principal
+        return shared_memory.SharedMemory(name=name)
+
+
+def _init_worker(names, node_count, edge_count):
+    """Inicializador del pool: abre los bloques compartidos una sola vez."""
+    blocks = [_attach(name) for name in names]
+    _worker['blocks'] = blocks
+    _worker['offsets'] = blocks[0].buf.cast('q')[:node_count + 1]
+    _worker['targets'] = blocks[1].buf.cast('q')[:edge_count]
+    _worker['dist'] = blocks[2].buf.cast('i')[:node_count]
+    _worker['frontier'] = blocks[3].buf.cast('q')[:node_count]
+
+
+def _expand(offsets, targets, dist, frontier, lo, hi, count_edges=False):
+    """
+    Expande frontier[lo:hi] y propone reclamos sobre nodos no visitados.
+    
+    Solo lee `dist`; los reclamos se devuelven al proceso principal, que
+    los resuelve en orden de frontera al cerrar el nivel. Cada nodo se
+    reclama una sola vez por bloque, con el primer padre que lo vio.
+    
+    Returns:
+        Tupla (bytes de un array('q') con los nodos reclamados, bytes de un
+        array('q') con sus padres, aristas examinadas o 0 si no se cuentan)
+    """
+    seen = set()
+    claimed = array('q')
+    claimers = array('q')
+    for k in range(lo, hi):
+        u = frontier[k]
+        for v in targets[offsets[u]:offsets[u + 1]]:
+            if dist[v] < 0 and v not in seen:
+                seen.add(v)
+                claimed.append(v)
+                claimers.append(u)
+    edges = 0
+    if count_edges:
+        for k in range(lo, hi):
+            u = frontier[k]
+            edges += offsets[u + 1] - offsets[u]
+    return claimed.tobytes(), claimers.tobytes(), edges
+
+
+def _expand_range(task):
+    """Tarea del pool: expande el rango (lo, hi) de la frontera compartida."""
+    lo, hi, count_edges = task
+    return _expand(
+        _worker['offsets'], _worker['targets'], _worker['dist'], _worker['frontier'],
+        lo, hi, count_edges
+    )
+
+
+def _merge_claims(chunks, dist, level):
+    """
+    Acepta el primer reclamo de cada nodo, en orden de frontera.
+    
+    Los reclamos de un nivel solo proponen nodos sin visitar al empezarlo y
+    cada bloque ya viene sin repetidos, así que basta con recorrer los
+    bloques en orden y quedarse con los nodos que siguen sin distancia. Con
+    NumPy cada bloque se filtra y se marca con una sola operación
+    vectorizada (sin índices repetidos dentro del bloque, la asignación es
+    determinista); sin él, con una pasada por reclamo.
+    
+    Args:
+        chunks: Reclamos por bloque, como los retorna _expand
+        dist: Vista de las distancias compartidas (se marca `level` en los
+            nodos aceptados)
+        level: Distancia de los nodos descubiertos en este nivel
+        
+    Returns:
+        Tupla (nodos aceptados, padre de cada uno), como listas de índices
+    """
+    if np is not None:
+        distances = np.frombuffer(dist, dtype=np.int32)
+        nodes = []
+        parents = []
+        for chunk_claimed, chunk_claimers, _ in chunks:
+            claimed = np.frombuffer(chunk_claimed, dtype=np.int64)
+            fresh = distances[claimed] < 0
+            claimed = claimed[fresh]
+            distances[claimed] = level
+            nodes.append(claimed)
+            parents.append(np.frombuffer(chunk_claimers, dtype=np.int64)[fresh])
+        return np.concatenate(nodes).tolist(), np.concatenate(parents).tolist()
+    
+    nodes = []
+    parents = []
+    for chunk_claimed, chunk_claimers, _ in chunks:
+        claimed = array('q')
+        claimed.frombytes(chunk_claimed)
+        claimers = array('q')
+        claimers.frombytes(chunk_claimers)
+        for v, u in zip(claimed, claimers):
+            if dist[v] < 0:
+                dist[v] = level
+                nodes.append(v)
+                parents.append(u)
+    return nodes, parents
+
+
+class ParallelBFS:
+    """
+    Motor BFS sincronizado por niveles que reparte la frontera entre procesos.
+    
+    El grafo CSR, el arreglo de distancias (que hace de visitados) y la
+    frontera viven en `multiprocessing.shared_memory`. En cada nivel los
+    trabajadores expanden rangos contiguos de la frontera y proponen
+    reclamos; el proceso principal los acepta en orden de frontera, por lo
+    que el orden de visita, las distancias y los padres son idénticos a los
+    de bfs_search. Las fronteras pequeñas se expanden sin usar el pool.
+    
+    Cada bloque llega sin reclamos repetidos y la fusión entre bloques es
+    vectorizada cuando NumPy está disponible (ver _merge_claims).
+    """
+    
+    def __init__(self, graph, workers=None, min_parallel_frontier=2048):
+        """
+        Inicializa el motor y copia el grafo a memoria compartida.
+        
+        Args:
+            graph: Objeto Graph o CSRGraph
+            workers: Cantidad de procesos (por defecto, núcleos disponibles)
+            min_parallel_frontier: Tamaño mínimo de frontera para paralelizar
+        """
+        self.csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+        self.workers = workers or os.cpu_count() or 1
+        self.min_parallel_frontier = min_parallel_frontier
+        self._pool = None
+        
+        n = self.csr.node_count
+        m = len(self.csr.targets)
+        self._blocks = [
+            shared_memory.SharedMemory(create=True, size=max(8, (n + 1) * 8)),
+            shared_memory.SharedMemory(create=True, size=max(8, m * 8)),
+            shared_memory.SharedMemory(create=True, size=max(8, n * 4)),
+            shared_memory.SharedMemory(create=True, size=max(8, n * 8)),
+        ]
+        self._offsets = self._blocks[0].buf.cast('q')[:n + 1]
+        self._targets = self._blocks[1].buf.cast('q')[:m]
+        self._dist = self._blocks[2].buf.cast('i')[:n]
+        self._frontier = self._blocks[3].buf.cast('q')[:n]
+        self._offsets[:] = self.csr.offsets
+        self._targets[:] = self.csr.targets
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def _get_pool(self):
+        """Crea el pool de procesos la primera vez que se necesita."""
+        if self._pool is None:
+            self._pool = multiprocessing.get_context().Pool(
+                self.workers,
+                initializer=_init_worker,
+                initargs=(
+                    [block.name for block in self._blocks],
+                    self.csr.node_count,
+                    len(self.csr.targets)
+                )
+            )
+        return self._pool
+    
+    def _expand_level(self, frontier_size, count_edges):
+        """Expande la frontera actual y retorna los reclamos por bloque."""
+        if frontier_size < self.min_parallel_frontier or self.workers < 2:
+            return [_expand(
+                self._offsets, self._targets, self._dist, self._frontier,
+                0, frontier_size, count_edges
+            )]
+        
+        parts = self.workers * 4
+        step = -(-frontier_size // parts)
+        tasks = [
+            (lo, min(lo + step, frontier_size), count_edges)
+            for lo in range(0, frontier_size, step)
+        ]
+        return self._get_pool().map(_expand_range, tasks)
+    
+    def search(self, start_node, on_level=None):
+        """
+        Ejecuta BFS desde un nodo.
+        
+        Args:
+            start_node: ID del nodo inicial
+            on_level: Función opcional que recibe un LevelStats por nivel;
+                solo entonces los procesos cuentan las aristas examinadas
+                
+        Returns:
+            BFSResult con el orden de visita, distancias y padres
+        """
+        ids = self.csr.ids
+        dist = self._dist
+        frontier = self._frontier
+        dist.cast('B')[:] = b'\xff' * (len(dist) * 4)
+        
+        source = self.csr.index[start_node]
+        dist[source] = 0
+        frontier[0] = source
+        frontier_size = 1
+        order = [source]
+        parent_order = []  # Padre de cada nodo de order[1:]
+        tracker = LevelTracker(on_level) if on_level is not None else None
+        count_edges = tracker is not None
+        
+        level = 0
+        while frontier_size:
+            level += 1
+            chunks = self._expand_level(frontier_size, count_edges)
+            next_frontier, next_parents = _merge_claims(chunks, dist, level)
+            
+            if tracker is not None:
+                tracker.edges = sum(chunk[2] for chunk in chunks)
+                tracker.close(frontier_size, len(next_frontier))
+            frontier_size = len(next_frontier)
+            if frontier_size:
+                frontier[:frontier_size] = array('q', next_frontier)
+            order.extend(next_frontier)
+            parent_order.extend(next_parents)
+        
+        parents = {start_node: None}
+        parents.update(zip(
+            [ids[i] for i in order[1:]], [ids[i] for i in parent_order]
+        ))
+        return BFSResult(
+            [ids[i] for i in order],
+            {ids[i]: dist[i] for i in order},
+            parents
+        )
+    
+    def close(self):
+        """Termina el pool y libera la memoria compartida."""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+        
+        if self._blocks:
+            for view in (self._offsets, self._targets, self._dist, self._frontier):
+                view.release()
+            for block in self._blocks:
+                block.close()
+                block.unlink()
+            self._blocks = []
+
+
+def parallel_bfs(graph, start_node, workers=None):
+    """
+    Ejecuta un BFS paralelo de un solo uso.
+    
+    Args:
+        graph: Objeto Graph o CSRGraph
+        start_node: ID del nodo inicial
+        workers: Cantidad de procesos (por defecto, núcleos disponibles)
+        
+    Returns:
+        BFSResult idéntico al de bfs_search
+    """
+    with ParallelBFS(graph, workers=workers) as engine:
+        return engine.search(start_node)
@@ -0,0 +1,149 @@
+"""Generación de pasos BFS en un hilo de fondo."""
+
+import queue
+import threading
+import time
+
+from profiling import PROFILER
+
+from .bfs import iter_bfs_forest_steps, iter_bfs_steps
+
+
+class StepProducer:
+    """
+    Genera los pasos de un BFS en un hilo y los entrega por bloques.
+    
+    Los bloques se colocan en una `queue.Queue` acotada; el consumidor (el
+    hilo de Tk) la vacía con `poll`. Al terminar se coloca `None` como
+    marca de fin. Pausar o cancelar detiene también la generación.
+    
+    Los pasos no llevan copia de la cola (su último elemento es None):
+    BFSTimeline la reconstruye a partir de los deltas y sus fotos.
+    """
+    
+    def __init__(self, graph, start_node, chunk_size=512, max_chunks=64, forest=False,
+                 max_depth=None, target=None, max_visited=None, level_stats=None):
+        """
+        Inicializa el productor (no arranca el hilo).
+        
+        Args:
+            graph: Graph o GraphSnapshot a recorrer; con una instantánea
+                (Graph.snapshot) el grafo se puede seguir editando mientras
+                el hilo genera los pasos
+            start_node: ID del nodo inicial
+            chunk_size: Cantidad de pasos por bloque
+            max_chunks: Capacidad máxima de la cola de bloques
+            forest: Si es True, recorre todas las componentes (bosque BFS)
+            max_depth, target, max_visited: Límites del BFS (ver
+                iter_bfs_steps); se ignoran en modo bosque
+            level_stats: LevelStatsRecorder opcional que recibe las
+                estadísticas de cada nivel junto con el índice del primer
+                paso posterior al nivel
+        """
+        self.graph = graph
+        self.start_node = start_node
+        self.chunk_size = chunk_size
+        self.forest = forest
+        self.limits = {'max_depth': max_depth, 'target': target, 'max_visited': max_visited}
+        self.level_stats = level_stats
+        self.chunks = queue.Queue(maxsize=max_chunks)
+        self.finished = False
+        
+        self._cancelled = threading.Event()
+        self._running = threading.Event()
+        self._running.set()
+        self._thread = threading.Thread(target=self._produce, daemon=True)
+    
+    def start(self):
+        """Arranca el hilo generador."""
+        self._thread.start()
+    
+    def pause(self):
+        """Detiene temporalmente la generación."""
+        self._running.clear()
+    
+    def resume(self):
+        """Reanuda la generación."""
+        self._running.set()
+    
+    def cancel(self):
+        """Cancela la generación; el hilo termina en cuanto lo note."""
+        self._cancelled.set()
+        self._running.set()
+    
+    @property
+    def cancelled(self):
+        """Retorna True si la generación fue cancelada."""
+        return self._cancelled.is_set()
+    
+    def _put(self, item):
+        """Coloca un bloque en la cola esperando espacio; False si se canceló."""
+        while not self._cancelled.is_set():
+            try:
+                self.chunks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def _produce(self):
+        """Cuerpo del hilo: recorre el grafo y publica los pasos por bloques."""
+        chunk = []
+        sent = 0  # Pasos ya publicados en bloques anteriores
+        recorder = self.level_stats
+        if recorder is None:
+            on_level = None
+        else:
+            # El nivel se cierra justo antes de generar el paso siguiente,
+            # así que los pasos emitidos hasta ahora son los del nivel
+            def on_level(stats):
+                recorder(stats, sent + len(chunk))
+        
+        if self.forest:
+            steps = iter_bfs_forest_steps(
+                self.graph, self.start_node, with_queues=False, on_level=on_level
+            )
+        else:
+            steps = iter_bfs_steps(
+                self.graph, self.start_node, with_queues=False, on_level=on_level, **self.limits
+            )
+        chunk_start = time.perf_counter()
+        for step in steps:
+            chunk.append(step)
+            if len(chunk) >= self.chunk_size:
+                if PROFILER.enabled:
+                    PROFILER.add_time('trace.generate', time.perf_counter() - chunk_start)
+                self._running.wait()
+                if not self._put(chunk):
+                    return
+                sent += len(chunk)
+                chunk = []
+                chunk_start = time.perf_counter()
+        
+        if PROFILER.enabled:
+            PROFILER.add_time('trace.generate', time.perf_counter() - chunk_start)
+        if chunk and not self._put(chunk):
+            return
+        self._put(None)
+    
+    def poll(self, max_chunks=8):
+        """
+        Extrae sin bloquear los bloques disponibles.
+        
+        Args:
+            max_chunks: Máximo de bloques a extraer en esta llamada
+            
+        Returns:
+            Lista de pasos extraídos (puede estar vacía)
+        """
+        steps = []
+        for _ in range(max_chunks):
+            try:
+                chunk = self.chunks.get_nowait()
+            except queue.Empty:
+                break
+            if chunk is None:
+                self.finished = True
+                break
+            steps.extend(chunk)
+        return steps
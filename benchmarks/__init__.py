@@ -0,0 +1 @@
+"""Benchmarks de operaciones del grafo, motores BFS y renderizado."""
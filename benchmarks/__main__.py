@@ -0,0 +1,78 @@
+"""
+Línea de comandos del benchmark.
+
+Uso:
+    python -m benchmarks run --sizes 1000 5000 --output resultados.json
+    python -m benchmarks compare base.json resultados.json --threshold 0.15
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+from .suite import CASES, compare_results, run_suite
+
+
+def _run(args):
+    """Ejecuta el benchmark y guarda el JSON."""
+    def progress(key, metrics):
+        print(f"{key:32s} {metrics['seconds'] * 1000:10.2f} ms")
+    
+    results = run_suite(args.sizes, repeat=args.repeat, cases=args.cases, progress=progress)
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Resultados guardados en {args.output}")
+    return 0
+
+
+def _compare(args):
+    """Compara dos archivos de resultados; retorna 1 si hay regresiones."""
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)['results']
+    with open(args.current, encoding='utf-8') as f:
+        current = json.load(f)['results']
+    
+    regressions = 0
+    for key, metric, old, new, ratio, regressed in compare_results(baseline, current, args.threshold):
+        mark = 'REGRESIÓN' if regressed else 'ok'
+        print(f"{key:32s} {metric:10s} {old:14.6g} -> {new:14.6g}  x{ratio:5.2f}  {mark}")
+        regressions += regressed
+    
+    print(f"{regressions} regresión(es) con umbral de {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+def main(argv=None):
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    run_parser = subparsers.add_parser('run', help='ejecuta el benchmark')
+    run_parser.add_argument('--sizes', type=int, nargs='+', default=[500, 2000, 5000])
+    run_parser.add_argument('--repeat', type=int, default=3)
+    run_parser.add_argument('--cases', nargs='+', choices=sorted(CASES))
+    run_parser.add_argument('--output', default='bench_results.json')
+    run_parser.set_defaults(func=_run)
+    
+    compare_parser = subparsers.add_parser('compare', help='compara contra una base')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.15)
+    compare_parser.set_defaults(func=_compare)
+    
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""
+Arnés diferencial: ejecuta todos los motores BFS registrados sobre grafos
+aleatorios y verifica que coincidan con el motor de referencia.
+
+Uso:
+    python -m benchmarks.equivalence --cases 100 --max-nodes 200 --seed 0
+    python -m benchmarks.equivalence --output tiempos.json
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+
+from algorithms.engines import ENGINES, REFERENCE_ENGINE
+from .generators import GRAPH_FAMILIES
+
+
+def _events(steps):
+    """Quita de cada paso la copia de la cola, que no todos los motores generan."""
+    return [step[:-1] for step in steps]
+
+
+def check_case(graph, start_node, engines=None):
+    """
+    Ejecuta los motores sobre un grafo y compara contra la referencia.
+    
+    Args:
+        graph: Objeto Graph
+        start_node: ID del nodo inicial
+        engines: Nombres de motores a comparar (por defecto todos)
+        
+    Returns:
+        Tupla (timings, mismatches): segundos por motor y lista de
+        (motor, campo) que no coinciden con la referencia
+    """
+    timings = {}
+    outputs = {}
+    for name in engines or ENGINES:
+        start = time.perf_counter()
+        outputs[name] = ENGINES[name](graph, start_node)
+        timings[name] = time.perf_counter() - start
+    
+    reference, reference_steps = outputs[REFERENCE_ENGINE]
+    reference_events = _events(reference_steps)
+    mismatches = []
+    for name, (result, steps) in outputs.items():
+        for field in ('order', 'distances', 'parents'):
+            if getattr(result, field) != getattr(reference, field):
+                mismatches.append((name, field))
+        if steps is not None and _events(steps) != reference_events:
+            mismatches.append((name, 'steps'))
+    return timings, mismatches
+
+
+def run(cases, max_nodes, seed, engines=None):
+    """
+    Genera casos aleatorios de todas las familias y los verifica.
+    
+    Returns:
+        Tupla (registros por caso con los tiempos de cada motor, lista de fallas)
+    """
+    rng = random.Random(seed)
+    records = []
+    failures = []
+    families = sorted(GRAPH_FAMILIES)
+    for case in range(cases):
+        family = families[case % len(families)]
+        node_count = rng.randint(1, max_nodes)
+        if family == 'dense':
+            node_count = min(node_count, 80)
+        graph = GRAPH_FAMILIES[family](node_count, rng)
+        start_node = rng.choice(sorted(graph.nodes))
+        
+        timings, mismatches = check_case(graph, start_node, engines)
+        records.append({
+            'case': case,
+            'family': family,
+            'nodes': len(graph.nodes),
+            'edges': len(graph.edges),
+            'seconds': timings,
+        })
+        for name, field in mismatches:
+            failures.append((case, family, node_count, start_node, name, field))
+    return records, failures
+
+
+def main(argv=None):
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.equivalence')
+    parser.add_argument('--cases', type=int, default=60)
+    parser.add_argument('--max-nodes', type=int, default=300)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--engines', nargs='+', choices=sorted(ENGINES))
+    parser.add_argument('--output', help='archivo JSON con los tiempos por caso')
+    args = parser.parse_args(argv)
+    
+    engines = args.engines
+    if engines and REFERENCE_ENGINE not in engines:
+        engines = [REFERENCE_ENGINE] + engines
+    records, failures = run(args.cases, args.max_nodes, args.seed, engines)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(records, f, indent=2)
+    
+    totals = {}
+    for record in records:
+        for name, seconds in record['seconds'].items():
+            totals[name] = totals.get(name, 0.0) + seconds
+    
+    print(f"{'motor':16s} {'tiempo total':>14s}")
+    for name, seconds in sorted(totals.items(), key=lambda item: item[1]):
+        print(f"{name:16s} {seconds * 1000:11.2f} ms")
+    
+    for case, family, node_count, start_node, name, field in failures:
+        print(f"FALLA caso {case} ({family}, n={node_count}, inicio={start_node}): "
+              f"'{name}' difiere en {field}")
+    print(f"{args.cases} casos, {len(failures)} diferencia(s)")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""Generadores de grafos sintéticos para benchmarks y pruebas."""
+
+import random
+
+from models.graph import Graph
+
+
+def random_graph(node_count, avg_degree=4, seed=0, width=2000, height=2000):
+    """
+    Genera un grafo aleatorio con posiciones, sin elementos de canvas.
+    
+    Args:
+        node_count: Cantidad de nodos
+        avg_degree: Grado promedio aproximado
+        seed: Semilla para que los casos sean reproducibles
+        width, height: Área en la que se reparten las posiciones
+        
+    Returns:
+        Objeto Graph
+    """
+    rng = random.Random(seed)
+    graph = Graph()
+    for _ in range(node_count):
+        graph.add_node(rng.uniform(0, width), rng.uniform(0, height), None, None)
+    
+    for _ in range(node_count * avg_degree // 2):
+        graph.add_edge(rng.randrange(node_count), rng.randrange(node_count), None)
+    return graph
+
+
+class RecordingCanvas:
+    """Sustituto headless de tk.Canvas que solo cuenta las llamadas recibidas."""
+    
+    def __init__(self):
+        """Inicializa los contadores."""
+        self.calls = 0
+        self.timers = 0  # Callbacks programados con after
+        self.pending = None
+        self.tk = self  # canvas.tk.eval(...) también se cuenta como una llamada
+    
+    def itemconfig(self, item_id, **options):
+        """Registra una llamada de configuración de un elemento."""
+        self.calls += 1
+    
+    def eval(self, script):
+        """Registra un script Tcl (una sola llamada, con cualquier cantidad de comandos)."""
+        self.calls += 1
+    
+    def after(self, delay, callback):
+        """Guarda el callback programado en lugar de esperar; se ejecuta con run_pending."""
+        self.timers += 1
+        self.pending = callback
+        return f'after#{self.timers}'
+    
+    def after_cancel(self, after_id):
+        """Descarta el callback programado."""
+        self.pending = None
+    
+    def run_pending(self):
+        """Ejecuta los callbacks programados hasta que no quede ninguno."""
+        while self.pending is not None:
+            callback, self.pending = self.pending, None
+            callback()
+
+
+def _empty_graph(node_count, rng):
+    """Crea un grafo con nodos en posiciones aleatorias y sin aristas."""
+    graph = Graph()
+    for _ in range(node_count):
+        graph.add_node(rng.uniform(0, 2000), rng.uniform(0, 2000), None, None)
+    return graph
+
+
+def sparse_graph(node_count, rng):
+    """Grafo con grado promedio cercano a 2."""
+    graph = _empty_graph(node_count, rng)
+    for _ in range(node_count):
+        graph.add_edge(rng.randrange(node_count), rng.randrange(node_count), None)
+    return graph
+
+
+def dense_graph(node_count, rng):
+    """Grafo con cerca de la mitad de las aristas posibles."""
+    graph = _empty_graph(node_count, rng)
+    for node1 in range(node_count):
+        for node2 in range(node1 + 1, node_count):
+            if rng.random() < 0.5:
+                graph.add_edge(node1, node2, None)
+    return graph
+
+
+def disconnected_graph(node_count, rng):
+    """Varias componentes aleatorias sin aristas entre ellas."""
+    graph = _empty_graph(node_count, rng)
+    groups = [list(range(i, node_count, 4)) for i in range(4)]
+    for group in groups:
+        for _ in range(len(group)):
+            graph.add_edge(rng.choice(group), rng.choice(group), None)
+    return graph
+
+
+def star_graph(node_count, rng):
+    """Un centro conectado a todos los demás nodos."""
+    graph = _empty_graph(node_count, rng)
+    center = rng.randrange(node_count)
+    for node_id in range(node_count):
+        graph.add_edge(center, node_id, None)
+    return graph
+
+
+def path_graph(node_count, rng):
+    """Un camino largo que recorre los nodos en orden aleatorio."""
+    graph = _empty_graph(node_count, rng)
+    order = list(range(node_count))
+    rng.shuffle(order)
+    for node1, node2 in zip(order, order[1:]):
+        graph.add_edge(node1, node2, None)
+    return graph
+
+
+def deleted_graph(node_count, rng):
+    """Grafo disperso al que luego se le eliminan nodos y aristas."""
+    graph = sparse_graph(node_count, rng)
+    for _ in range(node_count // 5):
+        graph.remove_node(rng.choice(list(graph.nodes)))
+    for _ in range(min(len(graph.edges), node_count // 5)):
+        graph.remove_edge(rng.randrange(len(graph.edges)))
+    return graph
+
+
+# Familia -> función (node_count, rng) -> Graph
+GRAPH_FAMILIES = {
+    'sparse': sparse_graph,
+    'dense': dense_graph,
+    'disconnected': disconnected_graph,
+    'star': star_graph,
+    'path': path_graph,
+    'deletions': deleted_graph,
+}
@@ -0,0 +1,107 @@
+"""
+Mide el costo de importación en frío con `python -X importtime` y verifica
+que los paquetes sin interfaz no importen tkinter.
+
+Uso:
+    python -m benchmarks.startup --repeat 5
+    python -m benchmarks.startup --output arranque.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Módulo -> True si puede importar tkinter
+TARGETS = {
+    'algorithms': False,
+    'models': False,
+    'config': False,
+    'profiling': False,
+    'benchmarks.generators': False,
+    'ui': False,
+    'ui.app': True,
+}
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure_import(module):
+    """
+    Importa un módulo en un intérprete nuevo con -X importtime.
+    
+    Args:
+        module: Nombre del módulo a importar
+        
+    Returns:
+        Tupla (microsegundos acumulados del módulo, set de módulos importados)
+    """
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=_ROOT, capture_output=True, text=True, check=True
+    )
+    total = 0
+    imported = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        name = name.strip()
+        imported.add(name)
+        if name == module:
+            total = int(cumulative)
+    return total, imported
+
+
+def run(repeat):
+    """
+    Mide cada módulo de TARGETS `repeat` veces.
+    
+    Returns:
+        Tupla (resultados por módulo, lista de módulos que importan tkinter
+        sin deberlo)
+    """
+    results = {}
+    violations = []
+    for module, allows_tk in TARGETS.items():
+        samples = []
+        imported = set()
+        for _ in range(repeat):
+            micros, imported = measure_import(module)
+            samples.append(micros)
+        results[module] = {
+            'median_ms': statistics.median(samples) / 1000,
+            'min_ms': min(samples) / 1000,
+            'modules': len(imported),
+            'tkinter': 'tkinter' in imported,
+        }
+        if not allows_tk and 'tkinter' in imported:
+            violations.append(module)
+    return results, violations
+
+
+def main(argv=None):
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.startup')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='archivo JSON con los resultados')
+    args = parser.parse_args(argv)
+    
+    results, violations = run(max(1, args.repeat))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    
+    print(f"{'módulo':24s} {'mediana':>10s} {'mínimo':>10s} {'módulos':>8s}  tkinter")
+    for module, data in results.items():
+        print(f"{module:24s} {data['median_ms']:7.2f} ms {data['min_ms']:7.2f} ms "
+              f"{data['modules']:8d}  {'sí' if data['tkinter'] else 'no'}")
+    for module in violations:
+        print(f"FALLA: '{module}' importa tkinter")
+    return 1 if violations else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
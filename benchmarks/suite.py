@@ -0,0 +1,306 @@
+"""Casos del benchmark: operaciones del grafo, BFS, hit-testing y reproducción."""
+
+import random
+import time
+import tkinter
+import tracemalloc
+
+from algorithms.bfs import bfs_search, generate_bfs_steps
+from algorithms.level_stats import LevelStatsRecorder
+from algorithms.layout import ForceLayout, numpy_available
+from algorithms.parallel_bfs import ParallelBFS
+from config.colors import COLORS, NODE_RADIUS
+from models.timeline import BFSTimeline, edge_key
+from ui.graph_canvas import GraphCanvas
+from ui.animation import AnimationController, AnimationRun
+from ui.render_plan import RenderPlan
+from .generators import RecordingCanvas, path_graph, random_graph, star_graph
+
+
+def _best_time(func, repeat):
+    """Ejecuta `func` varias veces y retorna el menor tiempo en segundos."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench_graph_churn(size, repeat):
+    """Agrega aristas y elimina nodos de forma intercalada."""
+    def run():
+        graph = random_graph(size, seed=1)
+        rng = random.Random(2)
+        for _ in range(size // 10):
+            graph.remove_node(rng.choice(list(graph.nodes)))
+            ids = list(graph.nodes)
+            graph.add_edge(rng.choice(ids), rng.choice(ids), None)
+    return {'seconds': _best_time(run, repeat)}
+
+
+def bench_batch_edit(size, repeat):
+    """Aplica la misma tanda de bajas y altas que `graph_churn` dentro de un batch."""
+    def run():
+        graph = random_graph(size, seed=1)
+        rng = random.Random(2)
+        ids = list(graph.nodes)
+        removed = rng.sample(ids, size // 10)
+        gone = set(removed)
+        alive = [node_id for node_id in ids if node_id not in gone]
+        with graph.batch():
+            for node_id in removed:
+                graph.remove_node(node_id)
+                graph.add_edge(rng.choice(alive), rng.choice(alive), None)
+    return {'seconds': _best_time(run, repeat)}
+
+
+def bench_bfs_steps(size, repeat):
+    """Mide tiempo y memoria pico de generate_bfs_steps."""
+    graph = random_graph(size, seed=3)
+    seconds = _best_time(lambda: generate_bfs_steps(graph, 0), repeat)
+    
+    tracemalloc.start()
+    generate_bfs_steps(graph, 0)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'seconds': seconds, 'peak_bytes': peak}
+
+
+def bench_level_stats(size, repeat):
+    """Mide bfs_search con estadísticas por nivel y, como referencia, sin ellas."""
+    graph = random_graph(size, seed=3)
+    seconds = _best_time(lambda: bfs_search(graph, 0, on_level=LevelStatsRecorder()), repeat)
+    seconds_off = _best_time(lambda: bfs_search(graph, 0), repeat)
+    return {'seconds': seconds, 'seconds_off': seconds_off, 'overhead': seconds / seconds_off - 1}
+
+
+def bench_parallel_bfs(size, repeat):
+    """
+    Mide ParallelBFS frente a bfs_search en un grafo de frontera ancha.
+    
+    El pool de procesos se crea antes de medir (una búsqueda de
+    calentamiento), así que solo se compara el recorrido.
+    """
+    graph = random_graph(size, avg_degree=16, seed=13)
+    seconds_serial = _best_time(lambda: bfs_search(graph, 0), repeat)
+    with ParallelBFS(graph) as engine:
+        engine.search(0)
+        seconds = _best_time(lambda: engine.search(0), repeat)
+        workers = engine.workers
+    return {
+        'seconds': seconds,
+        'seconds_serial': seconds_serial,
+        'speedup': seconds_serial / seconds,
+        'workers': workers,
+    }
+
+
+def bench_tree_queries(size, repeat):
+    """Mide 1000 consultas de ancestro común en un árbol BFS profundo, con y sin binary lifting."""
+    graph = path_graph(size, random.Random(11))
+    result = bfs_search(graph, 0)
+    rng = random.Random(12)
+    pairs = [(rng.randrange(size), rng.randrange(size)) for _ in range(1000)]
+    lifted = result.tree_index()
+    walked = result.tree_index(lifting=False)
+    return {
+        'seconds': _best_time(lambda: [lifted.lca(a, b) for a, b in pairs], repeat),
+        'seconds_walk': _best_time(lambda: [walked.lca(a, b) for a, b in pairs], repeat),
+        'build_seconds': _best_time(result.tree_index, repeat),
+        'depth': max(result.distances.values()),
+    }
+
+
+def bench_hit_test(size, repeat):
+    """Mide get_node_at (con el índice espacial, como la app) y get_edge_at sobre posiciones aleatorias."""
+    graph = random_graph(size, seed=4)
+    graph_canvas = GraphCanvas.__new__(GraphCanvas)
+    rng = random.Random(5)
+    points = [(rng.uniform(0, 2000), rng.uniform(0, 2000)) for _ in range(200)]
+    
+    def run():
+        for x, y in points:
+            graph_canvas.get_node_at(x, y, graph.nodes, graph.nodes_near(x, y, NODE_RADIUS))
+            graph_canvas.get_edge_at(x, y, graph.edges, graph.nodes)
+    return {'seconds': _best_time(run, repeat)}
+
+
+def bench_replay(size, repeat):
+    """Reproduce una traza completa sobre un canvas simulado, sin Tk."""
+    graph = random_graph(size, seed=6)
+    steps = generate_bfs_steps(graph, 0)
+    graph_canvas = GraphCanvas.__new__(GraphCanvas)
+    graph_canvas.canvas = RecordingCanvas()
+    line_ids = {edge_key(n1, n2): i for i, (n1, n2, _) in enumerate(graph.edges)}
+    
+    def run():
+        timeline = BFSTimeline(steps, 0)
+        while not timeline.is_finished():
+            node_changes, edge_changes = timeline.step_forward()
+            for node_id, state in node_changes:
+                graph_canvas.set_node_color(node_id, node_id, COLORS[state])
+            for key, state in edge_changes:
+                graph_canvas.set_edge_color(line_ids[key], COLORS[state])
+    
+    seconds = _best_time(run, repeat)
+    return {'seconds': seconds, 'steps': len(steps), 'canvas_calls': graph_canvas.canvas.calls // repeat}
+
+
+def bench_replay_plan(size, repeat):
+    """Reproduce la misma traza que `replay` con un plan de renderizado precompilado."""
+    graph = random_graph(size, seed=6)
+    steps = generate_bfs_steps(graph, 0)
+    # IDs de canvas simulados, como en `replay`
+    for node_id, data in graph.nodes.items():
+        data['circle_id'] = data['text_id'] = node_id
+    graph.edges = [(n1, n2, i) for i, (n1, n2, _) in enumerate(graph.edges)]
+    graph_canvas = GraphCanvas.__new__(GraphCanvas)
+    graph_canvas.canvas = RecordingCanvas()
+    graph_canvas._path = '.canvas'
+    
+    def run():
+        timeline = BFSTimeline(steps, 0)
+        plan = RenderPlan(graph)
+        plan.extend(timeline.deltas)
+        while not timeline.is_finished():
+            index = timeline.position
+            timeline.step_forward()
+            graph_canvas.apply_ops(plan.step_ops(index))
+    
+    seconds = _best_time(run, repeat)
+    return {'seconds': seconds, 'steps': len(steps), 'canvas_calls': graph_canvas.canvas.calls // repeat}
+
+
+def bench_multi_run(size, repeat):
+    """Anima cuatro BFS desde nodos distintos con un único reloj compartido."""
+    graph = random_graph(size, seed=9)
+    for node_id, data in graph.nodes.items():
+        data['circle_id'] = data['text_id'] = node_id
+    graph.edges = [(n1, n2, i) for i, (n1, n2, _) in enumerate(graph.edges)]
+    starts = random.Random(10).sample(sorted(graph.nodes), 4)
+    steps = {start: generate_bfs_steps(graph, start) for start in starts}
+    widget = RecordingCanvas()
+    
+    def run():
+        controller = AnimationController(widget, interval=0)
+        for start in starts:
+            controller.add_run(AnimationRun(start, BFSTimeline(steps[start], start), graph, '.canvas'))
+        controller.start()
+        widget.run_pending()
+        return controller.frames
+    
+    seconds = _best_time(run, repeat)
+    frames = run()
+    return {
+        'seconds': seconds,
+        'frames': frames,
+        'timer_callbacks': widget.timers // (repeat + 1),
+        'canvas_calls': widget.calls // (repeat + 1),
+    }
+
+
+def bench_drag_hub(size, repeat):
+    """
+    Arrastra el centro de una estrella con `size` hojas durante 100 cuadros.
+    
+    Usa un intérprete Tcl real (sin display) con un `.canvas` que ignora
+    los comandos, para medir también el trabajo del lado de Tcl.
+    """
+    graph = star_graph(size, random.Random(8))
+    hub = max(graph.nodes, key=lambda node_id: len(graph.adjacency[node_id]))
+    graph_canvas = GraphCanvas.__new__(GraphCanvas)
+    graph_canvas.canvas = tkinter.Tcl()
+    graph_canvas.canvas.eval('proc .canvas {args} {}')
+    graph_canvas._path = '.canvas'
+    graph_canvas._drag_proc_ready = False
+    graph_canvas._drag_items = None
+    nodes = graph.nodes
+    
+    def run():
+        lines = [(i, nodes[n]['x'], nodes[n]['y']) for i, (n, _) in enumerate(graph.incident_edges(hub))]
+        graph_canvas.begin_drag(0, 0, lines)
+        for frame in range(100):
+            graph.move_node(hub, 1000 + frame, 1000 + frame)
+            graph_canvas.drag_node(1000 + frame, 1000 + frame)
+        graph_canvas.end_drag()
+    
+    return {'seconds': _best_time(run, repeat)}
+
+
+def bench_layout_step(size, repeat):
+    """Mide una iteración de la distribución por fuerzas (Barnes–Hut)."""
+    graph = random_graph(size, seed=7)
+    index = {node_id: i for i, node_id in enumerate(graph.nodes)}
+    edges = [(index[n1], index[n2]) for n1, n2, _ in graph.edges]
+    layout = ForceLayout(size, edges, 2000, 2000)
+    return {'seconds': _best_time(layout.step, repeat)}
+
+
+# Nombre del caso -> función (size, repeat) -> dict de métricas
+CASES = {
+    'graph_churn': bench_graph_churn,
+    'batch_edit': bench_batch_edit,
+    'bfs_steps': bench_bfs_steps,
+    'level_stats': bench_level_stats,
+    'tree_queries': bench_tree_queries,
+    'parallel_bfs': bench_parallel_bfs,
+    'hit_test': bench_hit_test,
+    'replay': bench_replay,
+    'replay_plan': bench_replay_plan,
+    'drag_hub': bench_drag_hub,
+    'multi_run': bench_multi_run,
+}
+if numpy_available():
+    CASES['layout_step'] = bench_layout_step
+
+
+def run_suite(sizes, repeat=3, cases=None, progress=None):
+    """
+    Ejecuta los casos del benchmark para cada tamaño.
+    
+    Args:
+        sizes: Lista de cantidades de nodos
+        repeat: Repeticiones por caso (se guarda el mejor tiempo)
+        cases: Nombres de casos a ejecutar (por defecto todos)
+        progress: Función opcional que recibe cada nombre de resultado
+        
+    Returns:
+        Diccionario {'case[n=size]': métricas}
+    """
+    results = {}
+    for name in cases or CASES:
+        for size in sizes:
+            key = f"{name}[n={size}]"
+            results[key] = CASES[name](size, repeat)
+            if progress:
+                progress(key, results[key])
+    return results
+
+
+def compare_results(baseline, current, threshold=0.15):
+    """
+    Compara dos resultados y detecta regresiones.
+    
+    Args:
+        baseline: Resultados guardados como referencia
+        current: Resultados nuevos
+        threshold: Aumento relativo tolerado (0.15 = 15 %)
+        
+    Returns:
+        Lista de tuplas (caso, métrica, valor_base, valor_nuevo, razón),
+        marcando como regresión las que superan el umbral
+    """
+    rows = []
+    for key, metrics in current.items():
+        if key not in baseline:
+            continue
+        for metric in ('seconds', 'peak_bytes'):
+            if metric not in metrics or metric not in baseline[key]:
+                continue
+            old = baseline[key][metric]
+            new = metrics[metric]
+            ratio = new / old if old else float('inf')
+            rows.append((key, metric, old, new, ratio, ratio > 1 + threshold))
+    return rows
@@ -8,6 +8,18 @@ COLORS = {
     'visited': '#4CAF50',         # Verde
     'edge': '#666666',            # Gris oscuro
     'edge_traversed': '#2196F3',  # Azul
+    
+    # Camino más corto (BFS bidireccional)
+    'source_frontier': '#FFB74D', # Naranja (frontera desde el origen)
+    'source_visited': '#FFE0B2',  # Naranja claro
+    'target_frontier': '#BA68C8', # Violeta (frontera desde el destino)
+    'target_visited': '#E1BEE7',  # Violeta claro
+    'path': '#E53935',            # Rojo intenso
+    'edge_path': '#E53935',       # Rojo intenso
+    
+    # Modo grilla
+    'grid_free': '#FFFFFF',       # Celda libre
+    'grid_wall': '#37474F',       # Muro
 }
 
 # Colores para la interfaz de usuario
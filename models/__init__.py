@@ -1,5 +1,12 @@
 """Módulo de modelos para BFS Visualizer."""
 
-from .graph import Graph
+from .csr import CSRGraph
+from .graph import Graph, GraphSnapshot
+from .grid import Grid
+from .timeline import BFSTimeline
+from .trace import TracePlayback, TraceReader, TraceWriter, write_trace
 
-__all__ = ['Graph']
+__all__ = [
+    'CSRGraph', 'Graph', 'GraphSnapshot', 'Grid', 'BFSTimeline',
+    'TracePlayback', 'TraceReader', 'TraceWriter', 'write_trace'
+]
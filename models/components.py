@@ -0,0 +1,132 @@
+"""Seguimiento incremental de componentes conexas con union-find."""
+
+
+class ComponentIndex:
+    """
+    Union-find con reconstrucción perezosa y localizada tras eliminaciones.
+    
+    Agregar nodos y aristas cuesta casi O(1) (unión por tamaño y compresión
+    de caminos). Eliminar una arista o un nodo no se puede deshacer en un
+    union-find, así que solo se marca como "sucia" la componente afectada;
+    la próxima consulta sobre ella la reconstruye recorriendo únicamente sus
+    propios nodos.
+    """
+    
+    def __init__(self):
+        """Inicializa el índice vacío."""
+        self.parent = {}   # {node_id: node_id padre}
+        self.members = {}  # {raíz: set de node_ids de la componente}
+        self._dirty = set()    # Raíces de componentes a reconstruir
+        self._removed = set()  # Nodos eliminados pendientes de limpiar
+    
+    def add(self, node_id):
+        """Registra un nodo nuevo como componente propia."""
+        self.parent[node_id] = node_id
+        self.members[node_id] = {node_id}
+    
+    def _find(self, node_id):
+        """Retorna la raíz de un nodo (con compresión de caminos)."""
+        parent = self.parent
+        root = node_id
+        while parent[root] != root:
+            root = parent[root]
+        while parent[node_id] != root:
+            parent[node_id], node_id = root, parent[node_id]
+        return root
+    
+    def union(self, node1, node2):
+        """Une las componentes de dos nodos."""
+        root1 = self._find(node1)
+        root2 = self._find(node2)
+        if root1 == root2:
+            return
+        
+        if len(self.members[root1]) < len(self.members[root2]):
+            root1, root2 = root2, root1
+        self.parent[root2] = root1
+        self.members[root1] |= self.members.pop(root2)
+        if root2 in self._dirty:
+            self._dirty.discard(root2)
+            self._dirty.add(root1)
+    
+    def mark_dirty(self, node_id):
+        """Marca como sucia la componente de un nodo (p. ej. al quitar una arista)."""
+        self._dirty.add(self._find(node_id))
+    
+    def discard(self, node_id):
+        """Registra la eliminación de un nodo; se limpia al reconstruir."""
+        self.mark_dirty(node_id)
+        self._removed.add(node_id)
+    
+    def clear(self):
+        """Elimina todo el índice."""
+        self.parent.clear()
+        self.members.clear()
+        self._dirty.clear()
+        self._removed.clear()
+    
+    def _rebuild(self, root, neighbors):
+        """
+        Reconstruye una componente sucia recorriendo solo sus nodos.
+        
+        Args:
+            root: Raíz de la componente sucia
+            neighbors: Función node_id -> vecinos en el grafo actual
+        """
+        self._dirty.discard(root)
+        old_members = self.members.pop(root)
+        for node_id in old_members:
+            del self.parent[node_id]
+        live_members = old_members - self._removed
+        self._removed -= old_members
+        
+        for start in live_members:
+            if start in self.parent:
+                continue
+            component = {start}
+            stack = [start]
+            while stack:
+                for neighbor in neighbors(stack.pop()):
+                    if neighbor not in component:
+                        component.add(neighbor)
+                        stack.append(neighbor)
+            for node_id in component:
+                self.parent[node_id] = start
+            self.members[start] = component
+    
+    def resolve(self, node_id, neighbors):
+        """
+        Retorna la raíz de un nodo, reconstruyendo su componente si está sucia.
+        
+        Args:
+            node_id: ID de un nodo existente
+            neighbors: Función node_id -> vecinos en el grafo actual
+            
+        Returns:
+            Raíz (representante) de la componente del nodo
+        """
+        root = self._find(node_id)
+        if root in self._dirty:
+            self._rebuild(root, neighbors)
+            root = self._find(node_id)
+        return root
+    
+    def resolve_all(self, neighbors):
+        """Reconstruye todas las componentes sucias pendientes."""
+        for root in list(self._dirty):
+            if root in self._dirty:
+                self._rebuild(root, neighbors)
+    
+    def count(self, neighbors):
+        """
+        Retorna la cantidad de componentes conexas.
+        
+        Solo reconstruye las componentes sucias; sin eliminaciones
+        pendientes es O(1).
+        
+        Args:
+            neighbors: Función node_id -> vecinos en el grafo actual
+        """
+        if self._dirty:
+            self.resolve_all(neighbors)
+        return len(self.members)
@@ -0,0 +1,56 @@
+"""Representación compacta (CSR) de un grafo para recorridos masivos."""
+
+from array import array
+
+
+class CSRGraph:
+    """
+    Grafo en formato CSR (Compressed Sparse Row).
+    
+    Los nodos se renumeran a índices densos 0..n-1 en orden de ID, y los
+    vecinos del índice i son targets[offsets[i]:offsets[i + 1]], ordenados
+    de menor a mayor (el mismo orden en que BFS los recorre).
+    """
+    
+    def __init__(self, ids, offsets, targets):
+        """
+        Inicializa el grafo CSR.
+        
+        Args:
+            ids: Lista de IDs de nodo; ids[i] es el nodo del índice i
+            offsets: array('q') de n + 1 posiciones
+            targets: array('q') con los índices vecinos concatenados
+        """
+        self.ids = ids
+        self.index = {node_id: i for i, node_id in enumerate(ids)}
+        self.offsets = offsets
+        self.targets = targets
+    
+    @classmethod
+    def from_graph(cls, graph):
+        """
+        Construye la forma CSR de un Graph.
+        
+        Args:
+            graph: Objeto Graph
+            
+        Returns:
+            Instancia de CSRGraph
+        """
+        ids = sorted(graph.nodes)
+        index = {node_id: i for i, node_id in enumerate(ids)}
+        offsets = array('q', [0])
+        targets = array('q')
+        for node_id in ids:
+            targets.extend(sorted(index[n] for n in graph.get_neighbors(node_id)))
+            offsets.append(len(targets))
+        return cls(ids, offsets, targets)
+    
+    @property
+    def node_count(self):
+        """Retorna la cantidad de nodos."""
+        return len(self.ids)
+    
+    def neighbors(self, i):
+        """Retorna los índices vecinos del índice i."""
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
@@ -1,5 +1,43 @@
 """Estructura de datos del grafo."""
 
+import weakref
+from collections import namedtuple
+from contextlib import contextmanager
+
+from profiling import profiled
+from .components import ComponentIndex
+from .spatial import SpatialHash
+from .timeline import edge_key
+
+
+# Notificación de cambios para los oyentes del grafo: IDs de nodos
+# agregados, (ID, datos) de nodos eliminados, aristas (n1, n2, line_id)
+# agregadas y eliminadas (incluidas las de los nodos eliminados), y si el
+# grafo se vació por completo con clear().
+GraphChange = namedtuple(
+    'GraphChange',
+    ['added_nodes', 'removed_nodes', 'added_edges', 'removed_edges', 'cleared'],
+    defaults=(False,)
+)
+
+
+def spreadsheet_label(index):
+    """
+    Convierte un índice en una etiqueta estilo hoja de cálculo.
+    
+    Args:
+        index: Entero >= 0 (0 -> 'A', 25 -> 'Z', 26 -> 'AA', 701 -> 'ZZ', 702 -> 'AAA')
+        
+    Returns:
+        La etiqueta correspondiente
+    """
+    label = ''
+    index += 1
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        label = chr(ord('A') + remainder) + label
+    return label
+
 
 class Graph:
     """Representa un grafo no dirigido con nodos y aristas."""
@@ -9,8 +47,21 @@ class Graph:
         self.nodes = {}  # {node_id: {'x': int, 'y': int, 'label': str, 'circle_id': int, 'text_id': int}}
         self.edges = []  # [(node_id1, node_id2, line_id)]
         self.adjacency = {}  # {node_id: [neighbor_ids]}
+        self.label_index = {}  # {label: node_id}
+        self._edge_lines = {}  # {edge_key: line_id}, también evita duplicados en O(1)
         self._next_node_id = 0
-        self._next_label = ord('A')
+        self._next_label = 0  # Índice en la secuencia A..Z, AA..ZZ, AAA...
+        self._components = ComponentIndex()
+        self._spatial = SpatialHash()  # Posiciones de los nodos para hit-testing
+        self._listeners = []
+        self._batch = None  # _GraphBatch mientras hay un batch() abierto
+        # Copia en escritura: instantáneas vivas, si los contenedores actuales
+        # se comparten con la última, y nodos cuya lista de vecinos y datos
+        # ya se copiaron desde entonces (None: ninguno se comparte)
+        self._snapshots = weakref.WeakSet()
+        self._shared = False
+        self._owned = None
+        self._last_snapshot = None
     
     @property
     def next_node_id(self):
@@ -19,10 +70,13 @@ class Graph:
     
     @property
     def next_label(self):
-        """Retorna la siguiente etiqueta disponible."""
-        return chr(self._next_label)
+        """Retorna la siguiente etiqueta automática disponible."""
+        while spreadsheet_label(self._next_label) in self.label_index:
+            self._next_label += 1
+        return spreadsheet_label(self._next_label)
     
-    def add_node(self, x, y, circle_id, text_id):
+    @profiled('graph.add_node')
+    def add_node(self, x, y, circle_id, text_id, label=None):
         """
         Agrega un nuevo nodo al grafo.
         
@@ -31,13 +85,23 @@ class Graph:
             y: Posición Y del nodo
             circle_id: ID del círculo en el canvas
             text_id: ID del texto en el canvas
+            label: Etiqueta propia; por defecto la siguiente de la secuencia
             
         Returns:
             El ID del nodo creado
+            
+        Raises:
+            ValueError: Si la etiqueta ya está en uso
         """
+        if label is None:
+            label = self.next_label
+            self._next_label += 1
+        elif label in self.label_index:
+            raise ValueError(f"La etiqueta '{label}' ya está en uso")
+        
         node_id = self._next_node_id
-        label = chr(self._next_label)
         
+        self._detach()
         self.nodes[node_id] = {
             'x': x,
             'y': y,
@@ -46,14 +110,20 @@ class Graph:
             'text_id': text_id
         }
         self.adjacency[node_id] = []
+        self.label_index[label] = node_id
+        self._components.add(node_id)
+        self._spatial.insert(node_id, x, y)
+        if self._owned is not None:
+            self._owned.add(node_id)
         
         self._next_node_id += 1
-        self._next_label += 1
-        if self._next_label > ord('Z'):
-            self._next_label = ord('A')
-        
+        if self._batch is not None:
+            self._batch.added_nodes.append(node_id)
+        elif self._listeners:
+            self._notify(GraphChange([node_id], [], [], []))
         return node_id
     
+    @profiled('graph.add_edge')
     def add_edge(self, node1, node2, line_id):
         """
         Agrega una arista entre dos nodos.
@@ -68,17 +138,26 @@ class Graph:
         """
         if node1 == node2:
             return False
+        if self._batch is not None:
+            return self._batch.add_edge(node1, node2, line_id)
         
-        # Verificar si ya existe
-        for n1, n2, _ in self.edges:
-            if (n1 == node1 and n2 == node2) or (n1 == node2 and n2 == node1):
-                return False
+        key = edge_key(node1, node2)
+        if key in self._edge_lines:
+            return False
         
-        self.edges.append((node1, node2, line_id))
+        self._detach()
+        self._own(node1)
+        self._own(node2)
         self.adjacency[node1].append(node2)
         self.adjacency[node2].append(node1)
+        self.edges.append((node1, node2, line_id))
+        self._edge_lines[key] = line_id
+        self._components.union(node1, node2)
+        if self._listeners:
+            self._notify(GraphChange([], [], [(node1, node2, line_id)], []))
         return True
     
+    @profiled('graph.remove_node')
     def remove_node(self, node_id):
         """
         Elimina un nodo y todas sus aristas.
@@ -91,14 +170,20 @@ class Graph:
         """
         if node_id not in self.nodes:
             return None
+        if self._batch is not None:
+            return self._batch.remove_node(node_id)
         
-        removed_line_ids = []
+        removed_edges = []
         edges_to_remove = []
+        self._detach()
+        for neighbor in self.adjacency[node_id]:
+            self._own(neighbor)
         
         for i, (n1, n2, line_id) in enumerate(self.edges):
             if n1 == node_id or n2 == node_id:
-                removed_line_ids.append(line_id)
+                removed_edges.append((n1, n2, line_id))
                 edges_to_remove.append(i)
+                del self._edge_lines[edge_key(n1, n2)]
                 # Actualizar adyacencia
                 if n1 != node_id and n1 in self.adjacency:
                     if node_id in self.adjacency[n1]:
@@ -110,31 +195,96 @@ class Graph:
         for i in reversed(edges_to_remove):
             self.edges.pop(i)
         
-        del self.nodes[node_id]
+        data = self.nodes.pop(node_id)
+        del self.label_index[data['label']]
         del self.adjacency[node_id]
+        self._components.discard(node_id)
+        self._spatial.remove(node_id)
         
-        return removed_line_ids
+        if self._listeners:
+            self._notify(GraphChange([], [(node_id, data)], [], removed_edges))
+        return [line_id for _, _, line_id in removed_edges]
     
+    @profiled('graph.remove_edge')
     def remove_edge(self, edge_index):
         """
         Elimina una arista por su índice.
         
         Args:
-            edge_index: Índice de la arista a eliminar
-            
+            edge_index: Índice de la arista a eliminar (dentro de un batch,
+                los índices son los previos al batch hasta confirmarlo)
+                
         Returns:
             Tupla (node1, node2, line_id) de la arista eliminada
         """
         n1, n2, line_id = self.edges[edge_index]
+        if self._batch is not None:
+            self._batch.remove_edge(n1, n2)
+            return (n1, n2, line_id)
         
+        self._detach()
+        self._own(n1)
+        self._own(n2)
         if n2 in self.adjacency[n1]:
             self.adjacency[n1].remove(n2)
         if n1 in self.adjacency[n2]:
             self.adjacency[n2].remove(n1)
         
         self.edges.pop(edge_index)
+        del self._edge_lines[edge_key(n1, n2)]
+        self._components.mark_dirty(n1)
+        if self._listeners:
+            self._notify(GraphChange([], [], [], [(n1, n2, line_id)]))
         return (n1, n2, line_id)
     
+    def move_node(self, node_id, x, y):
+        """
+        Cambia la posición de un nodo.
+        
+        Args:
+            node_id: ID del nodo
+            x: Nueva posición X
+            y: Nueva posición Y
+        """
+        self._detach()
+        self._own(node_id)
+        node = self.nodes[node_id]
+        node['x'] = x
+        node['y'] = y
+        self._spatial.move(node_id, x, y)
+    
+    def nodes_near(self, x, y, radius):
+        """
+        Obtiene los nodos cuyo centro puede estar a distancia <= radius.
+        
+        Usa el índice espacial, que se actualiza al agregar, mover o
+        eliminar nodos, así que solo revisa las celdas cercanas.
+        
+        Args:
+            x, y: Posición consultada
+            radius: Radio de búsqueda
+            
+        Returns:
+            Lista de IDs candidatos (puede incluir nodos algo más lejanos)
+        """
+        return self._spatial.near(x, y, radius)
+    
+    def incident_edges(self, node_id):
+        """
+        Obtiene las aristas de un nodo en O(grado).
+        
+        Args:
+            node_id: ID del nodo
+            
+        Returns:
+            Lista de tuplas (vecino, line_id)
+        """
+        edge_lines = self._edge_lines
+        return [
+            (neighbor, edge_lines[edge_key(node_id, neighbor)])
+            for neighbor in self.adjacency[node_id]
+        ]
+    
     def get_neighbors(self, node_id):
         """
         Obtiene los vecinos de un nodo.
@@ -159,6 +309,55 @@ class Graph:
         """
         return self.nodes.get(node_id)
     
+    def find_node(self, label):
+        """
+        Busca un nodo por su etiqueta en O(1).
+        
+        Args:
+            label: Etiqueta del nodo (p. ej. 'AB')
+            
+        Returns:
+            ID del nodo o None si no existe
+        """
+        return self.label_index.get(label)
+    
+    def component_of(self, node_id):
+        """
+        Obtiene el representante de la componente conexa de un nodo.
+        
+        Args:
+            node_id: ID del nodo
+            
+        Returns:
+            ID del nodo representante (igual para toda la componente)
+        """
+        return self._components.resolve(node_id, self.get_neighbors)
+    
+    def component_size(self, node_id):
+        """Retorna la cantidad de nodos de la componente de un nodo."""
+        return len(self._components.members[self.component_of(node_id)])
+    
+    def component_nodes(self, node_id):
+        """Retorna el conjunto de nodos de la componente de un nodo."""
+        return set(self._components.members[self.component_of(node_id)])
+    
+    def component_count(self):
+        """Retorna la cantidad de componentes conexas."""
+        return self._components.count(self.get_neighbors)
+    
+    def components(self):
+        """
+        Obtiene todas las componentes conexas.
+        
+        Returns:
+            Lista de sets de IDs, ordenada por el menor ID de cada componente
+        """
+        self._components.resolve_all(self.get_neighbors)
+        return sorted(
+            (set(members) for members in self._components.members.values()),
+            key=min
+        )
+    
     def has_nodes(self):
         """Retorna True si el grafo tiene al menos un nodo."""
         return len(self.nodes) > 0
@@ -170,10 +369,375 @@ class Graph:
         text_ids = [n['text_id'] for n in self.nodes.values()]
         line_ids = [e[2] for e in self.edges]
         
-        self.nodes.clear()
-        self.edges.clear()
-        self.adjacency.clear()
+        if self._snapshots:
+            # Las instantáneas conservan los contenedores anteriores
+            self.nodes, self.edges, self.adjacency, self.label_index = {}, [], {}, {}
+            self._shared = False
+            self._owned = set()
+        else:
+            self.nodes.clear()
+            self.edges.clear()
+            self.adjacency.clear()
+            self.label_index.clear()
+        self._edge_lines.clear()
+        self._components.clear()
+        self._spatial.clear()
         self._next_node_id = 0
-        self._next_label = ord('A')
+        self._next_label = 0
         
+        if self._listeners:
+            self._notify(GraphChange([], [], [], [], cleared=True))
         return circle_ids, text_ids, line_ids
+    
+    def snapshot(self):
+        """
+        Retorna una instantánea inmutable del grafo en O(1).
+        
+        La instantánea comparte los diccionarios, la lista de aristas y las
+        listas de vecinos con el grafo. La primera modificación posterior
+        copia los contenedores (solo referencias, sin copiar las listas de
+        vecinos) y cada lista de vecinos o diccionario de nodo se copia
+        recién cuando se modifica, así que lo que no cambia se sigue
+        compartiendo. Por eso una instantánea se puede recorrer desde otro
+        hilo mientras el grafo se sigue editando, sin bloqueos.
+        
+        Returns:
+            Objeto GraphSnapshot
+        """
+        if self._shared:
+            snapshot = self._last_snapshot()
+            if snapshot is not None:
+                # Nada cambió desde la última instantánea
+                return snapshot
+        
+        snapshot = GraphSnapshot(self.nodes, self.edges, self.adjacency, self.label_index)
+        self._snapshots.add(snapshot)
+        self._last_snapshot = weakref.ref(snapshot)
+        self._shared = True
+        self._owned = set()
+        return snapshot
+    
+    def _detach(self):
+        """Deja de compartir los contenedores con las instantáneas antes de modificarlos."""
+        if not self._shared:
+            return
+        self._shared = False
+        if not self._snapshots:
+            # No quedan instantáneas vivas: no hace falta copiar nada
+            self._owned = None
+            return
+        self.nodes = dict(self.nodes)
+        self.edges = list(self.edges)
+        self.adjacency = dict(self.adjacency)
+        self.label_index = dict(self.label_index)
+    
+    def _own(self, node_id):
+        """Copia la lista de vecinos y los datos de un nodo si una instantánea los comparte."""
+        owned = self._owned
+        if owned is None or node_id in owned:
+            return
+        if not self._snapshots:
+            self._owned = None
+            return
+        self.adjacency[node_id] = list(self.adjacency[node_id])
+        self.nodes[node_id] = dict(self.nodes[node_id])
+        owned.add(node_id)
+    
+    def add_listener(self, callback):
+        """
+        Registra una función que recibe un GraphChange tras cada modificación.
+        
+        Fuera de un batch se notifica cada operación; dentro de un batch se
+        envía una sola notificación con todos los cambios al confirmarlo.
+        """
+        self._listeners.append(callback)
+    
+    def remove_listener(self, callback):
+        """Quita una función registrada con add_listener."""
+        self._listeners.remove(callback)
+    
+    def _notify(self, change):
+        """Envía un cambio a todos los oyentes."""
+        for callback in list(self._listeners):
+            callback(change)
+    
+    @contextmanager
+    def batch(self):
+        """
+        Agrupa modificaciones y las aplica juntas al salir del bloque.
+        
+        Dentro del batch, add_node se aplica de inmediato (cuesta O(1)),
+        pero las altas y bajas de aristas y las bajas de nodos se guardan y
+        se aplican al confirmar en una sola pasada: la lista de aristas y
+        las adyacencias afectadas se reescriben una vez y los oyentes
+        reciben un único GraphChange. Hasta confirmar, las consultas ven
+        las aristas previas al batch. Si el bloque lanza una excepción, se
+        descartan todos los cambios (incluidos los nodos agregados).
+        Los batch anidados se suman al exterior.
+        
+            with graph.batch():
+                for n1, n2 in pares:
+                    graph.add_edge(n1, n2, None)
+        """
+        if self._batch is not None:
+            yield self
+            return
+        
+        self._batch = _GraphBatch(self)
+        try:
+            yield self
+        except BaseException:
+            batch, self._batch = self._batch, None
+            batch.rollback()
+            raise
+        batch, self._batch = self._batch, None
+        change = batch.commit()
+        if self._listeners and any(change):
+            self._notify(change)
+    
+    @property
+    def in_batch(self):
+        """Retorna True si hay un batch abierto."""
+        return self._batch is not None
+
+
+class GraphSnapshot:
+    """
+    Vista inmutable de un Graph en un momento dado (ver Graph.snapshot).
+    
+    Ofrece la misma interfaz de lectura que Graph (nodes, edges, adjacency,
+    get_neighbors, get_node, find_node, components...), así que los
+    recorridos y análisis aceptan indistintamente un grafo o una
+    instantánea. Sus contenedores no deben modificarse.
+    """
+    
+    def __init__(self, nodes, edges, adjacency, label_index):
+        """
+        Inicializa la instantánea sobre contenedores compartidos.
+        
+        Args:
+            nodes, edges, adjacency, label_index: Contenedores del Graph
+                en el momento de la instantánea
+        """
+        self.nodes = nodes
+        self.edges = edges
+        self.adjacency = adjacency
+        self.label_index = label_index
+        self._component_of = None  # {node_id: índice en _components}, perezoso
+        self._components = None
+    
+    def get_neighbors(self, node_id):
+        """Retorna la lista de vecinos de un nodo."""
+        return self.adjacency.get(node_id, [])
+    
+    def get_node(self, node_id):
+        """Retorna los datos de un nodo o None."""
+        return self.nodes.get(node_id)
+    
+    def find_node(self, label):
+        """Retorna el ID del nodo con esa etiqueta o None."""
+        return self.label_index.get(label)
+    
+    def has_nodes(self):
+        """Retorna True si la instantánea tiene al menos un nodo."""
+        return len(self.nodes) > 0
+    
+    def _resolve_components(self):
+        """Calcula las componentes conexas una sola vez (la instantánea no cambia)."""
+        if self._components is not None:
+            return
+        component_of = {}
+        components = []
+        for root in sorted(self.nodes):
+            if root in component_of:
+                continue
+            index = len(components)
+            members = {root}
+            component_of[root] = index
+            stack = [root]
+            while stack:
+                for neighbor in self.adjacency[stack.pop()]:
+                    if neighbor not in component_of:
+                        component_of[neighbor] = index
+                        members.add(neighbor)
+                        stack.append(neighbor)
+            components.append(members)
+        self._component_of = component_of
+        self._components = components
+    
+    def component_of(self, node_id):
+        """Retorna el representante (menor ID) de la componente de un nodo."""
+        self._resolve_components()
+        return min(self._components[self._component_of[node_id]])
+    
+    def component_size(self, node_id):
+        """Retorna la cantidad de nodos de la componente de un nodo."""
+        self._resolve_components()
+        return len(self._components[self._component_of[node_id]])
+    
+    def component_nodes(self, node_id):
+        """Retorna el conjunto de nodos de la componente de un nodo."""
+        self._resolve_components()
+        return set(self._components[self._component_of[node_id]])
+    
+    def component_count(self):
+        """Retorna la cantidad de componentes conexas."""
+        self._resolve_components()
+        return len(self._components)
+    
+    def components(self):
+        """
+        Obtiene todas las componentes conexas.
+        
+        Returns:
+            Lista de sets de IDs, ordenada por el menor ID de cada componente
+        """
+        self._resolve_components()
+        return [set(members) for members in self._components]
+
+
+class _GraphBatch:
+    """Modificaciones pendientes de un Graph.batch()."""
+    
+    def __init__(self, graph):
+        """
+        Inicializa el registro vacío.
+        
+        Args:
+            graph: Graph sobre el que se abrió el batch
+        """
+        self.graph = graph
+        self.added_nodes = []     # IDs agregados (ya presentes en el grafo)
+        self.removed_nodes = {}   # {node_id: None}, en orden de eliminación
+        self.added_edges = {}     # {edge_key: (n1, n2, line_id)}
+        self.removed_edges = set()  # edge_keys de aristas previas a eliminar
+        self._added_by_node = {}  # {node_id: set de edge_keys pendientes}
+    
+    def add_edge(self, node1, node2, line_id):
+        """Registra una arista nueva; retorna False si ya existe o es inválida."""
+        graph = self.graph
+        if node1 not in graph.nodes:
+            raise KeyError(node1)
+        if node2 not in graph.nodes:
+            raise KeyError(node2)
+        if node1 in self.removed_nodes or node2 in self.removed_nodes:
+            return False
+        key = edge_key(node1, node2)
+        if key in self.added_edges:
+            return False
+        if key in graph._edge_lines and key not in self.removed_edges:
+            return False
+        
+        self.added_edges[key] = (node1, node2, line_id)
+        self._added_by_node.setdefault(node1, set()).add(key)
+        self._added_by_node.setdefault(node2, set()).add(key)
+        return True
+    
+    def remove_edge(self, node1, node2):
+        """Registra la eliminación de una arista previa al batch."""
+        key = edge_key(node1, node2)
+        self.removed_edges.add(key)
+        # Si se había vuelto a agregar dentro del batch, también se descarta
+        if self.added_edges.pop(key, None) is not None:
+            self._added_by_node[node1].discard(key)
+            self._added_by_node[node2].discard(key)
+    
+    def remove_node(self, node_id):
+        """
+        Registra la eliminación de un nodo.
+        
+        Returns:
+            line_ids de las aristas que se eliminarán con el nodo, o None
+            si el nodo ya estaba marcado
+        """
+        if node_id in self.removed_nodes:
+            return None
+        graph = self.graph
+        self.removed_nodes[node_id] = None
+        
+        line_ids = []
+        for neighbor in graph.adjacency[node_id]:
+            key = edge_key(node_id, neighbor)
+            if key not in self.removed_edges:
+                line_ids.append(graph._edge_lines[key])
+        # Las aristas pendientes del nodo ya no se crearán
+        for key in self._added_by_node.pop(node_id, ()):
+            edge = self.added_edges.pop(key, None)
+            if edge is not None:
+                line_ids.append(edge[2])
+        return line_ids
+    
+    def rollback(self):
+        """Deshace los nodos agregados; el resto de los cambios se descarta."""
+        graph = self.graph
+        graph._detach()
+        for node_id in self.added_nodes:
+            data = graph.nodes.pop(node_id)
+            del graph.label_index[data['label']]
+            del graph.adjacency[node_id]
+            graph._components.discard(node_id)
+            graph._spatial.remove(node_id)
+    
+    def commit(self):
+        """
+        Aplica todos los cambios pendientes en una pasada.
+        
+        Returns:
+            GraphChange con el resumen de los cambios
+        """
+        graph = self.graph
+        graph._detach()
+        adjacency = graph.adjacency
+        edge_lines = graph._edge_lines
+        components = graph._components
+        removed_nodes = self.removed_nodes
+        
+        # Aristas previas que desaparecen: las marcadas y las de nodos eliminados
+        gone = {key for key in self.removed_edges if key in edge_lines}
+        for node_id in removed_nodes:
+            for neighbor in adjacency[node_id]:
+                gone.add(edge_key(node_id, neighbor))
+        
+        removed_edges = []
+        if gone:
+            kept = []
+            for edge in graph.edges:
+                if edge_key(edge[0], edge[1]) in gone:
+                    removed_edges.append(edge)
+                else:
+                    kept.append(edge)
+            graph.edges[:] = kept
+            
+            # Filtrar una sola vez la adyacencia de cada nodo afectado
+            lost = {}
+            for n1, n2 in gone:
+                del edge_lines[(n1, n2)]
+                lost.setdefault(n1, set()).add(n2)
+                lost.setdefault(n2, set()).add(n1)
+            for node_id, neighbors in lost.items():
+                if node_id not in removed_nodes:
+                    graph._own(node_id)
+                    adjacency[node_id] = [n for n in adjacency[node_id] if n not in neighbors]
+                    components.mark_dirty(node_id)
+        
+        removed = []
+        for node_id in removed_nodes:
+            data = graph.nodes.pop(node_id)
+            del graph.label_index[data['label']]
+            del adjacency[node_id]
+            components.discard(node_id)
+            graph._spatial.remove(node_id)
+            removed.append((node_id, data))
+        
+        added_edges = list(self.added_edges.values())
+        for node1, node2, line_id in added_edges:
+            graph._own(node1)
+            graph._own(node2)
+            adjacency[node1].append(node2)
+            adjacency[node2].append(node1)
+            graph.edges.append((node1, node2, line_id))
+            edge_lines[edge_key(node1, node2)] = line_id
+            components.union(node1, node2)
+        
+        added_nodes = [node_id for node_id in self.added_nodes if node_id not in removed_nodes]
+        return GraphChange(added_nodes, removed, added_edges, removed_edges)
@@ -0,0 +1,100 @@
+"""Grilla 2D con obstáculos guardada en un bytearray."""
+
+import random
+
+
+class Grid:
+    """
+    Grilla de celdas libres y muros para BFS sobre laberintos.
+    
+    Las celdas se guardan fila por fila en un bytearray con un borde de
+    muros alrededor, así que los vecinos de la celda `i` son siempre
+    `i + offset` para cada offset de `neighbor_offsets`, sin comprobar
+    límites. Los índices de celda incluyen ese borde; `index` y `coords`
+    convierten desde y hacia coordenadas (x, y) de la grilla visible.
+    """
+    
+    def __init__(self, width, height):
+        """
+        Inicializa una grilla sin muros.
+        
+        Args:
+            width: Cantidad de columnas
+            height: Cantidad de filas
+        """
+        if width < 1 or height < 1:
+            raise ValueError("La grilla debe tener al menos una celda")
+        self.width = width
+        self.height = height
+        self.stride = width + 2
+        self.size = self.stride * (height + 2)
+        # 4-vecindad: arriba, derecha, abajo, izquierda
+        self.neighbor_offsets = (-self.stride, 1, self.stride, -1)
+        self.cells = bytearray(self.size)
+        self.clear()
+    
+    def index(self, x, y):
+        """Retorna el índice de la celda en la columna x, fila y."""
+        return (y + 1) * self.stride + x + 1
+    
+    def coords(self, index):
+        """Retorna las coordenadas (x, y) de un índice de celda."""
+        y, x = divmod(index, self.stride)
+        return x - 1, y - 1
+    
+    def contains(self, x, y):
+        """Retorna True si (x, y) está dentro de la grilla."""
+        return 0 <= x < self.width and 0 <= y < self.height
+    
+    def is_wall(self, index):
+        """Retorna True si la celda es un muro (o parte del borde)."""
+        return self.cells[index] != 0
+    
+    def set_wall(self, index, wall=True):
+        """Marca o desmarca una celda como muro."""
+        self.cells[index] = 1 if wall else 0
+    
+    def clear(self):
+        """Elimina todos los muros, conservando el borde."""
+        stride = self.stride
+        self.cells[:] = bytes(self.size)
+        self.cells[:stride] = b'\x01' * stride
+        self.cells[-stride:] = b'\x01' * stride
+        self.cells[::stride] = b'\x01' * (self.height + 2)
+        self.cells[stride - 1::stride] = b'\x01' * (self.height + 2)
+    
+    def randomize(self, density, rng=None):
+        """
+        Coloca muros al azar.
+        
+        Args:
+            density: Probabilidad de que cada celda sea muro (0 a 1)
+            rng: Generador random.Random (por defecto, el global)
+        """
+        rng = rng or random
+        self.clear()
+        threshold = int(density * 256)
+        # Tabla byte aleatorio -> 1 (muro) o 0 (libre)
+        table = bytes(1 if value < threshold else 0 for value in range(256))
+        for y in range(self.height):
+            start = self.index(0, y)
+            row = _random_bytes(rng, self.width)
+            self.cells[start:start + self.width] = row.translate(table)
+    
+    def wall_rows(self):
+        """
+        Genera las filas como bytes de la grilla visible (1 = muro).
+        
+        Yields:
+            Tuplas (y, bytes de la fila sin borde)
+        """
+        for y in range(self.height):
+            start = self.index(0, y)
+            yield y, bytes(self.cells[start:start + self.width])
+
+
+def _random_bytes(rng, count):
+    """Genera `count` bytes aleatorios con el generador dado."""
+    if hasattr(rng, 'randbytes'):
+        return rng.randbytes(count)
+    return bytes(rng.getrandbits(8) for _ in range(count))
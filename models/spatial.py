@@ -0,0 +1,82 @@
+"""Índice espacial incremental para encontrar nodos por posición."""
+
+
+class SpatialHash:
+    """
+    Reparte puntos en celdas cuadradas de una grilla uniforme.
+    
+    Insertar, mover o quitar un punto cuesta O(1): al mover solo se
+    cambia de celda si el punto cruza un borde. Una consulta revisa
+    únicamente las celdas que cubren el círculo buscado, así que su costo
+    depende de la densidad local y no de la cantidad total de puntos.
+    """
+    
+    def __init__(self, cell_size=64):
+        """
+        Inicializa el índice vacío.
+        
+        Args:
+            cell_size: Lado de cada celda; conviene que sea del orden del
+                radio de las consultas
+        """
+        self.cell_size = cell_size
+        self.cells = {}   # {(columna, fila): set de IDs}
+        self._cell_of = {}  # {ID: (columna, fila)}
+    
+    def _cell(self, x, y):
+        """Retorna la celda que contiene el punto (x, y)."""
+        size = self.cell_size
+        return (int(x // size), int(y // size))
+    
+    def insert(self, item, x, y):
+        """Agrega un punto."""
+        cell = self._cell(x, y)
+        self._cell_of[item] = cell
+        self.cells.setdefault(cell, set()).add(item)
+    
+    def remove(self, item):
+        """Quita un punto (no hace nada si no está)."""
+        cell = self._cell_of.pop(item, None)
+        if cell is None:
+            return
+        members = self.cells[cell]
+        members.discard(item)
+        if not members:
+            del self.cells[cell]
+    
+    def move(self, item, x, y):
+        """Actualiza la posición de un punto."""
+        cell = self._cell(x, y)
+        old = self._cell_of.get(item)
+        if old == cell:
+            return
+        if old is not None:
+            self.remove(item)
+        self._cell_of[item] = cell
+        self.cells.setdefault(cell, set()).add(item)
+    
+    def clear(self):
+        """Quita todos los puntos."""
+        self.cells.clear()
+        self._cell_of.clear()
+    
+    def near(self, x, y, radius):
+        """
+        Retorna los puntos de las celdas que tocan un círculo.
+        
+        Args:
+            x, y: Centro de la búsqueda
+            radius: Radio de la búsqueda
+            
+        Returns:
+            Lista de IDs candidatos; el llamador verifica la distancia exacta
+        """
+        size = self.cell_size
+        cells = self.cells
+        found = []
+        for column in range(int((x - radius) // size), int((x + radius) // size) + 1):
+            for row in range(int((y - radius) // size), int((y + radius) // size) + 1):
+                members = cells.get((column, row))
+                if members:
+                    found.extend(members)
+        return found
@@ -0,0 +1,268 @@
+"""Línea de tiempo de un recorrido BFS con acceso aleatorio a cualquier paso."""
+
+from collections import deque, namedtuple
+
+
+# Delta reversible de un paso: estado previo y nuevo del nodo y de la arista
+# afectados, más el cambio en la cola ('pop' en la cabeza, 'push' en la cola).
+StepDelta = namedtuple(
+    'StepDelta',
+    ['node', 'prev_state', 'new_state', 'edge', 'prev_edge_state', 'new_edge_state', 'queue_op']
+)
+
+
+def edge_key(node1, node2):
+    """Retorna la clave canónica (no dirigida) de una arista."""
+    return (node1, node2) if node1 <= node2 else (node2, node1)
+
+
+def step_changes(step):
+    """
+    Traduce un paso del BFS a los cambios de estado visual que produce.
+    
+    Args:
+        step: Tupla generada por generate_bfs_steps
+        
+    Returns:
+        Tupla (node_changes, edge_changes) con listas de (clave, estado)
+    """
+    kind = step[0]
+    if kind == 'visit':
+        return [(step[1], 'current')], []
+    if kind == 'enqueue':
+        return [(step[1], 'queued')], [(edge_key(step[2], step[1]), 'edge_traversed')]
+    if kind == 'done':
+        return [(step[1], 'visited')], []
+    if kind == 'root':
+        return [(step[1], 'queued')], []
+    return [], []
+
+
+class BFSTimeline:
+    """
+    Guarda los pasos de un BFS como deltas más keyframes periódicos.
+    
+    Cada keyframe contiene el estado completo de colores (nodos y aristas
+    que no están en su estado inicial) cada `keyframe_interval` pasos, de
+    modo que ir a cualquier posición cuesta a lo sumo reconstruir desde el
+    keyframe anterior más `keyframe_interval` deltas.
+    
+    Los estados son claves de COLORS ('unvisited', 'queued', 'current',
+    'visited' para nodos; 'edge', 'edge_traversed' para aristas).
+    
+    La cola tampoco se copia en cada paso: como es FIFO, en cualquier
+    posición es un tramo del registro de nodos encolados, y cada keyframe
+    guarda cuántos se habían encolado y desencolado hasta él. Los pasos
+    pueden venir sin la copia de la cola (`with_queues=False`).
+    """
+    
+    seekable = True  # Admite retroceder y saltar a cualquier paso
+    
+    def __init__(self, steps, start_node, keyframe_interval=256, complete=True):
+        """
+        Inicializa la línea de tiempo.
+        
+        Args:
+            steps: Lista de pasos generada por generate_bfs_steps
+            start_node: ID del nodo inicial (comienza en estado 'queued')
+            keyframe_interval: Cantidad de pasos entre keyframes
+            complete: False si todavía llegarán más pasos mediante extend()
+        """
+        self.steps = []
+        self.start_node = start_node
+        self.keyframe_interval = max(1, keyframe_interval)
+        self.complete = complete
+        
+        # Estado en la posición actual (solo lo que difiere del inicial)
+        self.node_states = {start_node: 'queued'}
+        self.edge_states = {}
+        self.position = 0
+        self.queue = deque([start_node])
+        
+        # deltas[i] = cambio reversible producido por steps[i]
+        # keyframes[k] = estado tras aplicar k * keyframe_interval pasos:
+        # (nodos, aristas, (encolados, desencolados))
+        self.deltas = []
+        self._pushed = [start_node]  # Nodos en el orden en que entraron a la cola
+        self._keyframes = [(dict(self.node_states), dict(self.edge_states), (1, 0))]
+        self._tail_nodes = dict(self.node_states)
+        self._tail_edges = {}
+        self._tail_pops = 0
+        self.extend(steps)
+    
+    def __len__(self):
+        """Retorna la cantidad total de pasos."""
+        return len(self.steps)
+    
+    def extend(self, steps):
+        """
+        Agrega pasos al final, calculando sus deltas y keyframes.
+        
+        Args:
+            steps: Pasos consecutivos a los ya registrados
+        """
+        nodes = self._tail_nodes
+        edges = self._tail_edges
+        pushed = self._pushed
+        for step in steps:
+            delta = _make_delta(step, nodes, edges)
+            self.steps.append(step)
+            self.deltas.append(delta)
+            if delta.node is not None:
+                nodes[delta.node] = delta.new_state
+            if delta.edge is not None:
+                edges[delta.edge] = delta.new_edge_state
+            if delta.queue_op == 'pop':
+                self._tail_pops += 1
+            elif delta.queue_op == 'push':
+                pushed.append(delta.node)
+            if len(self.steps) % self.keyframe_interval == 0:
+                self._keyframes.append((dict(nodes), dict(edges), (len(pushed), self._tail_pops)))
+    
+    def _state_at(self, position):
+        """
+        Reconstruye el estado en `position` desde el keyframe más cercano.
+        
+        Returns:
+            Tupla (estados de nodos, estados de aristas, cola)
+        """
+        k = position // self.keyframe_interval
+        nodes, edges, (pushes, pops) = self._keyframes[k]
+        nodes = dict(nodes)
+        edges = dict(edges)
+        for delta in self.deltas[k * self.keyframe_interval:position]:
+            if delta.node is not None:
+                nodes[delta.node] = delta.new_state
+            if delta.edge is not None:
+                edges[delta.edge] = delta.new_edge_state
+            if delta.queue_op == 'pop':
+                pops += 1
+            elif delta.queue_op == 'push':
+                pushes += 1
+        return nodes, edges, deque(self._pushed[pops:pushes])
+    
+    def is_finished(self):
+        """Retorna True si la posición está al final de la línea de tiempo."""
+        return self.position >= len(self.steps)
+    
+    def is_complete(self):
+        """Retorna True si se llegó al final y no llegarán más pasos."""
+        return self.complete and self.is_finished()
+    
+    def current_queue(self):
+        """Retorna la cola BFS en la posición actual."""
+        return self.queue
+    
+    def last_step(self):
+        """Retorna el último paso registrado, o None si no hay pasos."""
+        return self.steps[-1] if self.steps else None
+    
+    def delta_at(self, index):
+        """Retorna el StepDelta producido por el paso `index`."""
+        return self.deltas[index]
+    
+    def step_forward(self):
+        """
+        Avanza un paso en O(1).
+        
+        Returns:
+            Tupla (node_changes, edge_changes) a aplicar en el canvas
+        """
+        if self.is_finished():
+            return [], []
+        delta = self.deltas[self.position]
+        self.position += 1
+        
+        if delta.queue_op == 'pop':
+            self.queue.popleft()
+        elif delta.queue_op == 'push':
+            self.queue.append(delta.node)
+        return self._apply(delta.node, delta.new_state, delta.edge, delta.new_edge_state)
+    
+    def step_backward(self):
+        """
+        Retrocede un paso en O(1) deshaciendo su delta.
+        
+        Returns:
+            Tupla (node_changes, edge_changes) a aplicar en el canvas
+        """
+        if self.position == 0:
+            return [], []
+        self.position -= 1
+        delta = self.deltas[self.position]
+        
+        if delta.queue_op == 'pop':
+            self.queue.appendleft(delta.node)
+        elif delta.queue_op == 'push':
+            self.queue.pop()
+        return self._apply(delta.node, delta.prev_state, delta.edge, delta.prev_edge_state)
+    
+    def _apply(self, node, state, edge, edge_state):
+        """Actualiza el estado actual de un nodo y, si la hay, de una arista."""
+        if node is None:
+            return [], []
+        _set_state(self.node_states, node, state, 'unvisited')
+        if edge is None:
+            return [(node, state)], []
+        _set_state(self.edge_states, edge, edge_state, 'edge')
+        return [(node, state)], [(edge, edge_state)]
+    
+    def seek(self, position):
+        """
+        Salta a una posición arbitraria.
+        
+        Args:
+            position: Cantidad de pasos aplicados (0 a len(steps))
+            
+        Returns:
+            Tupla (node_changes, edge_changes) con la diferencia entre el
+            estado actual y el de la posición destino
+        """
+        position = max(0, min(position, len(self.steps)))
+        if position == self.position:
+            return [], []
+        
+        nodes, edges, queue = self._state_at(position)
+        node_changes = _diff_states(self.node_states, nodes, 'unvisited')
+        edge_changes = _diff_states(self.edge_states, edges, 'edge')
+        
+        self.node_states = nodes
+        self.edge_states = edges
+        self.position = position
+        self.queue = queue
+        return node_changes, edge_changes
+
+
+def _diff_states(current, target, default):
+    """Calcula los cambios necesarios para pasar de `current` a `target`."""
+    changes = [(key, state) for key, state in target.items() if current.get(key) != state]
+    changes.extend((key, default) for key in current if key not in target)
+    return changes
+
+
+def _set_state(states, key, state, default):
+    """Guarda un estado, omitiendo los que coinciden con el inicial."""
+    if state == default:
+        states.pop(key, None)
+    else:
+        states[key] = state
+
+
+def _make_delta(step, nodes, edges):
+    """Construye el StepDelta de un paso dado el estado previo."""
+    node_changes, edge_changes = step_changes(step)
+    if not node_changes:
+        # Pasos sin efecto visual (p. ej. 'stop'): delta vacío
+        return StepDelta(None, None, None, None, None, None, None)
+    node, new_state = node_changes[0]
+    queue_op = {'visit': 'pop', 'enqueue': 'push', 'root': 'push'}.get(step[0])
+    
+    edge = prev_edge_state = new_edge_state = None
+    if edge_changes:
+        edge, new_edge_state = edge_changes[0]
+        prev_edge_state = edges.get(edge, 'edge')
+    
+    return StepDelta(
+        node, nodes.get(node, 'unvisited'), new_state,
+        edge, prev_edge_state, new_edge_state, queue_op
+    )
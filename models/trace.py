@@ -0,0 +1,396 @@
+"""Formato binario compacto para guardar y reproducir trazas de BFS."""
+
+import mmap
+import struct
+from collections import deque
+
+from algorithms.bfs import STOP_EXHAUSTED, STOP_MAX_DEPTH, STOP_MAX_VISITED, STOP_TARGET
+from .timeline import _make_delta, _set_state
+
+
+# Estructura del archivo:
+#   cabecera: MAGIC, versión (1 byte), varint(nodo inicial)
+#   registros: varint((operando << 3) | código) y, según el código, un
+#       segundo varint
+#   pie: byte 0 (OP_END), cantidad de pasos (8 bytes little-endian), END_MAGIC
+# Las colas no se guardan: se reconstruyen al leer a partir de las
+# operaciones, igual que en el BFS original.
+MAGIC = b'BFST'
+END_MAGIC = b'TEND'
+VERSION = 1
+
+OP_END = 0
+OP_VISIT = 1        # operando: nodo visitado
+OP_ENQUEUE = 2      # operando: nodo encolado desde el último visitado
+OP_ENQUEUE_FROM = 3  # operando: nodo encolado; segundo varint: nodo de origen
+OP_DONE = 4         # sin operando: terminó el último visitado
+OP_DONE_NODE = 5    # operando: nodo terminado (si no es el último visitado)
+OP_ROOT = 6         # operando: raíz de un nuevo árbol del bosque
+OP_STOP = 7         # operando: motivo; segundo varint: nodo + 1 (0 = None)
+
+_STOP_CODES = {STOP_EXHAUSTED: 0, STOP_TARGET: 1, STOP_MAX_DEPTH: 2, STOP_MAX_VISITED: 3}
+_STOP_REASONS = {code: reason for reason, code in _STOP_CODES.items()}
+_FOOTER = struct.Struct('<BQ4s')
+
+
+def _encode_varint(value, out):
+    """Agrega `value` (entero >= 0) a `out` como varint LEB128."""
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _check_node(node):
+    """Valida que un nodo sea un ID entero no negativo."""
+    if not isinstance(node, int) or node < 0:
+        raise ValueError(f"La traza solo admite IDs de nodo enteros >= 0, no {node!r}")
+    return node
+
+
+class TraceWriter:
+    """
+    Escribe una traza de BFS paso a paso, sin guardarla en memoria.
+    
+    Los registros se acumulan en un búfer de tamaño fijo que se vuelca al
+    archivo cuando se llena. El pie con la cantidad de pasos se escribe al
+    cerrar; una traza sin pie (p. ej. por un corte) se puede leer igual
+    hasta el último registro completo.
+    """
+    
+    def __init__(self, path, start_node, buffer_size=1 << 16):
+        """
+        Crea el archivo y escribe la cabecera.
+        
+        Args:
+            path: Ruta del archivo a crear
+            start_node: ID del nodo inicial del BFS
+            buffer_size: Bytes acumulados antes de escribir en disco
+        """
+        self.count = 0
+        self.buffer_size = buffer_size
+        self._file = open(path, 'wb')
+        self._buffer = bytearray(MAGIC)
+        self._buffer.append(VERSION)
+        _encode_varint(_check_node(start_node), self._buffer)
+        self._last_visit = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def write(self, step):
+        """
+        Agrega un paso con el formato de generate_bfs_steps.
+        
+        Args:
+            step: Tupla ('visit' | 'enqueue' | 'done' | 'root' | 'stop', ...);
+                la cola del final se ignora
+        """
+        out = self._buffer
+        kind = step[0]
+        if kind == 'visit':
+            node = self._last_visit = _check_node(step[1])
+            _encode_varint(node << 3 | OP_VISIT, out)
+        elif kind == 'enqueue':
+            node = _check_node(step[1])
+            if step[2] == self._last_visit:
+                _encode_varint(node << 3 | OP_ENQUEUE, out)
+            else:
+                _encode_varint(node << 3 | OP_ENQUEUE_FROM, out)
+                _encode_varint(_check_node(step[2]), out)
+        elif kind == 'done':
+            if step[1] == self._last_visit:
+                out.append(OP_DONE)
+            else:
+                _encode_varint(_check_node(step[1]) << 3 | OP_DONE_NODE, out)
+        elif kind == 'root':
+            _encode_varint(_check_node(step[1]) << 3 | OP_ROOT, out)
+        elif kind == 'stop':
+            _encode_varint(_STOP_CODES[step[1]] << 3 | OP_STOP, out)
+            _encode_varint(0 if step[2] is None else _check_node(step[2]) + 1, out)
+        else:
+            raise ValueError(f"Paso desconocido: {kind!r}")
+        
+        self.count += 1
+        if len(out) >= self.buffer_size:
+            self._file.write(out)
+            out.clear()
+    
+    def write_steps(self, steps):
+        """Agrega todos los pasos de un iterable (p. ej. iter_bfs_steps)."""
+        for step in steps:
+            self.write(step)
+    
+    def close(self):
+        """Escribe el pie y cierra el archivo."""
+        if self._file.closed:
+            return
+        self._buffer.extend(_FOOTER.pack(OP_END, self.count, END_MAGIC))
+        self._file.write(self._buffer)
+        self._buffer.clear()
+        self._file.close()
+
+
+def write_trace(path, start_node, steps):
+    """
+    Guarda una secuencia de pasos en un archivo de traza.
+    
+    Args:
+        path: Ruta del archivo a crear
+        start_node: ID del nodo inicial
+        steps: Iterable de pasos; puede ser un generador
+        
+    Returns:
+        Cantidad de pasos escritos
+    """
+    with TraceWriter(path, start_node) as writer:
+        writer.write_steps(steps)
+    return writer.count
+
+
+class TraceReader:
+    """
+    Lee una traza binaria mediante mmap.
+    
+    El archivo no se copia a memoria: los pasos se decodifican al
+    recorrerlo, así que leer una traza de cualquier largo usa memoria
+    constante (más la cola, si se pide reconstruirla).
+    """
+    
+    def __init__(self, path):
+        """
+        Abre el archivo y valida la cabecera.
+        
+        Args:
+            path: Ruta del archivo de traza
+            
+        Raises:
+            ValueError: Si el archivo no es una traza válida
+        """
+        with open(path, 'rb') as f:
+            try:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise ValueError("El archivo de traza está vacío") from None
+        data = self._map
+        if len(data) < 6 or data[:4] != MAGIC:
+            self.close()
+            raise ValueError("No es un archivo de traza BFS")
+        if data[4] != VERSION:
+            self.close()
+            raise ValueError(f"Versión de traza no soportada: {data[4]}")
+        
+        self.start_node, self._data_start = _decode_varint(data, 5)
+        # Sin pie válido la traza quedó incompleta: se lee hasta donde llegue
+        self.step_count = None
+        self._data_end = len(data)
+        if len(data) - self._data_start >= _FOOTER.size:
+            end, count, magic = _FOOTER.unpack_from(data, len(data) - _FOOTER.size)
+            if end == OP_END and magic == END_MAGIC:
+                self.step_count = count
+                self._data_end = len(data) - _FOOTER.size
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def __iter__(self):
+        return self.iter_steps()
+    
+    @property
+    def size(self):
+        """Retorna el tamaño del archivo en bytes."""
+        return len(self._map)
+    
+    def iter_steps(self, with_queues=False):
+        """
+        Decodifica los pasos en orden.
+        
+        Args:
+            with_queues: Si es True, cada paso lleva al final una copia de la
+                cola, con el mismo formato que generate_bfs_steps. Si es
+                False, los pasos se entregan sin la cola:
+                ('visit', n), ('enqueue', n, origen), ('done', n),
+                ('root', n), ('stop', motivo, n)
+                
+        Yields:
+            Tuplas de pasos
+        """
+        data = self._map
+        pos = self._data_start
+        end = self._data_end
+        queue = deque([self.start_node]) if with_queues else None
+        last_visit = None
+        
+        while pos < end:
+            # Varint del registro, decodificado en línea por velocidad
+            value = data[pos]
+            pos += 1
+            if value & 0x80:
+                value &= 0x7F
+                shift = 7
+                while True:
+                    if pos >= end:
+                        return  # Registro truncado
+                    byte = data[pos]
+                    pos += 1
+                    value |= (byte & 0x7F) << shift
+                    if not byte & 0x80:
+                        break
+                    shift += 7
+            op = value & 7
+            operand = value >> 3
+            
+            if op == OP_VISIT:
+                last_visit = operand
+                if queue is None:
+                    yield ('visit', operand)
+                else:
+                    queue.popleft()
+                    yield ('visit', operand, list(queue))
+            elif op == OP_ENQUEUE or op == OP_ENQUEUE_FROM:
+                origin = last_visit
+                if op == OP_ENQUEUE_FROM:
+                    if pos >= end:
+                        return
+                    origin, pos = _decode_varint(data, pos)
+                if queue is None:
+                    yield ('enqueue', operand, origin)
+                else:
+                    queue.append(operand)
+                    yield ('enqueue', operand, origin, list(queue))
+            elif op == OP_DONE or op == OP_DONE_NODE:
+                node = last_visit if op == OP_DONE else operand
+                yield ('done', node) if queue is None else ('done', node, list(queue))
+            elif op == OP_ROOT:
+                if queue is None:
+                    yield ('root', operand)
+                else:
+                    queue.append(operand)
+                    yield ('root', operand, list(queue))
+            elif op == OP_STOP:
+                if pos >= end:
+                    return
+                node, pos = _decode_varint(data, pos)
+                step = ('stop', _STOP_REASONS.get(operand, STOP_EXHAUSTED), node - 1 if node else None)
+                yield step if queue is None else step + (list(queue),)
+            else:
+                raise ValueError(f"Código de operación inválido en el byte {pos - 1}")
+    
+    def close(self):
+        """Libera el mapeo del archivo."""
+        if not self._map.closed:
+            self._map.close()
+
+
+def _decode_varint(data, pos):
+    """Decodifica un varint LEB128; retorna (valor, posición siguiente)."""
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+
+
+class TracePlayback:
+    """
+    Reproduce una traza hacia adelante con memoria constante.
+    
+    Ofrece la parte de la interfaz de BFSTimeline que usa la animación
+    (step_forward, current_queue, position...), pero sin guardar los pasos
+    ni sus deltas: solo el estado actual de colores y la cola. Por eso no
+    permite retroceder ni saltar a un paso (`seekable` es False).
+    """
+    
+    seekable = False
+    
+    def __init__(self, reader):
+        """
+        Inicializa la reproducción al comienzo de la traza.
+        
+        Args:
+            reader: TraceReader abierto; se cierra al llegar al final
+        """
+        self.reader = reader
+        self.start_node = reader.start_node
+        self.complete = True
+        self.position = 0
+        self.node_states = {reader.start_node: 'queued'}
+        self.edge_states = {}
+        self.queue = deque([reader.start_node])
+        self._steps = reader.iter_steps()
+        self._next = next(self._steps, None)
+        self._last_step = None
+        self._last_delta = None
+    
+    def __len__(self):
+        """Retorna la cantidad total de pasos (o los leídos si no se conoce)."""
+        if self.reader.step_count is not None:
+            return self.reader.step_count
+        return self.position
+    
+    def is_finished(self):
+        """Retorna True si ya no quedan pasos por reproducir."""
+        return self._next is None
+    
+    def is_complete(self):
+        """Retorna True si se llegó al final de la traza."""
+        return self.is_finished()
+    
+    def current_queue(self):
+        """Retorna la cola BFS en la posición actual."""
+        return self.queue
+    
+    def last_step(self):
+        """Retorna el último paso reproducido, o None."""
+        return self._last_step
+    
+    def delta_at(self, index):
+        """Retorna el delta del último paso reproducido (el único que se conserva)."""
+        if index != self.position - 1:
+            raise IndexError("La reproducción de una traza solo conserva el último delta")
+        return self._last_delta
+    
+    def step_forward(self):
+        """
+        Avanza un paso.
+        
+        Returns:
+            Tupla (node_changes, edge_changes) a aplicar en el canvas
+        """
+        step = self._next
+        if step is None:
+            return [], []
+        self._next = next(self._steps, None)
+        if self._next is None:
+            self.reader.close()
+        
+        delta = _make_delta(step, self.node_states, self.edge_states)
+        self.position += 1
+        self._last_step = step
+        self._last_delta = delta
+        
+        if delta.queue_op == 'pop':
+            self.queue.popleft()
+        elif delta.queue_op == 'push':
+            self.queue.append(delta.node)
+        if delta.node is None:
+            return [], []
+        _set_state(self.node_states, delta.node, delta.new_state, 'unvisited')
+        if delta.edge is None:
+            return [(delta.node, delta.new_state)], []
+        _set_state(self.edge_states, delta.edge, delta.new_edge_state, 'edge')
+        return [(delta.node, delta.new_state)], [(delta.edge, delta.new_edge_state)]
+    
+    def close(self):
+        """Libera el archivo de la traza."""
+        self.reader.close()
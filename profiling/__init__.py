@@ -0,0 +1,5 @@
+"""Instrumentación de rendimiento para BFS Visualizer."""
+
+from .recorder import PROFILER, PerfRecorder, profiled
+
+__all__ = ['PROFILER', 'PerfRecorder', 'profiled']
@@ -0,0 +1,188 @@
+"""Registro de métricas de rendimiento de los caminos críticos."""
+
+import threading
+import time
+from collections import deque
+from functools import wraps
+
+
+class PerfRecorder:
+    """
+    Acumula métricas de la animación, el canvas y el grafo.
+    
+    Mientras `enabled` es False los ganchos solo consultan ese atributo y
+    los métodos decorados con `profiled` son las funciones originales, así
+    que la instrumentación no tiene costo apreciable. Las muestras por
+    cuadro se guardan en ventanas acotadas de tamaño `window`. Los
+    temporizadores se protegen con un lock porque también los alimenta el
+    hilo del StepProducer.
+    """
+    
+    def __init__(self, window=2000):
+        """
+        Inicializa el registro vacío y deshabilitado.
+        
+        Args:
+            window: Cantidad máxima de muestras por cuadro que se conservan
+        """
+        self._enabled = False
+        self._profiled = []  # (clase, atributo, función, envoltura)
+        self.window = window
+        self._timers_lock = threading.Lock()
+        self.reset()
+    
+    @property
+    def enabled(self):
+        """True si se están registrando métricas."""
+        return self._enabled
+    
+    @enabled.setter
+    def enabled(self, value):
+        """Habilita o deshabilita el registro e intercambia los métodos medidos."""
+        value = bool(value)
+        if value == self._enabled:
+            return
+        self._enabled = value
+        for owner, attr, func, wrapper in self._profiled:
+            setattr(owner, attr, wrapper if value else func)
+    
+    def reset(self):
+        """Descarta todas las muestras y contadores."""
+        self.frame_times = deque(maxlen=self.window)   # ms de render por cuadro
+        self.frame_stamps = deque(maxlen=self.window)  # perf_counter de cada cuadro
+        self.frame_steps = deque(maxlen=self.window)   # pasos aplicados por cuadro
+        self.scheduler_lags = deque(maxlen=self.window)  # ms de retraso de `after`
+        self.frame_tk_calls = deque(maxlen=self.window)  # llamadas a Tk por cuadro
+        self.counters = {}  # {nombre: cantidad}
+        with self._timers_lock:
+            self.timers = {}    # {nombre: [llamadas, segundos]}
+        self._tk_calls = 0
+    
+    def count(self, name, amount=1):
+        """Incrementa un contador con nombre."""
+        self.counters[name] = self.counters.get(name, 0) + amount
+    
+    def count_tk_calls(self, amount=1):
+        """Registra llamadas emitidas a Tk (se atribuyen al cuadro en curso)."""
+        self._tk_calls += amount
+        self.count('tk_calls', amount)
+    
+    def add_time(self, name, seconds):
+        """Acumula tiempo para un temporizador con nombre (desde cualquier hilo)."""
+        with self._timers_lock:
+            timer = self.timers.setdefault(name, [0, 0.0])
+            timer[0] += 1
+            timer[1] += seconds
+    
+    def record_frame(self, render_seconds, lag_seconds=0.0, steps=1):
+        """
+        Registra un cuadro de la animación.
+        
+        Args:
+            render_seconds: Tiempo que tomó aplicar el cuadro
+            lag_seconds: Retraso entre el disparo previsto y el real de `after`
+            steps: Cantidad de pasos del BFS aplicados en el cuadro
+        """
+        self.frame_times.append(render_seconds * 1000)
+        self.frame_stamps.append(time.perf_counter())
+        self.frame_steps.append(steps)
+        self.scheduler_lags.append(max(0.0, lag_seconds) * 1000)
+        self.frame_tk_calls.append(self._tk_calls)
+        self._tk_calls = 0
+    
+    def summary(self, span=1.0):
+        """
+        Resume las métricas recientes.
+        
+        Args:
+            span: Ventana en segundos para calcular FPS y pasos por segundo
+            
+        Returns:
+            Diccionario con fps, steps_per_second, p50_ms, p99_ms, lag_ms,
+            tk_calls_per_frame y los temporizadores acumulados
+        """
+        now = time.perf_counter()
+        recent = [i for i, stamp in enumerate(self.frame_stamps) if now - stamp <= span]
+        times = sorted(self.frame_times)
+        lags = self.scheduler_lags
+        calls = self.frame_tk_calls
+        with self._timers_lock:
+            timers = {name: {'calls': c, 'seconds': s} for name, (c, s) in self.timers.items()}
+        return {
+            'fps': len(recent) / span,
+            'steps_per_second': sum(self.frame_steps[i] for i in recent) / span,
+            'p50_ms': _percentile(times, 50),
+            'p99_ms': _percentile(times, 99),
+            'lag_ms': sum(lags) / len(lags) if lags else 0.0,
+            'tk_calls_per_frame': sum(calls) / len(calls) if calls else 0.0,
+            'timers': timers,
+        }
+    
+    def dump(self, path):
+        """Guarda el resumen y las muestras crudas en un archivo JSON."""
+        import json  # Solo se necesita al exportar; no retrasa el arranque
+        
+        data = {
+            'summary': self.summary(),
+            'counters': dict(self.counters),
+            'frames': {
+                'render_ms': list(self.frame_times),
+                'stamps': list(self.frame_stamps),
+                'steps': list(self.frame_steps),
+                'lag_ms': list(self.scheduler_lags),
+                'tk_calls': list(self.frame_tk_calls),
+            },
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+
+
+def _percentile(sorted_values, percent):
+    """Retorna el percentil de una lista ya ordenada (0 si está vacía)."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * percent / 100))
+    return sorted_values[index]
+
+
+# Instancia compartida por toda la aplicación
+PROFILER = PerfRecorder()
+
+
+def profiled(name):
+    """
+    Decorador de métodos que acumula su tiempo en PROFILER.timers.
+    
+    La elección se hace al definir la clase y al cambiar
+    PROFILER.enabled: con el perfilador deshabilitado la clase tiene la
+    función original, sin envoltura; al habilitarlo se reemplaza por la
+    versión que mide el tiempo.
+    """
+    def decorator(func):
+        return _ProfiledMethod(name, func)
+    return decorator
+
+
+class _ProfiledMethod:
+    """Marcador que, al crearse la clase, se reemplaza por el método que corresponde."""
+    
+    def __init__(self, name, func):
+        """Guarda el nombre del temporizador y la función decorada."""
+        self.name = name
+        self.func = func
+    
+    def __set_name__(self, owner, attr):
+        """Registra el método en PROFILER y deja en la clase la versión vigente."""
+        name = self.name
+        func = self.func
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                PROFILER.add_time(name, time.perf_counter() - start)
+        
+        PROFILER._profiled.append((owner, attr, func, wrapper))
+        setattr(owner, attr, wrapper if PROFILER.enabled else func)
@@ -0,0 +1,10 @@
+"""Servidor local de consultas BFS con árboles en caché."""
+
+from .cache import BFSTree, BFSTreeCache
+from .loader import csr_from_edges, csr_from_graph, load_graph
+from .server import QueryError, QueryServer, serve_stream, serve_unix
+
+__all__ = [
+    'BFSTree', 'BFSTreeCache', 'csr_from_edges', 'csr_from_graph', 'load_graph',
+    'QueryError', 'QueryServer', 'serve_stream', 'serve_unix'
+]
@@ -0,0 +1,50 @@
+"""
+Línea de comandos del servidor de consultas BFS.
+
+Uso:
+    python -m service grafo.txt
+    python -m service grafo.json --socket /tmp/bfs.sock --cache 256
+"""
+
+import argparse
+import sys
+import time
+
+from .loader import load_graph
+from .server import QueryServer, serve_stream, serve_unix
+
+
+def main(argv=None):
+    """Punto de entrada de la línea de comandos."""
+    parser = argparse.ArgumentParser(prog='python -m service')
+    parser.add_argument('graph', help='archivo del grafo (.json o lista de aristas)')
+    parser.add_argument('--socket', help='atender en un socket Unix en lugar de stdin/stdout')
+    parser.add_argument('--cache', type=int, default=64, help='árboles BFS en caché')
+    args = parser.parse_args(argv)
+    
+    start = time.perf_counter()
+    try:
+        csr = load_graph(args.graph)
+    except (OSError, ValueError) as e:
+        print(f"No se pudo cargar el grafo: {e}", file=sys.stderr)
+        return 1
+    server = QueryServer(csr, cache_size=args.cache)
+    print(
+        f"Grafo cargado: {csr.node_count} nodos, {len(csr.targets) // 2} aristas "
+        f"({time.perf_counter() - start:.2f} s)",
+        file=sys.stderr
+    )
+    
+    try:
+        if args.socket:
+            print(f"Escuchando en {args.socket}", file=sys.stderr)
+            serve_unix(server, args.socket)
+        else:
+            serve_stream(server, sys.stdin, sys.stdout)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,193 @@
+"""Árboles BFS por origen con caché LRU."""
+
+from array import array
+from collections import OrderedDict
+
+from algorithms.bfs_tree import TreeIndex
+
+
+class BFSTree:
+    """
+    Resultado completo de un BFS sobre un CSRGraph desde un origen.
+    
+    Se guarda en arrays compactos (12 bytes por nodo): distancias, padres
+    y el orden de descubrimiento. Como el orden de BFS va por niveles,
+    `level_ends[k]` marca dónde termina el nivel k en `order`, y el
+    vecindario a k saltos es un prefijo de `order`. La tabla de binary
+    lifting para ancestros se construye recién con la primera consulta
+    que la necesita.
+    """
+    
+    __slots__ = ('source', 'dist', 'parent', 'order', 'level_ends', '_ancestry')
+    
+    def __init__(self, csr, source):
+        """
+        Ejecuta el BFS.
+        
+        Args:
+            csr: Objeto CSRGraph
+            source: Índice del nodo origen
+        """
+        offsets = csr.offsets
+        targets = csr.targets
+        dist = array('i', [-1]) * csr.node_count
+        parent = array('i', [-1]) * csr.node_count
+        order = array('i', [source])
+        dist[source] = 0
+        level_ends = [1]
+        
+        head = 0
+        depth = 0
+        while head < len(order):
+            depth += 1
+            level_end = len(order)
+            while head < level_end:
+                current = order[head]
+                head += 1
+                for neighbor in targets[offsets[current]:offsets[current + 1]]:
+                    if dist[neighbor] < 0:
+                        dist[neighbor] = depth
+                        parent[neighbor] = current
+                        order.append(neighbor)
+            if len(order) > level_end:
+                level_ends.append(len(order))
+        
+        self.source = source
+        self.dist = dist
+        self.parent = parent
+        self.order = order
+        self.level_ends = level_ends
+        self._ancestry = None
+    
+    @property
+    def depth(self):
+        """Retorna la profundidad máxima alcanzada."""
+        return len(self.level_ends) - 1
+    
+    def distance(self, target):
+        """Retorna la distancia al índice `target`, o None si no es alcanzable."""
+        d = self.dist[target]
+        return d if d >= 0 else None
+    
+    def path(self, target):
+        """
+        Reconstruye el camino más corto desde el origen.
+        
+        Returns:
+            Lista de índices desde el origen hasta `target`, o None si no
+            es alcanzable
+        """
+        if self.dist[target] < 0:
+            return None
+        path = [target]
+        while target != self.source:
+            target = self.parent[target]
+            path.append(target)
+        path.reverse()
+        return path
+    
+    def ancestry(self):
+        """Retorna el TreeIndex con binary lifting del árbol (lo construye una vez)."""
+        if self._ancestry is None:
+            self._ancestry = TreeIndex(self.parent, self.dist)
+        return self._ancestry
+    
+    def lca(self, a, b):
+        """Retorna el ancestro común más bajo de dos índices, o None si alguno no es alcanzable."""
+        return self.ancestry().lca(a, b)
+    
+    def ancestor(self, target, k):
+        """Retorna el índice a k saltos de `target` hacia el origen, o None."""
+        return self.ancestry().ancestor(target, k)
+    
+    def within(self, k):
+        """Retorna los índices a distancia <= k del origen, en orden de BFS."""
+        if k < 0:
+            return array('i')
+        end = self.level_ends[min(k, len(self.level_ends) - 1)]
+        return self.order[:end]
+
+
+class BFSTreeCache:
+    """
+    Caché LRU de árboles BFS por nodo origen.
+    
+    Mantiene a lo sumo `capacity` árboles; al superarla descarta el usado
+    hace más tiempo. Cuenta aciertos, fallos y descartes para las
+    estadísticas del servidor.
+    """
+    
+    def __init__(self, csr, capacity=64):
+        """
+        Inicializa la caché vacía.
+        
+        Args:
+            csr: Objeto CSRGraph sobre el que se calculan los árboles
+            capacity: Cantidad máxima de árboles guardados
+        """
+        if capacity < 1:
+            raise ValueError("La capacidad de la caché debe ser al menos 1")
+        self.csr = csr
+        self.capacity = capacity
+        self._trees = OrderedDict()  # {índice origen: BFSTree}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __len__(self):
+        """Retorna la cantidad de árboles guardados."""
+        return len(self._trees)
+    
+    def __contains__(self, source):
+        """Retorna True si el árbol del origen está en la caché."""
+        return source in self._trees
+    
+    def peek(self, source):
+        """
+        Retorna el árbol de un origen si ya está calculado, sin calcularlo.
+        
+        Un acierto cuenta como uso reciente.
+        """
+        tree = self._trees.get(source)
+        if tree is not None:
+            self._trees.move_to_end(source)
+            self.hits += 1
+        return tree
+    
+    def get(self, source):
+        """
+        Retorna el árbol BFS de un origen, calculándolo si hace falta.
+        
+        Args:
+            source: Índice del nodo origen
+            
+        Returns:
+            Objeto BFSTree
+        """
+        tree = self.peek(source)
+        if tree is not None:
+            return tree
+        
+        self.misses += 1
+        tree = BFSTree(self.csr, source)
+        self._trees[source] = tree
+        if len(self._trees) > self.capacity:
+            self._trees.popitem(last=False)
+            self.evictions += 1
+        return tree
+    
+    def clear(self):
+        """Descarta todos los árboles (los contadores se conservan)."""
+        self._trees.clear()
+    
+    def stats(self):
+        """Retorna un diccionario con el estado de la caché."""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._trees),
+            'capacity': self.capacity,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,102 @@
+"""Carga de grafos desde archivo a la forma compacta CSR."""
+
+import json
+from array import array
+
+from models.csr import CSRGraph
+
+
+def csr_from_edges(labels, edges):
+    """
+    Construye un CSRGraph no dirigido a partir de etiquetas y aristas.
+    
+    Args:
+        labels: Lista de etiquetas; la posición es el índice del nodo
+        edges: Iterable de pares (índice1, índice2); se ignoran lazos y
+            aristas repetidas
+            
+    Returns:
+        CSRGraph cuyos IDs son las etiquetas
+    """
+    adjacency = [set() for _ in labels]
+    for a, b in edges:
+        if a != b:
+            adjacency[a].add(b)
+            adjacency[b].add(a)
+    
+    offsets = array('q', [0])
+    targets = array('q')
+    for neighbors in adjacency:
+        targets.extend(sorted(neighbors))
+        offsets.append(len(targets))
+    return CSRGraph(list(labels), offsets, targets)
+
+
+def csr_from_graph(graph):
+    """
+    Convierte un Graph en un CSRGraph identificado por etiquetas.
+    
+    Args:
+        graph: Objeto Graph
+        
+    Returns:
+        CSRGraph cuyos IDs son las etiquetas de los nodos
+    """
+    csr = CSRGraph.from_graph(graph)
+    labels = [graph.nodes[node_id]['label'] for node_id in csr.ids]
+    return CSRGraph(labels, csr.offsets, csr.targets)
+
+
+def load_graph(path):
+    """
+    Carga un grafo desde un archivo.
+    
+    Se aceptan dos formatos:
+    - JSON: {"nodes": ["A", ...], "edges": [["A", "B"], ...]}; "nodes"
+      es opcional y sirve para declarar nodos aislados.
+    - Lista de aristas: una arista "A B" por línea; una etiqueta sola
+      declara un nodo aislado y las líneas que empiezan con '#' se ignoran.
+      
+    Args:
+        path: Ruta del archivo (.json para el formato JSON)
+        
+    Returns:
+        CSRGraph cuyos IDs son las etiquetas
+        
+    Raises:
+        ValueError: Si el archivo tiene un formato inválido
+    """
+    labels = []
+    index = {}
+    
+    def node(label):
+        """Retorna el índice de una etiqueta, creándolo si no existe."""
+        label = str(label)
+        i = index.get(label)
+        if i is None:
+            i = index[label] = len(labels)
+            labels.append(label)
+        return i
+    
+    edges = []
+    with open(path, encoding='utf-8') as f:
+        if str(path).endswith('.json'):
+            data = json.load(f)
+            for label in data.get('nodes', []):
+                node(label)
+            for pair in data.get('edges', []):
+                if len(pair) != 2:
+                    raise ValueError(f"Arista inválida: {pair!r}")
+                edges.append((node(pair[0]), node(pair[1])))
+        else:
+            for line_number, line in enumerate(f, 1):
+                fields = line.split()
+                if not fields or fields[0].startswith('#'):
+                    continue
+                if len(fields) > 2:
+                    raise ValueError(f"Línea {line_number}: se esperaban una o dos etiquetas")
+                ends = [node(label) for label in fields]
+                if len(ends) == 2:
+                    edges.append(tuple(ends))
+    
+    return csr_from_edges(labels, edges)
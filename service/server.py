@@ -0,0 +1,316 @@
+"""Servidor local de consultas BFS sobre líneas JSON."""
+
+import json
+import os
+import socketserver
+import threading
+import time
+from collections import deque
+
+from .cache import BFSTreeCache
+
+
+class QueryError(Exception):
+    """Error en una consulta; se responde al cliente sin cortar el servidor."""
+
+
+class QueryServer:
+    """
+    Responde consultas de distancia, camino y vecindario sobre un grafo fijo.
+    
+    El grafo se carga una sola vez y los árboles BFS por origen se guardan
+    en una caché LRU, así que las consultas repetidas desde el mismo nodo
+    solo leen arrays. Como el grafo es no dirigido, una consulta de
+    distancia o camino también se resuelve con el árbol del destino si es
+    ése el que está en caché.
+    
+    Cada consulta es un objeto JSON con un campo "op":
+        {"op": "distance", "source": "A", "target": "B"}
+        {"op": "path", "source": "A", "target": "B"}
+        {"op": "khop", "source": "A", "k": 2}
+        {"op": "lca", "source": "A", "a": "X", "b": "Y"}
+        {"op": "ancestor", "source": "A", "target": "X", "k": 2}
+        {"op": "batch", "queries": [...]}
+        {"op": "stats"}
+        {"op": "ping"}
+    Si la consulta trae un campo "id", la respuesta lo repite.
+    """
+    
+    def __init__(self, csr, cache_size=64, latency_window=10000):
+        """
+        Inicializa el servidor.
+        
+        Args:
+            csr: CSRGraph cuyos IDs son las etiquetas de los nodos
+            cache_size: Cantidad máxima de árboles BFS en caché
+            latency_window: Cantidad de latencias recientes que se conservan
+        """
+        self.csr = csr
+        self.cache = BFSTreeCache(csr, cache_size)
+        self.started = time.time()
+        self.queries = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.latencies = deque(maxlen=latency_window)  # segundos por línea
+        self._ops = {
+            'distance': self._distance,
+            'path': self._path,
+            'khop': self._khop,
+            'lca': self._lca,
+            'ancestor': self._ancestor,
+            'batch': self._batch,
+            'stats': lambda request: self.stats(),
+            'ping': lambda request: {},
+        }
+    
+    def _node(self, request, field):
+        """Retorna el índice del nodo nombrado en un campo de la consulta."""
+        if field not in request:
+            raise QueryError(f"Falta el campo '{field}'")
+        index = self.csr.index.get(str(request[field]))
+        if index is None:
+            raise QueryError(f"Nodo desconocido: {request[field]!r}")
+        return index
+    
+    def _pair_tree(self, request):
+        """
+        Obtiene un árbol que sirve para el par origen-destino.
+        
+        Returns:
+            Tupla (árbol, nodo del que se pide la información, invertido);
+            `invertido` es True si el árbol es el del destino
+        """
+        source = self._node(request, 'source')
+        target = self._node(request, 'target')
+        tree = self.cache.peek(source)
+        if tree is not None:
+            return tree, target, False
+        tree = self.cache.peek(target)
+        if tree is not None:
+            return tree, source, True
+        return self.cache.get(source), target, False
+    
+    def _distance(self, request):
+        """Distancia mínima en aristas (None si no hay camino)."""
+        tree, other, _ = self._pair_tree(request)
+        return {'distance': tree.distance(other)}
+    
+    def _path(self, request):
+        """Camino más corto como lista de etiquetas (None si no hay)."""
+        tree, other, reverse = self._pair_tree(request)
+        path = tree.path(other)
+        if path is None:
+            return {'path': None}
+        if reverse:
+            path.reverse()
+        ids = self.csr.ids
+        return {'path': [ids[i] for i in path]}
+    
+    def _int(self, request, field, default):
+        """Retorna un campo entero de la consulta."""
+        value = request.get(field, default)
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise QueryError(f"'{field}' debe ser un entero")
+        return value
+    
+    def _khop(self, request):
+        """Nodos a distancia <= k del origen, en orden de BFS."""
+        source = self._node(request, 'source')
+        k = self._int(request, 'k', 1)
+        nodes = self.cache.get(source).within(k)
+        ids = self.csr.ids
+        return {'count': len(nodes), 'nodes': [ids[i] for i in nodes]}
+    
+    def _lca(self, request):
+        """Ancestro común más bajo de dos nodos en el árbol BFS del origen."""
+        tree = self.cache.get(self._node(request, 'source'))
+        found = tree.lca(self._node(request, 'a'), self._node(request, 'b'))
+        return {'lca': self.csr.ids[found] if found is not None else None}
+    
+    def _ancestor(self, request):
+        """Nodo a k saltos del destino en su camino hacia el origen."""
+        tree = self.cache.get(self._node(request, 'source'))
+        found = tree.ancestor(self._node(request, 'target'), self._int(request, 'k', 1))
+        return {'ancestor': self.csr.ids[found] if found is not None else None}
+    
+    def _batch(self, request):
+        """
+        Resuelve una lista de consultas.
+        
+        Se procesan agrupadas por origen para que cada árbol se calcule una
+        vez aunque el lote tenga más orígenes que la capacidad de la
+        caché; las respuestas vuelven en el orden original.
+        """
+        queries = request.get('queries')
+        if not isinstance(queries, list):
+            raise QueryError("'queries' debe ser una lista")
+        order = sorted(
+            range(len(queries)),
+            key=lambda i: str(queries[i].get('source', '')) if isinstance(queries[i], dict) else ''
+        )
+        results = [None] * len(queries)
+        for i in order:
+            query = queries[i]
+            if isinstance(query, dict) and query.get('op') == 'batch':
+                results[i] = self._error(query, "No se admiten lotes anidados")
+            else:
+                results[i] = self.handle(query)
+        return {'results': results}
+    
+    def _error(self, request, message):
+        """Arma una respuesta de error."""
+        self.errors += 1
+        response = {'ok': False, 'error': message}
+        if isinstance(request, dict) and 'id' in request:
+            response['id'] = request['id']
+        return response
+    
+    def handle(self, request):
+        """
+        Responde una consulta ya decodificada.
+        
+        Args:
+            request: Diccionario con el campo "op"
+            
+        Returns:
+            Diccionario de respuesta con "ok" y los datos o el error
+        """
+        if not isinstance(request, dict):
+            return self._error(request, "La consulta debe ser un objeto JSON")
+        op = request.get('op')
+        if not isinstance(op, str):
+            return self._error(request, f"El campo 'op' debe ser un texto: {op!r}")
+        operation = self._ops.get(op)
+        if operation is None:
+            return self._error(request, f"Operación desconocida: {op!r}")
+        
+        self.queries += 1
+        try:
+            response = operation(request)
+        except QueryError as e:
+            return self._error(request, str(e))
+        except Exception as e:
+            # Un error inesperado en una consulta no debe cortar el servidor
+            return self._error(request, f"Error interno: {type(e).__name__}: {e}")
+        response['ok'] = True
+        if 'id' in request:
+            response['id'] = request['id']
+        return response
+    
+    def handle_line(self, line):
+        """
+        Responde una línea JSON.
+        
+        Args:
+            line: Texto con una consulta JSON
+            
+        Returns:
+            Texto JSON de la respuesta, sin salto de línea
+        """
+        start = time.perf_counter()
+        try:
+            request = json.loads(line)
+        except (ValueError, RecursionError) as e:
+            response = self._error(None, f"JSON inválido: {e}")
+        else:
+            response = self.handle(request)
+        text = json.dumps(response, ensure_ascii=False, separators=(',', ':'))
+        elapsed = time.perf_counter() - start
+        self.busy_seconds += elapsed
+        self.latencies.append(elapsed)
+        return text
+    
+    def stats(self):
+        """
+        Retorna métricas de rendimiento del servidor.
+        
+        Las latencias (en ms) se calculan sobre las últimas líneas
+        atendidas; el rendimiento se mide sobre el tiempo ocupado.
+        """
+        latencies = sorted(self.latencies)
+        
+        def percentile(p):
+            """Percentil p de las latencias recientes, en ms."""
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+        
+        return {
+            'nodes': self.csr.node_count,
+            'edges': len(self.csr.targets) // 2,
+            'uptime_s': time.time() - self.started,
+            'queries': self.queries,
+            'errors': self.errors,
+            'queries_per_s': self.queries / self.busy_seconds if self.busy_seconds else 0.0,
+            'latency_ms': {
+                'p50': percentile(0.50),
+                'p95': percentile(0.95),
+                'p99': percentile(0.99),
+                'max': latencies[-1] * 1000 if latencies else 0.0,
+            },
+            'cache': self.cache.stats(),
+        }
+
+
+def serve_stream(server, infile, outfile):
+    """
+    Atiende consultas línea a línea hasta el fin de la entrada.
+    
+    Args:
+        server: Objeto QueryServer
+        infile: Archivo de texto de entrada (p. ej. sys.stdin)
+        outfile: Archivo de texto de salida (p. ej. sys.stdout)
+    """
+    for line in infile:
+        if not line.strip():
+            continue
+        outfile.write(server.handle_line(line) + '\n')
+        outfile.flush()
+
+
+class _LineHandler(socketserver.StreamRequestHandler):
+    """Atiende una conexión de socket: una consulta JSON por línea."""
+    
+    def handle(self):
+        query_server = self.server.query_server
+        lock = self.server.query_lock
+        for raw in self.rfile:
+            try:
+                line = raw.decode('utf-8').strip()
+            except UnicodeDecodeError as e:
+                with lock:
+                    response = json.dumps(
+                        query_server._error(None, f"UTF-8 inválido: {e}"),
+                        ensure_ascii=False, separators=(',', ':')
+                    )
+                self.wfile.write(response.encode('utf-8') + b'\n')
+                continue
+            if not line:
+                continue
+            # La caché y los contadores no son seguros entre hilos
+            with lock:
+                response = query_server.handle_line(line)
+            self.wfile.write(response.encode('utf-8') + b'\n')
+
+
+def serve_unix(server, path):
+    """
+    Atiende consultas en un socket Unix hasta que se interrumpa.
+    
+    Cada conexión se atiende en su propio hilo, pero las consultas se
+    resuelven de a una para compartir la caché.
+    
+    Args:
+        server: Objeto QueryServer
+        path: Ruta del socket; se reemplaza si ya existe
+    """
+    if os.path.exists(path):
+        os.unlink(path)
+    with socketserver.ThreadingUnixStreamServer(path, _LineHandler) as socket_server:
+        socket_server.daemon_threads = True
+        socket_server.query_server = server
+        socket_server.query_lock = threading.Lock()
+        try:
+            socket_server.serve_forever()
+        finally:
+            os.unlink(path)
@@ -0,0 +1,32 @@
+"""Utilidades compartidas por las pruebas."""
+
+import random
+
+import pytest
+
+from models.graph import Graph
+
+
+def build_graph(node_count, edges):
+    """Construye un Graph con nodos 0..node_count-1 y las aristas dadas."""
+    graph = Graph()
+    for i in range(node_count):
+        graph.add_node(i * 10, 0, None, None)
+    for line_id, (n1, n2) in enumerate(edges):
+        graph.add_edge(n1, n2, line_id)
+    return graph
+
+
+def random_edges(node_count, edge_count, rng):
+    """Retorna aristas aleatorias sin lazos ni repetidas."""
+    edges = set()
+    while node_count > 1 and len(edges) < edge_count:
+        n1, n2 = rng.sample(range(node_count), 2)
+        edges.add((min(n1, n2), max(n1, n2)))
+    return sorted(edges)
+
+
+@pytest.fixture
+def rng():
+    """Generador aleatorio con semilla fija."""
+    return random.Random(0)
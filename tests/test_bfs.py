@@ -0,0 +1,61 @@
+"""Motivos de término del BFS animado y sin traza."""
+
+import pytest
+
+from algorithms.bfs import (
+    STOP_EXHAUSTED, STOP_MAX_DEPTH, STOP_MAX_VISITED, STOP_TARGET,
+    bfs_search, generate_bfs_steps,
+)
+from algorithms.engines import result_from_steps
+
+from .conftest import build_graph
+
+
+def path_graph(size):
+    """Camino 0 - 1 - ... - size-1."""
+    return build_graph(size, [(i, i + 1) for i in range(size - 1)])
+
+
+def stop_reason(steps):
+    """Motivo informado por una traza (exhausted si no hay paso 'stop')."""
+    return result_from_steps(steps, 0).stop_reason
+
+
+@pytest.mark.parametrize('limits, expected', [
+    ({}, STOP_EXHAUSTED),
+    ({'target': 2}, STOP_TARGET),
+    ({'max_depth': 1}, STOP_MAX_DEPTH),
+    ({'max_visited': 2}, STOP_MAX_VISITED),
+])
+def test_stop_reasons(limits, expected):
+    graph = path_graph(4)
+    assert bfs_search(graph, 0, **limits).stop_reason == expected
+    assert stop_reason(generate_bfs_steps(graph, 0, **limits)) == expected
+
+
+def test_limits_that_cut_nothing_report_exhausted():
+    graph = path_graph(2)
+    # El único vecino está a profundidad 1 y el presupuesto alcanza para todos
+    for limits in ({'max_depth': 1}, {'max_visited': 2}):
+        assert bfs_search(graph, 0, **limits).stop_reason == STOP_EXHAUSTED
+        assert stop_reason(generate_bfs_steps(graph, 0, **limits)) == STOP_EXHAUSTED
+    
+    single = build_graph(1, [])
+    assert bfs_search(single, 0, max_visited=1).stop_reason == STOP_EXHAUSTED
+    assert stop_reason(generate_bfs_steps(single, 0, max_visited=1)) == STOP_EXHAUSTED
+
+
+def test_target_at_start():
+    graph = path_graph(3)
+    result = bfs_search(graph, 0, target=0)
+    assert result.stop_reason == STOP_TARGET
+    assert result.order == [0]
+    assert generate_bfs_steps(graph, 0, target=0) == [('stop', STOP_TARGET, 0, [0])]
+
+
+def test_search_matches_steps():
+    graph = build_graph(6, [(0, 1), (0, 2), (1, 3), (2, 3), (3, 4)])
+    result = bfs_search(graph, 0)
+    assert result == result_from_steps(generate_bfs_steps(graph, 0), 0)
+    assert result.distances == {0: 0, 1: 1, 2: 1, 3: 2, 4: 3}
+    assert 5 not in result.distances
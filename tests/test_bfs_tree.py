@@ -0,0 +1,50 @@
+"""Consultas de ancestros con binary lifting."""
+
+import pytest
+
+from algorithms.bfs import bfs_search
+
+from .conftest import build_graph, random_edges
+
+
+def naive_ancestor(parents, node, k):
+    """Sube k padres uno a uno."""
+    for _ in range(k):
+        node = parents.get(node)
+        if node is None:
+            return None
+    return node
+
+
+def naive_lca(parents, a, b):
+    """Ancestro común más bajo comparando los caminos a la raíz."""
+    ancestors = set()
+    while a is not None:
+        ancestors.add(a)
+        a = parents[a]
+    while b not in ancestors:
+        b = parents[b]
+    return b
+
+
+@pytest.mark.parametrize('lifting', [True, False])
+def test_queries_match_naive(rng, lifting):
+    size = 120
+    graph = build_graph(size, random_edges(size, 150, rng))
+    result = bfs_search(graph, 0)
+    index = result.tree_index(lifting=lifting)
+    reached = sorted(result.parents)
+    for _ in range(300):
+        a, b = rng.choice(reached), rng.choice(reached)
+        k = rng.randint(0, 8)
+        assert index.lca(a, b) == naive_lca(result.parents, a, b)
+        assert index.ancestor(a, k) == naive_ancestor(result.parents, a, k)
+        assert index.depth(a) == result.distances[a]
+
+
+def test_unreached_nodes():
+    graph = build_graph(4, [(0, 1), (2, 3)])
+    index = bfs_search(graph, 0).tree_index()
+    assert index.lca(1, 3) is None
+    assert index.ancestor(1, 2) is None
+    assert index.path(1) == [0, 1]
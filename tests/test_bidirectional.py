@@ -0,0 +1,32 @@
+"""Camino más corto con BFS bidireccional."""
+
+from algorithms.bfs import bfs_search
+from algorithms.bidirectional import bidirectional_bfs
+
+from .conftest import build_graph, random_edges
+
+
+def test_same_node():
+    graph = build_graph(1, [])
+    assert bidirectional_bfs(graph, 0, 0).path == [0]
+
+
+def test_unreachable():
+    graph = build_graph(3, [(0, 1)])
+    assert bidirectional_bfs(graph, 0, 2).path is None
+
+
+def test_path_length_matches_bfs(rng):
+    for _ in range(50):
+        size = rng.randint(2, 40)
+        graph = build_graph(size, random_edges(size, rng.randint(0, 2 * size), rng))
+        source, target = rng.randrange(size), rng.randrange(size)
+        distances = bfs_search(graph, source).distances
+        path = bidirectional_bfs(graph, source, target, record_steps=True).path
+        if target not in distances:
+            assert path is None
+            continue
+        assert len(path) - 1 == distances[target]
+        assert path[0] == source and path[-1] == target
+        for a, b in zip(path, path[1:]):
+            assert b in graph.get_neighbors(a)
@@ -0,0 +1,53 @@
+"""Índice incremental de componentes conexas."""
+
+from models.components import ComponentIndex
+
+from .conftest import build_graph, random_edges
+
+
+def naive_count(graph):
+    """Cuenta componentes recorriendo el grafo."""
+    seen = set()
+    count = 0
+    for node_id in graph.nodes:
+        if node_id in seen:
+            continue
+        count += 1
+        stack = [node_id]
+        seen.add(node_id)
+        while stack:
+            for neighbor in graph.get_neighbors(stack.pop()):
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    stack.append(neighbor)
+    return count
+
+
+def test_union_and_rebuild():
+    adjacency = {1: [2], 2: [1, 3], 3: [2]}
+    index = ComponentIndex()
+    for node_id in adjacency:
+        index.add(node_id)
+    index.union(1, 2)
+    index.union(2, 3)
+    assert index.count(adjacency.get) == 1
+    
+    # Quitar la arista 2-3 separa la componente en la próxima consulta
+    adjacency = {1: [2], 2: [1], 3: []}
+    index.mark_dirty(2)
+    assert index.count(adjacency.get) == 2
+    assert index.resolve(1, adjacency.get) == index.resolve(2, adjacency.get)
+    assert index.resolve(1, adjacency.get) != index.resolve(3, adjacency.get)
+
+
+def test_graph_counts_match_naive(rng):
+    graph = build_graph(60, random_edges(60, 50, rng))
+    assert graph.component_count() == naive_count(graph)
+    for _ in range(40):
+        if rng.random() < 0.5 and graph.edges:
+            graph.remove_edge(rng.randrange(len(graph.edges)))
+        else:
+            graph.remove_node(rng.choice(sorted(graph.nodes)))
+        assert graph.component_count() == naive_count(graph)
+        node_id = rng.choice(sorted(graph.nodes))
+        assert node_id in graph.component_nodes(node_id)
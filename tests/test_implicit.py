@@ -0,0 +1,43 @@
+"""BFS implícito sobre funciones de vecinos."""
+
+from algorithms.bfs import STOP_EXHAUSTED, STOP_MAX_DEPTH, STOP_MAX_VISITED, STOP_TARGET
+from algorithms.implicit import implicit_bfs
+
+
+def line_neighbors(limit):
+    """Vecinos de los enteros 0..limit-1 en una recta."""
+    def neighbors(n):
+        return [m for m in (n - 1, n + 1) if 0 <= m < limit]
+    return neighbors
+
+
+def test_finds_shortest_path():
+    result = implicit_bfs(0, line_neighbors(10), target=4)
+    assert result.stop_reason == STOP_TARGET
+    assert result.found == 4
+    assert result.path == [0, 1, 2, 3, 4]
+    assert result.depth == 4
+
+
+def test_bitset_matches_set():
+    neighbors = line_neighbors(50)
+    plain = implicit_bfs(0, neighbors, target=lambda n: n == 37)
+    packed = implicit_bfs(0, neighbors, target=lambda n: n == 37, encode=lambda n: n, size=50)
+    assert plain == packed
+
+
+def test_stop_reasons():
+    neighbors = line_neighbors(10)
+    assert implicit_bfs(0, neighbors).stop_reason == STOP_EXHAUSTED
+    assert implicit_bfs(0, neighbors).visited_count == 10
+    assert implicit_bfs(0, neighbors, max_depth=3).stop_reason == STOP_MAX_DEPTH
+    assert implicit_bfs(0, neighbors, max_visited=3).stop_reason == STOP_MAX_VISITED
+    # Límites que no dejan estados sin descubrir
+    assert implicit_bfs(0, neighbors, max_depth=9).stop_reason == STOP_EXHAUSTED
+    assert implicit_bfs(0, neighbors, max_visited=10).stop_reason == STOP_EXHAUSTED
+
+
+def test_level_sizes():
+    result = implicit_bfs(5, line_neighbors(10))
+    assert result.level_sizes[:3] == [1, 2, 2]
+    assert sum(result.level_sizes) == 10
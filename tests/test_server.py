@@ -0,0 +1,77 @@
+"""Respuestas del servidor de consultas, incluidas las consultas mal formadas."""
+
+import json
+
+import pytest
+
+from service.loader import csr_from_edges
+from service.server import QueryServer
+
+
+@pytest.fixture
+def server():
+    """Servidor sobre el camino A - B - C y el nodo aislado D."""
+    return QueryServer(csr_from_edges(['A', 'B', 'C', 'D'], [(0, 1), (1, 2)]))
+
+
+def ask(server, line):
+    """Envía una línea y decodifica la respuesta."""
+    return json.loads(server.handle_line(line))
+
+
+def test_queries(server):
+    assert ask(server, '{"op":"distance","source":"A","target":"C","id":7}') == {
+        'distance': 2, 'ok': True, 'id': 7
+    }
+    assert ask(server, '{"op":"path","source":"C","target":"A"}')['path'] == ['C', 'B', 'A']
+    assert ask(server, '{"op":"distance","source":"A","target":"D"}')['distance'] is None
+    assert ask(server, '{"op":"khop","source":"B","k":1}')['count'] == 3
+    assert ask(server, '{"op":"lca","source":"A","a":"B","b":"C"}')['lca'] == 'B'
+
+
+@pytest.mark.parametrize('line', [
+    '{"op":[1]}',
+    '{"op":{"a":1}}',
+    '{"op":null}',
+    '{}',
+    '[1, 2]',
+    '"texto"',
+    '{"op":"nada"}',
+    '{"op":"distance","source":"A"}',
+    '{"op":"distance","source":"A","target":"Z"}',
+    '{"op":"khop","source":"A","k":"dos"}',
+    '{"op":"batch","queries":3}',
+    'no es json',
+    '[' * 100000,
+])
+def test_malformed_queries_get_errors(server, line):
+    response = ask(server, line)
+    assert response['ok'] is False
+    assert response['error']
+    # El servidor sigue atendiendo después del error
+    assert ask(server, '{"op":"ping"}') == {'ok': True}
+
+
+def test_unexpected_errors_become_responses(server, monkeypatch):
+    def broken(request):
+        raise RuntimeError('falla')
+    monkeypatch.setitem(server._ops, 'ping', broken)
+    response = ask(server, '{"op":"ping","id":1}')
+    assert response['ok'] is False
+    assert response['id'] == 1
+    assert 'RuntimeError' in response['error']
+
+
+def test_batch_keeps_order_and_reports_errors(server):
+    response = ask(server, json.dumps({'op': 'batch', 'queries': [
+        {'op': 'distance', 'source': 'C', 'target': 'A'},
+        {'op': [1]},
+        {'op': 'batch', 'queries': []},
+        {'op': 'distance', 'source': 'A', 'target': 'B'},
+    ]}))
+    results = response['results']
+    assert results[0]['distance'] == 2
+    assert results[1]['ok'] is False
+    assert results[2]['ok'] is False
+    assert results[3]['distance'] == 1
+    assert server.stats()['errors'] == 2
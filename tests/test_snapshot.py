@@ -0,0 +1,42 @@
+"""Instantáneas con copia en escritura."""
+
+from algorithms.bfs import bfs_search
+
+from .conftest import build_graph
+
+
+def test_snapshot_is_unchanged_by_edits():
+    graph = build_graph(4, [(0, 1), (1, 2)])
+    snapshot = graph.snapshot()
+    before = bfs_search(snapshot, 0)
+    
+    graph.add_edge(2, 3, 99)
+    graph.remove_edge(0)
+    graph.move_node(1, 500, 500)
+    new_node = graph.add_node(0, 0, None, None)
+    
+    assert bfs_search(snapshot, 0) == before
+    assert snapshot.get_neighbors(2) == [1]
+    assert snapshot.get_node(1)['x'] == 10
+    assert snapshot.get_node(new_node) is None
+    assert bfs_search(graph, 0).order == [0]
+    assert graph.get_neighbors(2) == [1, 3]
+
+
+def test_unchanged_graph_reuses_snapshot():
+    graph = build_graph(3, [(0, 1)])
+    snapshot = graph.snapshot()
+    assert graph.snapshot() is snapshot
+    graph.add_edge(1, 2, 5)
+    assert graph.snapshot() is not snapshot
+
+
+def test_successive_snapshots_are_independent():
+    graph = build_graph(3, [(0, 1)])
+    first = graph.snapshot()
+    graph.add_edge(1, 2, 1)
+    second = graph.snapshot()
+    graph.remove_node(2)
+    assert first.get_neighbors(1) == [0]
+    assert second.get_neighbors(1) == [0, 2]
+    assert graph.get_neighbors(1) == [0]
@@ -0,0 +1,62 @@
+"""Saltos en la línea de tiempo contra una reproducción completa."""
+
+from algorithms.bfs import generate_bfs_steps, iter_bfs_forest_steps, iter_bfs_steps
+from models.timeline import BFSTimeline
+
+from .conftest import build_graph, random_edges
+
+
+def replay(steps, start_node, position):
+    """Estado tras aplicar `position` pasos desde el inicio, de a uno."""
+    timeline = BFSTimeline(steps, start_node)
+    for _ in range(position):
+        timeline.step_forward()
+    return timeline.node_states, timeline.edge_states, list(timeline.queue)
+
+
+def check_seeks(steps, start_node, rng):
+    timeline = BFSTimeline(steps, start_node, keyframe_interval=7)
+    positions = [rng.randint(0, len(steps)) for _ in range(60)] + [len(steps), 0]
+    for position in positions:
+        timeline.seek(position)
+        expected = replay(steps, start_node, position)
+        assert (timeline.node_states, timeline.edge_states, list(timeline.queue)) == expected
+        if position:
+            assert list(timeline.queue) == steps[position - 1][-1]
+
+
+def test_seek_matches_replay(rng):
+    graph = build_graph(80, random_edges(80, 160, rng))
+    check_seeks(generate_bfs_steps(graph, 0), 0, rng)
+
+
+def test_seek_forest_matches_replay(rng):
+    graph = build_graph(60, random_edges(60, 30, rng))
+    check_seeks(list(iter_bfs_forest_steps(graph, 0)), 0, rng)
+
+
+def test_steps_without_queues(rng):
+    graph = build_graph(50, random_edges(50, 90, rng))
+    steps = generate_bfs_steps(graph, 0)
+    bare = list(iter_bfs_steps(graph, 0, with_queues=False))
+    full = BFSTimeline(steps, 0)
+    timeline = BFSTimeline([], 0, keyframe_interval=5, complete=False)
+    for i in range(0, len(bare), 13):
+        timeline.extend(bare[i:i + 13])
+    for position in (len(steps), 17, 3, len(steps) // 2):
+        full.seek(position)
+        timeline.seek(position)
+        assert list(timeline.queue) == list(full.queue)
+        assert timeline.node_states == full.node_states
+
+
+def test_step_backward_undoes_forward(rng):
+    graph = build_graph(30, random_edges(30, 50, rng))
+    steps = generate_bfs_steps(graph, 0)
+    timeline = BFSTimeline(steps, 0)
+    timeline.seek(len(steps))
+    while timeline.position:
+        timeline.step_backward()
+    assert timeline.node_states == {0: 'queued'}
+    assert timeline.edge_states == {}
+    assert list(timeline.queue) == [0]
@@ -0,0 +1,40 @@
+"""Ida y vuelta de las trazas binarias."""
+
+import pytest
+
+from algorithms.bfs import generate_bfs_steps, iter_bfs_forest_steps
+from models.trace import TraceReader, write_trace
+
+from .conftest import build_graph, random_edges
+
+
+def test_round_trip(tmp_path, rng):
+    # IDs grandes para ejercitar varints de varios bytes
+    graph = build_graph(300, random_edges(300, 500, rng))
+    for _ in range(300):
+        graph.add_node(0, 0, None, None)
+    graph.add_edge(0, 599, 10**6)
+    steps = generate_bfs_steps(graph, 0, max_visited=250)
+    path = tmp_path / 'bfs.trace'
+    assert write_trace(path, 0, steps) == len(steps)
+    
+    with TraceReader(path) as reader:
+        assert reader.start_node == 0
+        assert list(reader.iter_steps(with_queues=True)) == steps
+        assert list(reader.iter_steps()) == [step[:-1] for step in steps]
+
+
+def test_forest_round_trip(tmp_path, rng):
+    graph = build_graph(80, random_edges(80, 40, rng))
+    steps = list(iter_bfs_forest_steps(graph, 5))
+    path = tmp_path / 'forest.trace'
+    write_trace(path, 5, steps)
+    with TraceReader(path) as reader:
+        assert list(reader.iter_steps(with_queues=True)) == steps
+
+
+def test_rejects_invalid_file(tmp_path):
+    path = tmp_path / 'bad.trace'
+    path.write_bytes(b'no es una traza')
+    with pytest.raises(ValueError):
+        TraceReader(path)
@@ -1,7 +1,25 @@
 """Módulo de interfaz de usuario para BFS Visualizer."""
 
-from .app import BFSVisualizerApp
-from .control_panel import ControlPanel
-from .graph_canvas import GraphCanvas
+from importlib import import_module
+
+# Los submódulos importan tkinter; se cargan recién al acceder al atributo
+_LAZY_ATTRS = {
+    'BFSVisualizerApp': '.app',
+    'ControlPanel': '.control_panel',
+    'GraphCanvas': '.graph_canvas',
+}
 
 __all__ = ['BFSVisualizerApp', 'ControlPanel', 'GraphCanvas']
+
+
+def __getattr__(name):
+    """Importa el submódulo de un nombre exportado la primera vez que se usa."""
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_LAZY_ATTRS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
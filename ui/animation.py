@@ -0,0 +1,120 @@
+"""Controlador de animación para varios recorridos BFS con un reloj compartido."""
+
+from profiling import PROFILER
+from ui.graph_canvas import ops_script
+from ui.render_plan import RenderPlan
+
+
+class AnimationRun:
+    """
+    Un recorrido animado: su línea de tiempo, su cursor y su vista.
+    
+    La vista es cualquier objeto con `nodes` ({ID: {'circle_id', 'text_id'}})
+    y `edges` ([(n1, n2, line_id)]) cuyos IDs pertenecen al canvas
+    `canvas_path`; los pasos se compilan con un RenderPlan sobre esa vista.
+    """
+    
+    def __init__(self, name, timeline, view, canvas_path):
+        """
+        Inicializa el recorrido y compila sus pasos.
+        
+        Args:
+            name: Nombre para mostrar (p. ej. la etiqueta del nodo inicial)
+            timeline: BFSTimeline con los pasos ya generados
+            view: Nodos y aristas con los IDs de canvas de este recorrido
+            canvas_path: Nombre Tcl del canvas donde se dibuja
+        """
+        self.name = name
+        self.timeline = timeline
+        self.canvas_path = canvas_path
+        self.plan = RenderPlan(view)
+        self.plan.reset(timeline)
+        self.plan.extend(timeline.deltas)
+    
+    def is_finished(self):
+        """Retorna True si ya se mostraron todos los pasos."""
+        return self.timeline.is_finished()
+    
+    def advance(self):
+        """
+        Avanza un paso.
+        
+        Returns:
+            Script Tcl con los cambios del paso (vacío si no hay cambios)
+        """
+        timeline = self.timeline
+        if timeline.is_finished():
+            return ''
+        index = timeline.position
+        timeline.step_forward()
+        return ops_script(self.canvas_path, self.plan.step_ops(index))
+
+
+class AnimationController:
+    """
+    Anima N recorridos a la vez desde un único temporizador.
+    
+    En cada cuadro avanza un paso de cada recorrido sin terminar y aplica
+    los cambios de todos con un solo comando Tcl, así que agregar
+    recorridos no agrega callbacks de `after` ni llamadas a Tk.
+    """
+    
+    def __init__(self, widget, interval=500, on_frame=None):
+        """
+        Inicializa el controlador detenido y sin recorridos.
+        
+        Args:
+            widget: Widget de tkinter que provee `after` y el intérprete Tcl
+            interval: Milisegundos entre cuadros
+            on_frame: Función opcional que recibe la lista de recorridos
+                después de cada cuadro (p. ej. para actualizar etiquetas)
+        """
+        self.widget = widget
+        self.interval = interval
+        self.on_frame = on_frame
+        self.runs = []
+        self.frames = 0
+        self._after_id = None
+    
+    @property
+    def running(self):
+        """True mientras hay un cuadro programado."""
+        return self._after_id is not None
+    
+    def add_run(self, run):
+        """Agrega un recorrido; se anima desde el próximo cuadro."""
+        self.runs.append(run)
+    
+    def clear(self):
+        """Detiene la animación y quita todos los recorridos."""
+        self.stop()
+        self.runs = []
+        self.frames = 0
+    
+    def start(self):
+        """Arranca (o reanuda) el reloj compartido."""
+        if self._after_id is None and not self.is_finished():
+            self._after_id = self.widget.after(self.interval, self._tick)
+    
+    def stop(self):
+        """Detiene el reloj; los recorridos conservan su posición."""
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+    
+    def is_finished(self):
+        """Retorna True si todos los recorridos terminaron."""
+        return all(run.is_finished() for run in self.runs)
+    
+    def _tick(self):
+        """Avanza un paso de cada recorrido y los dibuja juntos."""
+        self._after_id = None
+        scripts = [script for script in (run.advance() for run in self.runs) if script]
+        if scripts:
+            self.widget.tk.eval('\n'.join(scripts))
+            if PROFILER.enabled:
+                PROFILER.count_tk_calls(1)
+        self.frames += 1
+        if self.on_frame is not None:
+            self.on_frame(self.runs)
+        self.start()
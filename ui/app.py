@@ -1,13 +1,30 @@
 """Aplicación principal del visualizador BFS."""
 
+import time
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import filedialog, messagebox
 
-from config.colors import COLORS, UI_COLORS
+from config.colors import COLORS, UI_COLORS, NODE_RADIUS
 from models.graph import Graph
-from algorithms.bfs import generate_bfs_steps
+from models.timeline import BFSTimeline, edge_key
+from models.trace import TracePlayback, TraceReader, write_trace
+from profiling import PROFILER
+from algorithms.bfs import STOP_MAX_DEPTH, STOP_MAX_VISITED, STOP_TARGET
+from algorithms.bidirectional import bidirectional_bfs
+from algorithms.engines import result_from_steps
+from algorithms.level_stats import LevelStatsRecorder
+from algorithms.producer import StepProducer
 from ui.control_panel import ControlPanel
 from ui.graph_canvas import GraphCanvas
+from ui.render_plan import RenderPlan
+
+
+# Texto mostrado cuando un límite detiene el BFS
+STOP_MESSAGES = {
+    STOP_MAX_DEPTH: "Se alcanzó la profundidad máxima",
+    STOP_TARGET: "Se encontró el nodo objetivo",
+    STOP_MAX_VISITED: "Se agotó el límite de nodos",
+}
 
 
 class BFSVisualizerApp:
@@ -28,13 +45,30 @@ class BFSVisualizerApp:
         
         # Modelo del grafo
         self.graph = Graph()
+        self.graph.add_listener(self._on_graph_change)
         
         # Estados de la aplicación
-        self.mode = 'idle'  # 'idle', 'add_node', 'add_edge', 'delete', 'select_start', 'running'
+        self.mode = 'idle'  # 'idle', 'add_node', 'add_edge', 'delete', 'move', 'select_start', 'select_path', 'running'
         self.edge_first_node = None
+        self._drag = None  # Nodo que se está arrastrando en modo 'move'
+        self.path_source = None
         self.bfs_running = False
         self.bfs_paused = False
         self.animation_speed = 500  # ms
+        self._timeline = None
+        self._traversal_graph = None  # Instantánea del grafo que recorre la línea de tiempo
+        self._render_plan = None  # Operaciones de canvas precompiladas por paso
+        self._level_stats = None  # Estadísticas por nivel del BFS (si se activaron)
+        self._bfs_tree = None  # (línea de tiempo, pasos, BFSTreeIndex) del último recorrido
+        self._tree_path = None  # Camino del árbol BFS resaltado en el canvas
+        self._tree_focus = None  # Último nodo consultado en el árbol BFS
+        self.play_direction = 1  # 1 hacia adelante, -1 hacia atrás
+        self._producer = None
+        self._after_id = None
+        self._expected_fire = 0.0  # perf_counter previsto del próximo `after`
+        self._grid_window = None
+        self._compare_window = None
+        self._layout = None  # Estado de la distribución automática en curso
         
         self._setup_ui()
     
@@ -55,9 +89,23 @@ class BFSVisualizerApp:
             'set_mode': self._set_mode,
             'clear_all': self._clear_all,
             'start_bfs': self._start_bfs_mode,
+            'start_path': self._start_path_mode,
             'reset_colors': self._reset_colors,
             'toggle_pause': self._toggle_pause,
-            'update_speed': self._update_speed_from_entry
+            'cancel_bfs': self._cancel_bfs,
+            'show_levels': self._show_level_histogram,
+            'update_speed': self._update_speed_from_entry,
+            'seek_timeline': self._seek_timeline,
+            'save_trace': self._save_trace,
+            'replay_trace': self._replay_trace,
+            'auto_layout': self._toggle_auto_layout,
+            'open_grid': self._open_grid_window,
+            'open_compare': self._open_compare_window,
+            'toggle_perf': self._toggle_perf_overlay,
+            'dump_perf': self._dump_perf_metrics,
+            'step_back': lambda: self._step_once(-1),
+            'step_forward': lambda: self._step_once(1),
+            'toggle_direction': self._toggle_direction
         }
         
         # Panel de control
@@ -66,16 +114,19 @@ class BFSVisualizerApp:
         # Canvas del grafo
         self.graph_canvas = GraphCanvas(self.paned)
         self.graph_canvas.bind_click(self._on_canvas_click)
+        self.graph_canvas.bind_drag(self._on_canvas_drag, self._on_canvas_release)
         
         # Agregar paneles al PanedWindow
         self.paned.add(self.control_panel.frame, minsize=250, width=450)
         self.paned.add(self.graph_canvas.frame, minsize=300)
     
     def _set_mode(self, mode):
-        """Establece el modo actual de la aplicación."""
-        if self.bfs_running:
-            return
+        """
+        Establece el modo actual de la aplicación.
         
+        Los modos de edición siguen disponibles durante la animación: el
+        recorrido trabaja sobre una instantánea del grafo.
+        """
         # Resetear estados de edición
         self.edge_first_node = None
         
@@ -84,7 +135,7 @@ class BFSVisualizerApp:
         
         if self.mode == mode:
             # Si ya estaba en ese modo, desactivar
-            self.mode = 'idle'
+            self.mode = 'running' if self.bfs_running else 'idle'
             self.control_panel.update_status(
                 "Estado: Selecciona una acción", 
                 UI_COLORS['text_muted']
@@ -120,6 +171,14 @@ class BFSVisualizerApp:
                 self.control_panel.update_instruction(
                     "Click en un nodo o cerca\nde una arista para eliminar"
                 )
+            elif mode == 'move':
+                self.control_panel.update_status(
+                    "Modo: MOVER NODO", 
+                    UI_COLORS['btn_info']
+                )
+                self.control_panel.update_instruction(
+                    "Arrastra un nodo para\ncambiar su posición"
+                )
     
     def _update_speed_from_entry(self, event=None):
         """Actualiza la velocidad desde el campo de texto."""
@@ -140,6 +199,12 @@ class BFSVisualizerApp:
             return
         
         self.bfs_paused = not self.bfs_paused
+        if self._producer is not None:
+            if self.bfs_paused:
+                self._producer.pause()
+            else:
+                self._producer.resume()
+        
         if self.bfs_paused:
             self.control_panel.set_pause_button(True, "Reanudar", is_paused=True)
             self.control_panel.update_status(
@@ -156,10 +221,11 @@ class BFSVisualizerApp:
     def _on_canvas_click(self, event):
         """Maneja todos los clicks en el canvas según el modo actual."""
         x, y = event.x, event.y
-        node = self.graph_canvas.get_node_at(x, y, self.graph.nodes)
+        node = self._node_at(x, y)
         
         if self.mode == 'idle':
-            pass
+            if node is not None:
+                self._show_component_info(node)
         
         elif self.mode == 'add_node':
             self._create_node(x, y)
@@ -170,18 +236,212 @@ class BFSVisualizerApp:
         elif self.mode == 'delete':
             self._handle_delete_click(x, y, node)
         
+        elif self.mode == 'move':
+            self._start_drag(node)
+        
         elif self.mode == 'select_start':
             if node is not None:
                 self._run_bfs(node)
+        
+        elif self.mode == 'select_path':
+            self._handle_path_click(node)
+    
+    def _node_at(self, x, y):
+        """Retorna el nodo bajo (x, y) revisando solo los cercanos según el índice espacial."""
+        return self.graph_canvas.get_node_at(
+            x, y, self.graph.nodes, self.graph.nodes_near(x, y, NODE_RADIUS)
+        )
+    
+    def _start_drag(self, node):
+        """Comienza a arrastrar un nodo en modo 'move'."""
+        if node is None:
+            return
+        # La distribución automática volvería a mover el nodo
+        self._stop_auto_layout("Distribución detenida")
+        self._drag = {
+            'node': node,
+            'pending': None,   # Última posición recibida aún no dibujada
+            'after_id': None,  # Redibujo programado para el próximo cuadro
+        }
+        # Solo las aristas incidentes, en O(grado); sus otros extremos no se mueven
+        nodes = self.graph.nodes
+        lines = [
+            (line_id, nodes[neighbor]['x'], nodes[neighbor]['y'])
+            for neighbor, line_id in self.graph.incident_edges(node)
+        ]
+        data = nodes[node]
+        self.graph_canvas.begin_drag(data['circle_id'], data['text_id'], lines)
+        self.graph_canvas.set_node_outline(data['circle_id'], UI_COLORS['btn_active'], 4)
+    
+    def _on_canvas_drag(self, event):
+        """
+        Registra el movimiento del mouse durante un arrastre.
+        
+        Los eventos se acumulan y se dibuja a lo sumo una vez por cuadro
+        (~16 ms) con la última posición recibida.
+        """
+        drag = self._drag
+        if drag is None:
+            return
+        drag['pending'] = (event.x, event.y)
+        if drag['after_id'] is None:
+            drag['after_id'] = self.root.after(16, self._flush_drag)
+    
+    def _flush_drag(self):
+        """Mueve el nodo arrastrado y solo sus aristas incidentes."""
+        drag = self._drag
+        if drag is None:
+            return
+        drag['after_id'] = None
+        position = drag['pending']
+        if position is None:
+            return
+        drag['pending'] = None
+        
+        if drag['node'] not in self.graph.nodes:
+            return
+        x, y = position
+        self.graph.move_node(drag['node'], x, y)
+        self.graph_canvas.drag_node(x, y)
+    
+    def _on_canvas_release(self, event):
+        """Termina el arrastre dibujando la última posición pendiente."""
+        drag = self._drag
+        if drag is None:
+            return
+        if drag['after_id'] is not None:
+            self.root.after_cancel(drag['after_id'])
+        self._flush_drag()
+        self.graph_canvas.end_drag()
+        self._drag = None
+        
+        node = self.graph.get_node(drag['node'])
+        if node is not None:
+            self.graph_canvas.set_node_outline(node['circle_id'], '#333333', 2)
+            self.control_panel.update_instruction(
+                f"Nodo {node['label']} movido.\nArrastra otro nodo"
+            )
+    
+    def _show_component_info(self, node):
+        """
+        Muestra la componente conexa de un nodo (consulta instantánea).
+        
+        Si hay un recorrido terminado, además resalta el camino del árbol
+        BFS hasta el nodo y su ancestro común con el nodo consultado antes.
+        """
+        label = self.graph.get_node(node)['label']
+        size = self.graph.component_size(node)
+        count = self.graph.component_count()
+        text = f"Nodo {label}: componente de {size} nodo(s)\nEl grafo tiene {count} componente(s)"
+        tree_info = self._show_tree_path(node)
+        if tree_info:
+            text += f"\n{tree_info}"
+        self.control_panel.update_instruction(text)
+    
+    def _tree_index(self):
+        """
+        Retorna el índice de ancestros del último recorrido.
+        
+        Se construye una vez por línea de tiempo (con binary lifting) y se
+        reutiliza en todas las consultas siguientes.
+        """
+        timeline = self._timeline
+        if timeline is None or not timeline.seekable or not len(timeline):
+            return None
+        cached = self._bfs_tree
+        if cached is None or cached[0] is not timeline or cached[1] != len(timeline):
+            result = result_from_steps(timeline.steps, timeline.start_node)
+            cached = self._bfs_tree = (timeline, len(timeline), result.tree_index())
+            self._tree_focus = None
+        return cached[2]
+    
+    def _show_tree_path(self, node):
+        """
+        Resalta con un solo recoloreo el camino del árbol BFS hasta un nodo.
+        
+        Returns:
+            Texto con el camino y el ancestro común con la consulta anterior,
+            o None si no hay un recorrido
+        """
+        index = self._tree_index()
+        if index is None:
+            return None
+        path = index.path(node)
+        if path is None:
+            self._clear_tree_path()
+            return "Fuera del árbol BFS del último recorrido"
+        
+        # Restaurar el camino anterior y pintar el nuevo en un mismo comando
+        ops = self._tree_path_restore_ops()
+        ops.extend(self._get_render_plan().path_ops(path))
+        self.graph_canvas.apply_ops(ops)
+        self._tree_path = path
+        text = f"Árbol BFS: {' → '.join(self._node_label(n) for n in path)}"
+        previous, self._tree_focus = self._tree_focus, node
+        if previous is not None and previous != node:
+            common = index.lca(previous, node)
+            if common is not None:
+                text += f"\nAncestro común con {self._node_label(previous)}: {self._node_label(common)}"
+        return text
+    
+    def _tree_path_restore_ops(self):
+        """
+        Retorna las operaciones que devuelven al camino resaltado los colores
+        del paso actual del recorrido, y olvida el camino.
+        """
+        path = self._tree_path
+        self._tree_path = None
+        timeline = self._timeline
+        if path is None or timeline is None or not timeline.seekable:
+            return []
+        node_states = timeline.node_states
+        edge_states = timeline.edge_states
+        keys = [edge_key(n1, n2) for n1, n2 in zip(path, path[1:])]
+        return self._get_render_plan().changes_ops((
+            [(n, node_states.get(n, 'unvisited')) for n in path],
+            [(key, edge_states.get(key, 'edge')) for key in keys]
+        ))
+    
+    def _clear_tree_path(self):
+        """Quita el resaltado del camino del árbol BFS."""
+        self.graph_canvas.apply_ops(self._tree_path_restore_ops())
     
     def _create_node(self, x, y):
         """Crea un nuevo nodo en la posición dada."""
-        if self.graph_canvas.get_node_at(x, y, self.graph.nodes) is not None:
+        if self._node_at(x, y) is not None:
             return
         
         label = self.graph.next_label
         circle_id, text_id = self.graph_canvas.create_node(x, y, label)
-        self.graph.add_node(x, y, circle_id, text_id)
+        self.graph.add_node(x, y, circle_id, text_id, label=label)
+    
+    def _on_graph_change(self, change):
+        """
+        Sincroniza el canvas con un cambio del grafo.
+        
+        Args:
+            change: GraphChange recibido del grafo (uno por operación o por batch)
+        """
+        item_ids = []
+        for _, data in change.removed_nodes:
+            item_ids.append(data['circle_id'])
+            item_ids.append(data['text_id'])
+        item_ids.extend(line_id for _, _, line_id in change.removed_edges)
+        item_ids = [item for item in item_ids if item is not None]
+        self.graph_canvas.delete_items(item_ids)
+        
+        # El plan de renderizado guarda los IDs de canvas de nodos y líneas:
+        # se corrige en O(cambios) en lugar de recompilar toda la traza
+        plan = self._render_plan
+        if plan is None:
+            return
+        if change.cleared:
+            self._render_plan = None
+            return
+        if change.added_edges:
+            plan.add_lines(change.added_edges)
+        if item_ids:
+            plan.remove_items(item_ids, change.removed_edges)
     
     def _handle_add_edge_click(self, node):
         """Maneja el click para agregar aristas."""
@@ -232,14 +492,8 @@ class BFSVisualizerApp:
             node_data = self.graph.get_node(node)
             label = node_data['label']
             
-            # Eliminar del canvas
-            self.graph_canvas.delete_item(node_data['circle_id'])
-            self.graph_canvas.delete_item(node_data['text_id'])
-            
-            # Eliminar del grafo
-            removed_line_ids = self.graph.remove_node(node)
-            for line_id in removed_line_ids:
-                self.graph_canvas.delete_item(line_id)
+            # _on_graph_change borra el nodo y sus aristas del canvas
+            self.graph.remove_node(node)
             
             self.control_panel.update_instruction(f"Nodo {label} eliminado.")
         else:
@@ -254,8 +508,7 @@ class BFSVisualizerApp:
                 label1 = n1_data['label']
                 label2 = n2_data['label']
                 
-                n1, n2, line_id = self.graph.remove_edge(edge_idx)
-                self.graph_canvas.delete_item(line_id)
+                self.graph.remove_edge(edge_idx)
                 
                 self.control_panel.update_instruction(
                     f"Arista {label1}-{label2} eliminada."
@@ -284,6 +537,133 @@ class BFSVisualizerApp:
         )
         self.control_panel.set_start_button_state(False)
     
+    def _start_path_mode(self):
+        """Inicia el modo de consulta de camino más corto (dos clicks)."""
+        if not self.graph.has_nodes():
+            messagebox.showwarning(
+                "Sin nodos", 
+                "Primero crea algunos nodos en el grafo."
+            )
+            return
+        
+        if self.bfs_running:
+            return
+        
+        self._set_mode('idle')
+        self.mode = 'select_path'
+        self.path_source = None
+        self.control_panel.update_status(
+            "Estado: SELECCIONA ORIGEN Y DESTINO", 
+            UI_COLORS['status_warning']
+        )
+        self.control_panel.update_instruction(
+            "Click en el nodo origen,\nluego click en el destino"
+        )
+        self.control_panel.set_start_button_state(False)
+    
+    def _handle_path_click(self, node):
+        """Maneja los dos clicks del modo camino más corto."""
+        if node is None:
+            return
+        
+        if self.path_source is None:
+            self.path_source = node
+            label = self.graph.get_node(node)['label']
+            self.control_panel.update_instruction(
+                f"Origen {label} seleccionado.\nClick en el nodo destino"
+            )
+            circle_id = self.graph.get_node(node)['circle_id']
+            self.graph_canvas.set_node_outline(circle_id, UI_COLORS['btn_active'], 4)
+            return
+        
+        source = self.path_source
+        self.path_source = None
+        self.graph_canvas.set_node_outline(
+            self.graph.get_node(source)['circle_id'], 
+            '#333333', 
+            2
+        )
+        self._run_path_query(source, node)
+    
+    def _run_path_query(self, source, target):
+        """Ejecuta el BFS bidireccional y anima ambas fronteras."""
+        self._paint_initial_colors()
+        self._replace_timeline(None)
+        self._level_stats = None
+        self._traversal_graph = self.graph.snapshot()
+        self.control_panel.reset_timeline()
+        self.control_panel.update_queue_display([])
+        
+        result = bidirectional_bfs(self._traversal_graph, source, target, record_steps=True)
+        self._set_node_color(source, COLORS['source_frontier'])
+        self._set_node_color(target, COLORS['target_frontier'])
+        
+        self.bfs_running = True
+        self.bfs_paused = False
+        self.mode = 'running'
+        self.control_panel.update_status(
+            "Estado: BUSCANDO CAMINO...", 
+            UI_COLORS['status_danger']
+        )
+        self.control_panel.update_instruction(
+            "Naranja: búsqueda desde el origen\nVioleta: búsqueda desde el destino"
+        )
+        self.control_panel.set_pause_button(True, "Pausar")
+        self._animate_path_steps(result, 0)
+    
+    def _animate_path_steps(self, result, index):
+        """Anima un paso del BFS bidireccional."""
+        self._after_id = None
+        if index >= len(result.steps):
+            self._finish_path_query(result)
+            return
+        
+        if self.bfs_paused:
+            self._after_id = self.root.after(
+                100, 
+                lambda: self._animate_path_steps(result, index)
+            )
+            return
+        
+        # Cada paso es un solo lote de operaciones; las líneas se buscan por
+        # clave de arista en el plan de renderizado, en O(1)
+        step = result.steps[index]
+        if step[0] == 'expand':
+            _, side, node = step
+            self.graph_canvas.apply_ops(self._get_render_plan().changes_ops((
+                [(node, f'{side}_visited')], []
+            )))
+        
+        elif step[0] == 'discover':
+            _, side, node, from_node = step
+            self.graph_canvas.apply_ops(self._get_render_plan().changes_ops((
+                [(node, f'{side}_frontier')], [(edge_key(from_node, node), 'edge_traversed')]
+            )))
+        
+        elif step[0] == 'path':
+            self.graph_canvas.apply_ops(self._get_render_plan().path_ops(step[1]))
+        
+        self._after_id = self.root.after(
+            self.animation_speed, 
+            lambda: self._animate_path_steps(result, index + 1)
+        )
+    
+    def _finish_path_query(self, result):
+        """Muestra el resultado de la consulta de camino más corto."""
+        total = len(self._traversal_graph.nodes)
+        if result.path is None:
+            status = "Estado: NO HAY CAMINO"
+            instruction = f"Los nodos no están conectados.\nNodos explorados: {result.explored} de {total}"
+        else:
+            labels = [self._node_label(n) for n in result.path]
+            status = "Estado: CAMINO ENCONTRADO"
+            instruction = (
+                " → ".join(labels) + 
+                f"\nLongitud: {len(result.path) - 1} aristas" + 
+                f"\nNodos explorados: {result.explored} de {total}"
+            )
+        self._finish_playback(status, instruction)
+    
     def _set_node_color(self, node_id, color):
         """Cambia el color de un nodo."""
         node = self.graph.get_node(node_id)
@@ -294,23 +674,112 @@ class BFSVisualizerApp:
                 color
             )
     
-    def _set_edge_color(self, node1, node2, color):
-        """Cambia el color de una arista."""
-        for n1, n2, line_id in self.graph.edges:
-            if (n1 == node1 and n2 == node2) or (n1 == node2 and n2 == node1):
-                self.graph_canvas.set_edge_color(line_id, color)
-                break
+    def _paint_initial_colors(self):
+        """Pinta todos los nodos y aristas con su color inicial."""
+        self._tree_path = None
+        for node_id in self.graph.nodes:
+            self._set_node_color(node_id, COLORS['unvisited'])
+        for _, _, line_id in self.graph.edges:
+            self.graph_canvas.set_edge_color(line_id, COLORS['edge'])
     
     def _update_queue_display(self, queue):
-        """Actualiza la visualización de la cola."""
+        """Reemplaza la visualización de la cola (al iniciar o saltar de paso)."""
         if queue:
-            labels = [self.graph.get_node(n)['label'] for n in queue]
+            labels = [self._node_label(n) for n in queue]
             self.control_panel.update_queue_display(labels)
         else:
             self.control_panel.update_queue_display([])
     
+    def _node_label(self, node_id):
+        """
+        Retorna la etiqueta de un nodo del recorrido actual.
+        
+        Se busca en la instantánea recorrida, así que sigue disponible
+        aunque el nodo se haya eliminado del grafo durante la animación.
+        """
+        graph = self._traversal_graph if self._traversal_graph is not None else self.graph
+        node = graph.get_node(node_id)
+        return node['label'] if node else '?'
+    
     def _run_bfs(self, start_node):
         """Ejecuta el algoritmo BFS con visualización."""
+        self._paint_initial_colors()
+        
+        # Colorear nodo inicial
+        self._set_node_color(start_node, COLORS['queued'])
+        self._update_queue_display([start_node])
+        
+        # Generar pasos del BFS en segundo plano sobre una instantánea: el
+        # grafo se puede seguir editando sin afectar al hilo generador
+        self._traversal_graph = self.graph.snapshot()
+        self._replace_timeline(BFSTimeline([], start_node, complete=False))
+        self.control_panel.configure_timeline(0)
+        # Sin la casilla marcada el motor no lleva ninguna cuenta por nivel
+        self._level_stats = (
+            LevelStatsRecorder() if self.control_panel.get_level_stats_enabled() else None
+        )
+        self._update_level_display()
+        self._producer = StepProducer(
+            self._traversal_graph, 
+            start_node, 
+            forest=self.control_panel.get_forest_mode(),
+            max_depth=self.control_panel.get_max_depth(),
+            level_stats=self._level_stats
+        )
+        self._producer.start()
+        self._poll_producer()
+        
+        # Animar los pasos a medida que llegan
+        self.play_direction = 1
+        self._start_playback()
+    
+    def _poll_producer(self):
+        """Incorpora a la línea de tiempo los pasos generados en segundo plano."""
+        producer = self._producer
+        if producer is None:
+            return
+        
+        timeline = self._timeline
+        steps = producer.poll()
+        if steps:
+            timeline.extend(steps)
+            self._get_render_plan()
+            self.control_panel.set_timeline_total(len(timeline))
+        
+        if producer.finished:
+            timeline.complete = True
+            self._producer = None
+            self.control_panel.set_generation_progress(len(timeline), len(timeline))
+            return
+        
+        # Cota superior de pasos: visit + done por nodo y un enqueue por nodo no inicial
+        estimate = 3 * len(self._traversal_graph.nodes) - 1
+        self.control_panel.set_generation_progress(len(timeline), estimate)
+        self.root.after(30, self._poll_producer)
+    
+    def _cancel_bfs(self):
+        """Cancela la generación y la animación del BFS en curso."""
+        if not self.bfs_running:
+            return
+        
+        if self._producer is not None:
+            self._producer.cancel()
+            self._producer = None
+            self.control_panel.set_generation_progress(len(self._timeline), None)
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        
+        # Lo generado hasta ahora sigue navegable en la línea de tiempo
+        if self._timeline is not None:
+            self._timeline.complete = True
+        self._finish_playback(
+            "Estado: BFS CANCELADO",
+            "Recorrido cancelado.\nUsa la línea de tiempo\npara revisar los pasos generados"
+        )
+    
+    def _start_playback(self):
+        """Inicia la cadena de animación en la dirección actual."""
         self.bfs_running = True
         self.bfs_paused = False
         self.mode = 'running'
@@ -323,79 +792,445 @@ class BFSVisualizerApp:
             "Observa la animación\ndel recorrido BFS"
         )
         self.control_panel.set_pause_button(True, "Pausar")
+        self.control_panel.set_start_button_state(False)
+        self.control_panel.set_direction_button(self.play_direction)
         
-        # Reiniciar colores
-        for node_id in self.graph.nodes:
-            self._set_node_color(node_id, COLORS['unvisited'])
-        for _, _, line_id in self.graph.edges:
-            self.graph_canvas.set_edge_color(line_id, COLORS['edge'])
-        
-        # Colorear nodo inicial
-        self._set_node_color(start_node, COLORS['queued'])
-        self._update_queue_display([start_node])
-        
-        # Generar pasos del BFS
-        steps = generate_bfs_steps(self.graph, start_node)
-        
-        # Animar los pasos
-        self._animate_steps(steps, 0)
+        self._animate_steps()
     
-    def _animate_steps(self, steps, index):
-        """Anima un paso del BFS."""
-        if index >= len(steps):
-            self.bfs_running = False
-            self.bfs_paused = False
+    def _finish_playback(self, status, instruction):
+        """Detiene la animación y deja la línea de tiempo navegable."""
+        self.bfs_running = False
+        self.bfs_paused = False
+        if self.mode == 'running':
             self.mode = 'idle'
-            self.control_panel.update_status(
-                "Estado: BFS COMPLETADO", 
-                UI_COLORS['status_success']
-            )
-            self.control_panel.update_instruction(
-                "Recorrido finalizado.\nUsa los botones para continuar"
+        self.play_direction = 1
+        self.control_panel.update_status(status, UI_COLORS['status_success'])
+        self.control_panel.update_instruction(instruction)
+        self.control_panel.set_start_button_state(True)
+        self.control_panel.set_pause_button(False, "Pausar")
+        self.control_panel.set_direction_button(self.play_direction)
+    
+    def _animate_steps(self):
+        """Anima el siguiente paso del BFS en la dirección de reproducción."""
+        self._after_id = None
+        timeline = self._timeline
+        if self.play_direction > 0 and timeline.is_finished():
+            if not timeline.complete:
+                # Esperar a que el hilo generador entregue más pasos
+                self._schedule_animation(30)
+                return
+            last_step = timeline.last_step()
+            hint = (
+                "Usa la línea de tiempo\npara revisar cualquier paso" if timeline.seekable
+                else "Reproducción de la traza terminada"
             )
-            self.control_panel.set_start_button_state(True)
-            self.control_panel.set_pause_button(False, "Pausar")
+            if last_step is not None and last_step[0] == 'stop':
+                self._finish_playback(
+                    "Estado: BFS DETENIDO",
+                    f"{STOP_MESSAGES.get(last_step[1], last_step[1])}.\n{hint}"
+                )
+            else:
+                self._finish_playback("Estado: BFS COMPLETADO", f"Recorrido finalizado.\n{hint}")
             self.control_panel.update_queue_display([])
             return
         
+        if self.play_direction < 0 and timeline.position == 0:
+            self._finish_playback(
+                "Estado: BFS REBOBINADO",
+                "Recorrido en el paso inicial.\nUsa la línea de tiempo\npara revisar cualquier paso"
+            )
+            return
+        
         if self.bfs_paused:
-            self.root.after(100, lambda: self._animate_steps(steps, index))
+            self._schedule_animation(100)
             return
         
-        step = steps[index]
+        if PROFILER.enabled:
+            start = time.perf_counter()
+            self._step_timeline(self.play_direction)
+            PROFILER.record_frame(time.perf_counter() - start, start - self._expected_fire)
+        else:
+            self._step_timeline(self.play_direction)
+        
+        self._schedule_animation(self.animation_speed)
+    
+    def _schedule_animation(self, delay):
+        """Programa el próximo cuadro, recordando cuándo debería dispararse."""
+        self._expected_fire = time.perf_counter() + delay / 1000
+        self._after_id = self.root.after(delay, self._animate_steps)
+    
+    def _step_timeline(self, direction):
+        """Avanza o retrocede un paso de la línea de tiempo en O(1)."""
+        if self._tree_path is not None:
+            self._clear_tree_path()
+        timeline = self._timeline
+        if direction > 0:
+            if timeline.is_finished():
+                return
+            index = timeline.position
+            changes = timeline.step_forward()
+        else:
+            if timeline.position == 0 or not timeline.seekable:
+                return
+            changes = timeline.step_backward()
+            index = timeline.position
+        delta = timeline.delta_at(index)
+        
+        plan = self._get_render_plan()
+        if timeline.seekable:
+            self.graph_canvas.apply_ops(plan.step_ops(index, backward=direction < 0))
+        else:
+            self.graph_canvas.apply_ops(plan.changes_ops(changes))
         
-        if step[0] == 'visit':
-            _, node, queue = step
-            self._set_node_color(node, COLORS['current'])
-            self._update_queue_display(queue)
+        self.control_panel.apply_queue_delta(
+            delta.queue_op, 
+            self._node_label(delta.node), 
+            backward=direction < 0
+        )
+        self.control_panel.set_timeline_position(timeline.position)
+        self._update_level_display()
+    
+    def _step_once(self, direction):
+        """Mueve un solo paso, pausando la animación si estaba corriendo."""
+        if self._timeline is None:
+            return
         
-        elif step[0] == 'enqueue':
-            _, node, from_node, queue = step
-            self._set_node_color(node, COLORS['queued'])
-            self._set_edge_color(from_node, node, COLORS['edge_traversed'])
-            self._update_queue_display(queue)
+        if self.bfs_running and not self.bfs_paused:
+            self._toggle_pause()
+        self._step_timeline(direction)
+    
+    def _toggle_direction(self):
+        """Invierte la dirección de reproducción (reproducir hacia atrás)."""
+        timeline = self._timeline
+        if timeline is None or not timeline.seekable:
+            return
         
-        elif step[0] == 'done':
-            _, node, queue = step
-            self._set_node_color(node, COLORS['visited'])
-            self._update_queue_display(queue)
+        if self.bfs_running:
+            self.play_direction = -self.play_direction
+            self.control_panel.set_direction_button(self.play_direction)
+            return
         
-        self.root.after(
-            self.animation_speed, 
-            lambda: self._animate_steps(steps, index + 1)
+        # Detenido: reproducir hacia donde queden pasos
+        if timeline.position == 0:
+            self.play_direction = 1
+        elif timeline.is_finished():
+            self.play_direction = -1
+        else:
+            self.play_direction = -self.play_direction
+        self._start_playback()
+    
+    def _replace_timeline(self, timeline):
+        """
+        Reemplaza la línea de tiempo actual.
+        
+        Una TracePlayback mantiene abierto el mapeo de su archivo, así que
+        se cierra al descartarla.
+        """
+        if isinstance(self._timeline, TracePlayback):
+            self._timeline.close()
+        self._timeline = timeline
+    
+    def _get_render_plan(self):
+        """
+        Retorna el plan de renderizado, compilando los pasos nuevos.
+        
+        Las ediciones del grafo lo corrigen en el lugar (ver
+        _on_graph_change); solo se descarta al vaciar el grafo.
+        """
+        plan = self._render_plan
+        if plan is None:
+            plan = self._render_plan = RenderPlan(self.graph)
+        timeline = self._timeline
+        if timeline is not None and timeline.seekable:
+            if plan.source is not timeline:
+                plan.reset(timeline)
+            plan.extend(timeline.deltas)
+        return plan
+    
+    def _apply_timeline_changes(self, changes):
+        """Aplica en el canvas los cambios de estado de la línea de tiempo."""
+        self.graph_canvas.apply_ops(self._get_render_plan().changes_ops(changes))
+    
+    def _seek_timeline(self, position):
+        """Reconstruye el estado del canvas en un paso arbitrario."""
+        timeline = self._timeline
+        if timeline is None or not timeline.seekable or position == timeline.position:
+            return
+        
+        self._clear_tree_path()
+        self._apply_timeline_changes(timeline.seek(position))
+        self._update_queue_display(timeline.current_queue())
+        self.control_panel.set_timeline_position(timeline.position)
+        self._update_level_display()
+    
+    def _update_level_display(self):
+        """Muestra el nivel y la frontera del paso actual (si hay estadísticas)."""
+        if self._level_stats is None:
+            return
+        level, frontier = self._level_stats.progress_at(self._timeline.position)
+        self.control_panel.update_level_display(level, frontier)
+    
+    def _show_level_histogram(self):
+        """Abre una ventana con las estadísticas por nivel del último BFS."""
+        stats = self._level_stats
+        if stats is None or not len(stats):
+            messagebox.showinfo(
+                "Sin estadísticas",
+                "Marca \"Estadísticas por nivel\" y ejecuta un BFS\npara ver su histograma."
+            )
+            return
+        
+        totals = stats.totals()
+        text = (
+            f"{stats.histogram()}\n\n"
+            f"{totals['levels']} niveles, {totals['edges']} aristas examinadas, "
+            f"{totals['duplicates']} repetidas, {totals['seconds'] * 1000:.1f} ms"
+        )
+        window = tk.Toplevel(self.root)
+        window.title("Estadísticas por nivel")
+        window.configure(bg=UI_COLORS['bg_main'])
+        view = tk.Text(
+            window, font=('Courier', 9), wrap=tk.NONE,
+            width=90, height=min(30, text.count('\n') + 2)
         )
+        view.insert('1.0', text)
+        view.config(state=tk.DISABLED)
+        view.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
     
-    def _reset_colors(self):
-        """Reinicia los colores de todos los nodos y aristas."""
+    def _save_trace(self):
+        """Guarda los pasos del último BFS en un archivo de traza binaria."""
+        timeline = self._timeline
+        if timeline is None or not timeline.seekable or not timeline.complete or not len(timeline):
+            messagebox.showinfo(
+                "Sin recorrido",
+                "Ejecuta un BFS completo antes de guardar su traza."
+            )
+            return
+        path = filedialog.asksaveasfilename(
+            title="Guardar traza BFS",
+            defaultextension=".bfst",
+            filetypes=[("Traza BFS", "*.bfst")]
+        )
+        if not path:
+            return
+        count = write_trace(path, timeline.start_node, timeline.steps)
+        self.control_panel.update_instruction(f"Traza guardada ({count} pasos) en\n{path}")
+    
+    def _replay_trace(self):
+        """Reproduce una traza binaria guardada sobre el grafo actual."""
         if self.bfs_running:
             return
+        path = filedialog.askopenfilename(
+            title="Reproducir traza BFS",
+            filetypes=[("Traza BFS", "*.bfst"), ("Todos los archivos", "*")]
+        )
+        if not path:
+            return
         
-        for node_id in self.graph.nodes:
-            self._set_node_color(node_id, COLORS['unvisited'])
+        try:
+            reader = TraceReader(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Traza inválida", str(e))
+            return
+        if reader.start_node not in self.graph.nodes:
+            reader.close()
+            messagebox.showerror(
+                "Traza incompatible",
+                "El nodo inicial de la traza no existe en el grafo actual."
+            )
+            return
         
-        for _, _, line_id in self.graph.edges:
-            self.graph_canvas.set_edge_color(line_id, COLORS['edge'])
+        self._set_mode('idle')
+        self._paint_initial_colors()
+        self._set_node_color(reader.start_node, COLORS['queued'])
+        self._update_queue_display([reader.start_node])
+        
+        # Los pasos se decodifican del archivo a medida que se animan
+        self._traversal_graph = None
+        self._level_stats = None
+        self._replace_timeline(TracePlayback(reader))
+        self.control_panel.configure_trace_replay(reader.step_count)
+        self.play_direction = 1
+        self._start_playback()
+    
+    def _toggle_auto_layout(self):
+        """Inicia la distribución automática o la detiene si está en curso."""
+        if self._layout is not None:
+            self._stop_auto_layout("Distribución detenida")
+            return
+        if self.bfs_running or len(self.graph.nodes) < 2:
+            return
+        
+        # Importación diferida: NumPy solo se carga al usar la distribución
+        from algorithms.layout import ForceLayout, LayoutWorker, numpy_available
+        if not numpy_available():
+            messagebox.showinfo(
+                "NumPy no disponible",
+                "La distribución automática requiere NumPy.\nInstálalo con: pip install numpy"
+            )
+            return
+        
+        node_ids = list(self.graph.nodes)
+        index = {node_id: i for i, node_id in enumerate(node_ids)}
+        edges = [(index[n1], index[n2]) for n1, n2, _ in self.graph.edges]
+        positions = [
+            (self.graph.nodes[node_id]['x'], self.graph.nodes[node_id]['y'])
+            for node_id in node_ids
+        ]
+        width, height = self.graph_canvas.get_size()
+        margin = NODE_RADIUS + 5
+        layout = ForceLayout(
+            len(node_ids), edges,
+            max(width, 400) - 2 * margin, max(height, 300) - 2 * margin,
+            positions=[(x - margin, y - margin) for x, y in positions]
+        )
+        worker = LayoutWorker(layout, time_budget=10.0)
+        worker.start()
+        
+        self._layout = {
+            'worker': worker,
+            'node_ids': node_ids,
+            'margin': margin,
+            'positions': None,  # Instantánea que se está aplicando
+            'cursor': 0,        # Próximo elemento (nodo o arista) a mover
+        }
+        self.control_panel.set_layout_button(True)
+        self.control_panel.update_status("Estado: DISTRIBUYENDO...", UI_COLORS['status_warning'])
+        self._poll_auto_layout()
+    
+    def _poll_auto_layout(self, batch=2000):
+        """Aplica la última instantánea de posiciones por lotes de elementos."""
+        state = self._layout
+        if state is None:
+            return
+        
+        worker = state['worker']
+        finished = worker.finished
+        snapshot = worker.poll()
+        if snapshot is not None:
+            state['positions'] = snapshot
+            state['cursor'] = 0
+        
+        positions = state['positions']
+        if positions is not None:
+            state['cursor'] = self._apply_layout_batch(state, state['cursor'], batch)
+            done = state['cursor'] >= len(state['node_ids']) + len(self.graph.edges)
+        else:
+            done = False
         
+        if finished and done:
+            self._stop_auto_layout(
+                f"Distribución lista ({worker.layout.iterations} iteraciones)"
+            )
+            return
+        self.root.after(50, self._poll_auto_layout)
+    
+    def _apply_layout_batch(self, state, cursor, batch):
+        """
+        Mueve hasta `batch` nodos o aristas según la instantánea actual.
+        
+        Returns:
+            Nueva posición del cursor (primero nodos, luego aristas)
+        """
+        node_ids = state['node_ids']
+        positions = state['positions']
+        margin = state['margin']
+        nodes = self.graph.nodes
+        end = cursor + batch
+        
+        while cursor < min(end, len(node_ids)):
+            node = nodes.get(node_ids[cursor])
+            if node is not None:
+                x = float(positions[cursor][0]) + margin
+                y = float(positions[cursor][1]) + margin
+                self.graph.move_node(node_ids[cursor], x, y)
+                self.graph_canvas.move_node(node['circle_id'], node['text_id'], x, y)
+            cursor += 1
+        
+        # move_node pudo copiar los contenedores si hay una instantánea viva
+        nodes = self.graph.nodes
+        edges = self.graph.edges
+        while cursor < end and cursor - len(node_ids) < len(edges):
+            n1, n2, line_id = edges[cursor - len(node_ids)]
+            self.graph_canvas.move_edge(
+                line_id, nodes[n1]['x'], nodes[n1]['y'], nodes[n2]['x'], nodes[n2]['y']
+            )
+            cursor += 1
+        return cursor
+    
+    def _stop_auto_layout(self, message):
+        """Detiene la distribución automática."""
+        if self._layout is None:
+            return
+        self._layout['worker'].cancel()
+        self._layout = None
+        self.control_panel.set_layout_button(False)
+        self.control_panel.update_status(f"Estado: {message}", UI_COLORS['status_success'])
+    
+    def _open_grid_window(self):
+        """Abre (o trae al frente) la ventana del modo grilla."""
+        if self._grid_window is not None and self._grid_window.exists():
+            self._grid_window.lift()
+            return
+        # Importación diferida: el modo grilla no se carga al iniciar la app
+        from ui.grid_view import GridWindow
+        self._grid_window = GridWindow(self.root)
+    
+    def _open_compare_window(self):
+        """Abre (o trae al frente) la comparación de recorridos con el grafo actual."""
+        if not self.graph.has_nodes():
+            messagebox.showwarning(
+                "Sin nodos", 
+                "Primero crea algunos nodos en el grafo."
+            )
+            return
+        # La comparación recorre una instantánea: el grafo se puede seguir editando
+        snapshot = self.graph.snapshot()
+        if self._compare_window is not None and self._compare_window.exists():
+            self._compare_window.load_graph(snapshot)
+            self._compare_window.lift()
+            return
+        # Importación diferida, como el modo grilla
+        from ui.compare_view import CompareWindow
+        self._compare_window = CompareWindow(self.root, snapshot)
+    
+    def _toggle_perf_overlay(self):
+        """Activa o desactiva la instrumentación y su panel de métricas."""
+        PROFILER.enabled = self.control_panel.get_perf_enabled()
+        if PROFILER.enabled:
+            PROFILER.reset()
+            self._refresh_perf_overlay()
+        else:
+            self.control_panel.update_perf_overlay(None)
+    
+    def _refresh_perf_overlay(self):
+        """Actualiza periódicamente el panel de métricas mientras está activo."""
+        if not PROFILER.enabled:
+            return
+        self.control_panel.update_perf_overlay(PROFILER.summary())
+        self.root.after(500, self._refresh_perf_overlay)
+    
+    def _dump_perf_metrics(self):
+        """Guarda las métricas registradas en un archivo JSON."""
+        path = filedialog.asksaveasfilename(
+            title="Guardar métricas de rendimiento",
+            defaultextension=".json",
+            filetypes=[("JSON", "*.json")]
+        )
+        if not path:
+            return
+        PROFILER.dump(path)
+        self.control_panel.update_instruction(f"Métricas guardadas en\n{path}")
+    
+    def _reset_colors(self):
+        """Reinicia los colores de todos los nodos y aristas (cancela el BFS en curso)."""
+        self._cancel_bfs()
+        self._paint_initial_colors()
+        self._replace_timeline(None)
+        self._traversal_graph = None
+        self._level_stats = None
+        self._bfs_tree = None
+        self.control_panel.reset_timeline()
         self.control_panel.update_queue_display([])
         self.mode = 'idle'
         self.control_panel.update_status(
@@ -408,14 +1243,19 @@ class BFSVisualizerApp:
         self.control_panel.set_start_button_state(True)
     
     def _clear_all(self):
-        """Limpia todo el grafo."""
-        if self.bfs_running:
-            return
-        
+        """Limpia todo el grafo (cancela el BFS en curso)."""
+        self._cancel_bfs()
+        self._stop_auto_layout("Distribución detenida")
         self.graph_canvas.delete_all()
         self.graph.clear()
+        self._tree_path = None
         self.edge_first_node = None
         
+        self._replace_timeline(None)
+        self._traversal_graph = None
+        self._level_stats = None
+        self._bfs_tree = None
+        self.control_panel.reset_timeline()
         self.control_panel.update_queue_display([])
         self._set_mode('idle')
         self.control_panel.update_status(
@@ -0,0 +1,303 @@
+"""Ventana de comparación: varios BFS animados lado a lado."""
+
+from collections import namedtuple
+
+import tkinter as tk
+
+from config.colors import COLORS, UI_COLORS, NODE_RADIUS
+from config.styles import BUTTON_STYLE_SMALL
+from algorithms.engines import ENGINES, REFERENCE_ENGINE, steps_from_result
+from models.timeline import BFSTimeline
+from ui.animation import AnimationController, AnimationRun
+from ui.graph_canvas import GraphCanvas
+
+
+# Nodos y aristas de un panel con los IDs de su propio canvas (ver AnimationRun)
+PanelView = namedtuple('PanelView', ['nodes', 'edges'])
+
+
+class CompareWindow:
+    """
+    Ventana con un panel por recorrido BFS, animados con un reloj compartido.
+    
+    Cada panel dibuja el mismo grafo (una instantánea, así que el grafo
+    principal se puede seguir editando) y anima el BFS desde su nodo
+    inicial con el motor elegido del registro ENGINES; con "todos" se
+    anima un panel por motor desde el primer nodo inicial. Todos avanzan
+    un paso por cuadro desde un único AnimationController.
+    """
+    
+    all_engines = 'todos'  # Opción del selector: un panel por motor
+    max_runs = 6
+    columns = 3
+    panel_size = (380, 300)
+    
+    def __init__(self, parent, graph):
+        """
+        Crea la ventana y propone los primeros nodos como inicios.
+        
+        Args:
+            parent: Ventana principal de tkinter
+            graph: Graph o GraphSnapshot a recorrer
+        """
+        self.window = tk.Toplevel(parent)
+        self.window.title("Comparar recorridos BFS")
+        self.window.configure(bg=UI_COLORS['bg_main'])
+        
+        self.graph = None
+        self.panels = []  # [(Frame del panel, Label de estado)]
+        self.controller = AnimationController(self.window, on_frame=self._update_labels)
+        
+        self._create_controls()
+        self.panels_frame = tk.Frame(self.window, bg=UI_COLORS['bg_main'])
+        self.panels_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.window.protocol("WM_DELETE_WINDOW", self._close)
+        self.load_graph(graph)
+    
+    def exists(self):
+        """Retorna True si la ventana sigue abierta."""
+        try:
+            return bool(self.window.winfo_exists())
+        except tk.TclError:
+            return False
+    
+    def lift(self):
+        """Trae la ventana al frente."""
+        self.window.deiconify()
+        self.window.lift()
+    
+    def load_graph(self, graph):
+        """
+        Cambia el grafo a comparar y descarta los recorridos anteriores.
+        
+        Args:
+            graph: Graph o GraphSnapshot
+        """
+        self.controller.clear()
+        self._clear_panels()
+        self.graph = graph
+        labels = [graph.nodes[node_id]['label'] for node_id in sorted(graph.nodes)[:3]]
+        self.starts_var.set(', '.join(labels))
+        self._set_status(f"{len(graph.nodes)} nodos - elige los nodos iniciales y el motor y pulsa Comparar")
+    
+    # === Construcción de la interfaz ===
+    
+    def _create_controls(self):
+        """Crea la barra de controles superior."""
+        bar = tk.Frame(self.window, bg=UI_COLORS['bg_main'])
+        bar.pack(fill=tk.X, padx=5, pady=5)
+        
+        tk.Label(
+            bar, text="Nodos iniciales:", font=('Helvetica', 8),
+            fg=UI_COLORS['text_primary'], bg=UI_COLORS['bg_main']
+        ).pack(side=tk.LEFT)
+        self.starts_var = tk.StringVar()
+        tk.Entry(bar, textvariable=self.starts_var, width=24).pack(side=tk.LEFT, padx=(2, 6))
+        
+        tk.Label(
+            bar, text="Motor:", font=('Helvetica', 8),
+            fg=UI_COLORS['text_primary'], bg=UI_COLORS['bg_main']
+        ).pack(side=tk.LEFT)
+        self.engine_var = tk.StringVar(value=REFERENCE_ENGINE)
+        engine_menu = tk.OptionMenu(bar, self.engine_var, *ENGINES, self.all_engines)
+        engine_menu.config(font=('Helvetica', 8), highlightthickness=0)
+        engine_menu.pack(side=tk.LEFT, padx=(2, 6))
+        
+        tk.Label(
+            bar, text="ms/paso:", font=('Helvetica', 8),
+            fg=UI_COLORS['text_primary'], bg=UI_COLORS['bg_main']
+        ).pack(side=tk.LEFT)
+        self.speed_var = tk.IntVar(value=500)
+        tk.Spinbox(
+            bar, from_=50, to=5000, increment=50, width=5, textvariable=self.speed_var,
+            font=('Helvetica', 8)
+        ).pack(side=tk.LEFT, padx=(2, 6))
+        
+        self._button(bar, "Comparar", UI_COLORS['btn_success'], self._start)
+        self.pause_btn = self._button(bar, "Pausar", UI_COLORS['btn_warning'], self._toggle_pause)
+        
+        self.status_label = tk.Label(
+            self.window, text="", font=('Helvetica', 9),
+            fg=UI_COLORS['text_secondary'], bg=UI_COLORS['bg_main'], anchor='w'
+        )
+        self.status_label.pack(fill=tk.X, padx=8)
+    
+    def _button(self, parent, text, color, command):
+        """Crea un botón pequeño de la barra de controles."""
+        button = tk.Button(
+            parent, text=text, bg=color, fg=UI_COLORS['text_white'], command=command,
+            **dict(BUTTON_STYLE_SMALL, width=len(text) + 1, height=1)
+        )
+        button.pack(side=tk.LEFT, padx=2)
+        return button
+    
+    def _clear_panels(self):
+        """Destruye los paneles de la comparación anterior."""
+        for cell, _ in self.panels:
+            cell.destroy()
+        self.panels = []
+    
+    def _create_panel(self, index, title):
+        """
+        Crea un panel con su canvas y dibuja el grafo escalado.
+        
+        Returns:
+            Tupla (Frame del panel, GraphCanvas, PanelView, Label de estado)
+        """
+        cell = tk.Frame(self.panels_frame, bg=UI_COLORS['bg_main'])
+        cell.grid(row=index // self.columns, column=index % self.columns, padx=3, pady=3, sticky='nsew')
+        tk.Label(
+            cell, text=title, font=('Helvetica', 9, 'bold'),
+            fg=UI_COLORS['text_primary'], bg=UI_COLORS['bg_main']
+        ).pack()
+        graph_canvas = GraphCanvas(cell)
+        width, height = self.panel_size
+        graph_canvas.canvas.configure(width=width, height=height)
+        label = tk.Label(
+            cell, text="", font=('Helvetica', 8),
+            fg=UI_COLORS['text_secondary'], bg=UI_COLORS['bg_main']
+        )
+        label.pack()
+        graph_canvas.frame.pack(fill=tk.BOTH, expand=True, before=label)
+        return cell, graph_canvas, self._draw_graph(graph_canvas), label
+    
+    def _draw_graph(self, graph_canvas):
+        """
+        Dibuja el grafo en un canvas, escalado para caber en el panel.
+        
+        Returns:
+            PanelView con los IDs de canvas del panel
+        """
+        graph = self.graph
+        xs = [data['x'] for data in graph.nodes.values()]
+        ys = [data['y'] for data in graph.nodes.values()]
+        width, height = self.panel_size
+        margin = NODE_RADIUS + 4
+        min_x, min_y = min(xs), min(ys)
+        span_x = max(max(xs) - min_x, 1)
+        span_y = max(max(ys) - min_y, 1)
+        scale = min((width - 2 * margin) / span_x, (height - 2 * margin) / span_y, 1.0)
+        
+        positions = {
+            node_id: (margin + (data['x'] - min_x) * scale, margin + (data['y'] - min_y) * scale)
+            for node_id, data in graph.nodes.items()
+        }
+        edges = []
+        for n1, n2, _ in graph.edges:
+            (x1, y1), (x2, y2) = positions[n1], positions[n2]
+            edges.append((n1, n2, graph_canvas.create_edge(x1, y1, x2, y2)))
+        nodes = {}
+        for node_id, data in graph.nodes.items():
+            x, y = positions[node_id]
+            circle_id, text_id = graph_canvas.create_node(x, y, data['label'])
+            nodes[node_id] = {'circle_id': circle_id, 'text_id': text_id}
+        return PanelView(nodes, edges)
+    
+    # === Animación ===
+    
+    def _parse_starts(self):
+        """
+        Lee las etiquetas de los nodos iniciales.
+        
+        Returns:
+            Lista de IDs (sin repetir, hasta max_runs) o None si alguna no existe
+        """
+        starts = []
+        for label in self.starts_var.get().replace(',', ' ').split():
+            node_id = self.graph.find_node(label)
+            if node_id is None:
+                node_id = self.graph.find_node(label.upper())
+            if node_id is None:
+                self._set_status(f"No existe el nodo '{label}'")
+                return None
+            if node_id not in starts:
+                starts.append(node_id)
+        return starts[:self.max_runs]
+    
+    def _plan_runs(self, starts):
+        """
+        Combina los nodos iniciales con el motor elegido.
+        
+        Returns:
+            Lista de tuplas (nodo inicial, nombre del motor)
+        """
+        engine = self.engine_var.get()
+        if engine == self.all_engines:
+            return [(starts[0], name) for name in list(ENGINES)[:self.max_runs]]
+        return [(start, engine) for start in starts]
+    
+    def _build_timeline(self, start, engine):
+        """
+        Ejecuta un motor y arma la línea de tiempo de su recorrido.
+        
+        Los motores sin traza (p. ej. 'search' o 'parallel') se animan con
+        la traza reconstruida desde su resultado.
+        
+        Returns:
+            BFSTimeline con los pasos del motor
+        """
+        result, steps = ENGINES[engine](self.graph, start)
+        if steps is None:
+            steps = steps_from_result(result)
+        return BFSTimeline(steps, start)
+    
+    def _start(self):
+        """Genera los recorridos y los anima juntos desde el primer paso."""
+        starts = self._parse_starts()
+        if not starts:
+            if starts is not None:
+                self._set_status("Indica al menos un nodo inicial")
+            return
+        runs = self._plan_runs(starts)
+        
+        self.controller.clear()
+        self._clear_panels()
+        try:
+            self.controller.interval = max(50, int(self.speed_var.get()))
+        except (tk.TclError, ValueError):
+            self.controller.interval = 500
+        
+        for index, (start, engine) in enumerate(runs):
+            label = self.graph.nodes[start]['label']
+            cell, graph_canvas, view, status = self._create_panel(
+                index, f"BFS desde {label} ({engine})"
+            )
+            start_data = view.nodes[start]
+            graph_canvas.set_node_color(start_data['circle_id'], start_data['text_id'], COLORS['queued'])
+            timeline = self._build_timeline(start, engine)
+            self.controller.add_run(AnimationRun(
+                f"{label} ({engine})", timeline, view, str(graph_canvas.canvas)
+            ))
+            self.panels.append((cell, status))
+        
+        self._update_labels(self.controller.runs)
+        self.pause_btn.config(text="Pausar")
+        self.controller.start()
+        self._set_status(f"{len(runs)} recorrido(s) con un reloj de {self.controller.interval} ms")
+    
+    def _toggle_pause(self):
+        """Pausa o reanuda todos los recorridos a la vez."""
+        if self.controller.running:
+            self.controller.stop()
+            self.pause_btn.config(text="Reanudar")
+        elif not self.controller.is_finished():
+            self.controller.start()
+            self.pause_btn.config(text="Pausar")
+    
+    def _update_labels(self, runs):
+        """Muestra el avance de cada recorrido bajo su panel."""
+        for run, (_, status) in zip(runs, self.panels):
+            timeline = run.timeline
+            suffix = " - terminado" if run.is_finished() else ""
+            status.config(text=f"Paso {timeline.position} de {len(timeline)}{suffix}")
+        if runs and self.controller.is_finished():
+            self._set_status(f"Comparación terminada en {self.controller.frames} cuadros")
+    
+    def _set_status(self, text):
+        """Actualiza la línea de estado de la ventana."""
+        self.status_label.config(text=text)
+    
+    def _close(self):
+        """Detiene la animación y cierra la ventana."""
+        self.controller.stop()
+        self.window.destroy()
@@ -5,6 +5,7 @@ from tkinter import ttk
 
 from config.colors import COLORS, UI_COLORS
 from config.styles import BUTTON_STYLE, BUTTON_STYLE_SMALL
+from ui.queue_view import QueueView
 
 
 class ControlPanel:
@@ -20,9 +21,23 @@ class ControlPanel:
                 - 'set_mode': función para cambiar modo
                 - 'clear_all': función para limpiar grafo
                 - 'start_bfs': función para iniciar BFS
+                - 'start_path': función para buscar el camino más corto
                 - 'reset_colors': función para reiniciar colores
                 - 'toggle_pause': función para pausar/reanudar
+                - 'cancel_bfs': función para cancelar el BFS en curso
+                - 'show_levels': función para mostrar el histograma por nivel
                 - 'update_speed': función para actualizar velocidad
+                - 'seek_timeline': función para saltar a un paso del BFS
+                - 'save_trace': función para guardar la traza del último BFS
+                - 'replay_trace': función para reproducir una traza guardada
+                - 'auto_layout': función para iniciar/detener la distribución automática
+                - 'open_grid': función para abrir la ventana del modo grilla
+                - 'open_compare': función para abrir la comparación de recorridos
+                - 'toggle_perf': función para activar/desactivar las métricas
+                - 'dump_perf': función para guardar las métricas en un archivo
+                - 'step_back': función para retroceder un paso
+                - 'step_forward': función para avanzar un paso
+                - 'toggle_direction': función para invertir la reproducción
         """
         self.callbacks = callbacks
         self.mode_buttons = {}
@@ -106,6 +121,9 @@ class ControlPanel:
         # === Sección: Algoritmo BFS ===
         self._create_bfs_section()
         
+        # === Sección: Línea de tiempo ===
+        self._create_timeline_section()
+        
         # Separador
         ttk.Separator(self.control_frame, orient='horizontal').pack(
             fill=tk.X, pady=10, padx=10
@@ -119,14 +137,35 @@ class ControlPanel:
             fill=tk.X, pady=10, padx=10
         )
         
+        # === Sección: Rendimiento ===
+        self._create_perf_section()
+        
+        # Separador
+        ttk.Separator(self.control_frame, orient='horizontal').pack(
+            fill=tk.X, pady=10, padx=10
+        )
+        
+        # === Secciones diferidas: Leyenda y Cola BFS ===
+        # Se construyen cuando la ventana ya está visible (after_idle) para
+        # no retrasar el arranque; el contenedor reserva su lugar en el panel.
+        self.queue_view = None
+        self._deferred_frame = tk.Frame(self.control_frame, bg=UI_COLORS['bg_main'])
+        self._deferred_frame.pack(fill=tk.X)
+        self.frame.after_idle(self._create_deferred_sections)
+    
+    def _create_deferred_sections(self):
+        """Construye la leyenda y la cola BFS (una sola vez)."""
+        if self.queue_view is not None:
+            return
+        
         # === Sección: Leyenda ===
-        self._create_legend_section()
+        self._create_legend_section(self._deferred_frame)
         
         # === Sección: Cola BFS ===
-        ttk.Separator(self.control_frame, orient='horizontal').pack(
+        ttk.Separator(self._deferred_frame, orient='horizontal').pack(
             fill=tk.X, pady=10, padx=10
         )
-        self._create_queue_section()
+        self._create_queue_section(self._deferred_frame)
     
     def _create_graph_section(self):
         """Crea la sección de crear grafo."""
@@ -188,6 +227,51 @@ class ControlPanel:
             **BUTTON_STYLE_SMALL
         )
         self.clear_btn.grid(row=1, column=1, padx=3, pady=3)
+        
+        # Botón Mover Nodo (arrastrar)
+        self.move_btn = tk.Button(
+            create_frame,
+            text="Mover Nodo",
+            bg=UI_COLORS['btn_primary'],
+            fg=UI_COLORS['text_white'],
+            command=lambda: self.callbacks['set_mode']('move'),
+            **BUTTON_STYLE_SMALL
+        )
+        self.move_btn.grid(row=2, column=0, padx=3, pady=3)
+        self.mode_buttons['move'] = self.move_btn
+        
+        # Botón Distribuir automáticamente
+        self.layout_btn = tk.Button(
+            self.control_frame,
+            text="Distribuir automáticamente",
+            bg=UI_COLORS['btn_info'],
+            fg=UI_COLORS['text_white'],
+            command=self.callbacks['auto_layout'],
+            **BUTTON_STYLE
+        )
+        self.layout_btn.pack(pady=5)
+        
+        # Botón Modo grilla (laberintos)
+        grid_btn = tk.Button(
+            self.control_frame,
+            text="Modo grilla / laberinto",
+            bg=UI_COLORS['btn_info'],
+            fg=UI_COLORS['text_white'],
+            command=self.callbacks['open_grid'],
+            **BUTTON_STYLE
+        )
+        grid_btn.pack(pady=5)
+        
+        # Botón Comparar recorridos (varios BFS lado a lado)
+        compare_btn = tk.Button(
+            self.control_frame,
+            text="Comparar recorridos",
+            bg=UI_COLORS['btn_info'],
+            fg=UI_COLORS['text_white'],
+            command=self.callbacks['open_compare'],
+            **BUTTON_STYLE
+        )
+        compare_btn.pack(pady=5)
     
     def _create_bfs_section(self):
         """Crea la sección del algoritmo BFS."""
@@ -211,6 +295,76 @@ class ControlPanel:
         )
         self.start_btn.pack(pady=5)
         
+        # Opción de bosque BFS (todas las componentes)
+        self.forest_var = tk.BooleanVar(value=False)
+        self.forest_check = tk.Checkbutton(
+            self.control_frame,
+            text="Recorrer todas las componentes",
+            variable=self.forest_var,
+            font=('Helvetica', 8),
+            fg=UI_COLORS['text_primary'],
+            bg=UI_COLORS['bg_main'],
+            activebackground=UI_COLORS['bg_main']
+        )
+        self.forest_check.pack()
+        
+        # Profundidad máxima (0 = sin límite)
+        depth_frame = tk.Frame(self.control_frame, bg=UI_COLORS['bg_main'])
+        depth_frame.pack(pady=2)
+        depth_label = tk.Label(
+            depth_frame,
+            text="Profundidad máx. (0 = sin límite):",
+            font=('Helvetica', 8),
+            fg=UI_COLORS['text_primary'],
+            bg=UI_COLORS['bg_main']
+        )
+        depth_label.pack(side=tk.LEFT)
+        self.depth_var = tk.IntVar(value=0)
+        depth_spin = tk.Spinbox(
+            depth_frame,
+            from_=0,
+            to=999,
+            width=4,
+            textvariable=self.depth_var,
+            font=('Helvetica', 8)
+        )
+        depth_spin.pack(side=tk.LEFT, padx=(5, 0))
+        
+        # Estadísticas por nivel (desactivadas: el BFS no lleva cuentas)
+        levels_frame = tk.Frame(self.control_frame, bg=UI_COLORS['bg_main'])
+        levels_frame.pack(pady=2)
+        self.level_stats_var = tk.BooleanVar(value=False)
+        level_stats_check = tk.Checkbutton(
+            levels_frame,
+            text="Estadísticas por nivel",
+            variable=self.level_stats_var,
+            font=('Helvetica', 8),
+            fg=UI_COLORS['text_primary'],
+            bg=UI_COLORS['bg_main'],
+            activebackground=UI_COLORS['bg_main']
+        )
+        level_stats_check.pack(side=tk.LEFT)
+        levels_btn = tk.Button(
+            levels_frame,
+            text="Histograma",
+            bg=UI_COLORS['btn_info'],
+            fg=UI_COLORS['text_white'],
+            command=self.callbacks['show_levels'],
+            **dict(BUTTON_STYLE_SMALL, width=10, height=1)
+        )
+        levels_btn.pack(side=tk.LEFT, padx=5)
+        
+        # Botón Camino más corto
+        self.path_btn = tk.Button(
+            self.control_frame,
+            text="Camino más corto",
+            bg=UI_COLORS['btn_success'],
+            fg=UI_COLORS['text_white'],
+            command=self.callbacks['start_path'],
+            **BUTTON_STYLE
+        )
+        self.path_btn.pack(pady=5)
+        
         # Botón Reiniciar Colores
         self.reset_btn = tk.Button(
             self.control_frame,
@@ -222,6 +376,30 @@ class ControlPanel:
         )
         self.reset_btn.pack(pady=5)
         
+        # Guardar / reproducir trazas binarias
+        trace_frame = tk.Frame(self.control_frame, bg=UI_COLORS['bg_main'])
+        trace_frame.pack(pady=2)
+        trace_style = dict(BUTTON_STYLE_SMALL, width=14)
+        self.save_trace_btn = tk.Button(
+            trace_frame,
+            text="Guardar traza",
+            bg=UI_COLORS['btn_info'],
+            fg=UI_COLORS['text_white'],
+            command=self.callbacks['save_trace'],
+            **trace_style
+        )
+        self.save_trace_btn.grid(row=0, column=0, padx=2)
+        self.replay_trace_btn = tk.Button(
+            trace_frame,
+            text="Reproducir traza",
+            bg=UI_COLORS['btn_info'],
+            fg=UI_COLORS['text_white'],
+            disabledforeground=UI_COLORS['text_white'],
+            command=self.callbacks['replay_trace'],
+            **trace_style
+        )
+        self.replay_trace_btn.grid(row=0, column=1, padx=2)
+        
         # Botón Pausar
         self.pause_btn = tk.Button(
             self.control_frame,
@@ -235,6 +413,47 @@ class ControlPanel:
         )
         self.pause_btn.pack(pady=5)
         
+        # Botón Cancelar
+        self.cancel_btn = tk.Button(
+            self.control_frame,
+            text="Cancelar BFS",
+            bg=UI_COLORS['btn_danger'],
+            fg=UI_COLORS['text_white'],
+            disabledforeground=UI_COLORS['text_white'],
+            command=self.callbacks['cancel_bfs'],
+            state=tk.DISABLED,
+            **BUTTON_STYLE
+        )
+        self.cancel_btn.pack(pady=5)
+        
+        # Progreso de la generación de pasos
+        self.progress_bar = ttk.Progressbar(
+            self.control_frame,
+            orient=tk.HORIZONTAL,
+            length=200,
+            mode='determinate',
+            maximum=100
+        )
+        self.progress_bar.pack(pady=(5, 0))
+        
+        self.progress_label = tk.Label(
+            self.control_frame,
+            text="Pasos generados: 0",
+            font=('Helvetica', 8),
+            fg=UI_COLORS['text_secondary'],
+            bg=UI_COLORS['bg_main']
+        )
+        self.progress_label.pack()
+        
+        self.level_label = tk.Label(
+            self.control_frame,
+            text="",
+            font=('Helvetica', 8),
+            fg=UI_COLORS['text_secondary'],
+            bg=UI_COLORS['bg_main']
+        )
+        self.level_label.pack()
+        
         # Control de velocidad
         speed_frame = tk.Frame(self.control_frame, bg=UI_COLORS['bg_main'])
         speed_frame.pack(pady=10)
@@ -265,6 +484,87 @@ class ControlPanel:
         self.speed_entry.bind('<Return>', self.callbacks['update_speed'])
         self.speed_entry.bind('<FocusOut>', self.callbacks['update_speed'])
     
+    def _create_timeline_section(self):
+        """Crea la sección de línea de tiempo para navegar los pasos."""
+        timeline_title = tk.Label(
+            self.control_frame,
+            text="Línea de tiempo:",
+            font=('Helvetica', 8, 'bold'),
+            fg=UI_COLORS['text_primary'],
+            bg=UI_COLORS['bg_main']
+        )
+        timeline_title.pack(pady=(5, 0))
+        
+        self.timeline_scale = tk.Scale(
+            self.control_frame,
+            from_=0,
+            to=0,
+            orient=tk.HORIZONTAL,
+            showvalue=False,
+            length=220,
+            bg=UI_COLORS['bg_main'],
+            troughcolor=UI_COLORS['bg_separator'],
+            highlightthickness=0,
+            state=tk.DISABLED,
+            command=self._on_timeline_change
+        )
+        self.timeline_scale.pack(pady=3)
+        
+        self.timeline_label = tk.Label(
+            self.control_frame,
+            text="Paso: 0 / 0",
+            font=('Helvetica', 8),
+            fg=UI_COLORS['text_secondary'],
+            bg=UI_COLORS['bg_main']
+        )
+        self.timeline_label.pack()
+        self._timeline_total = 0
+        
+        step_frame = tk.Frame(self.control_frame, bg=UI_COLORS['bg_main'])
+        step_frame.pack(pady=5)
+        
+        small_style = dict(BUTTON_STYLE_SMALL, width=8)
+        self.step_back_btn = tk.Button(
+            step_frame,
+            text="◀ Paso",
+            bg=UI_COLORS['btn_info'],
+            fg=UI_COLORS['text_white'],
+            disabledforeground=UI_COLORS['text_white'],
+            command=self.callbacks['step_back'],
+            state=tk.DISABLED,
+            **small_style
+        )
+        self.step_back_btn.grid(row=0, column=0, padx=2)
+        
+        self.direction_btn = tk.Button(
+            step_frame,
+            text="◀◀ Reversa",
+            bg=UI_COLORS['btn_primary'],
+            fg=UI_COLORS['text_white'],
+            disabledforeground=UI_COLORS['text_white'],
+            command=self.callbacks['toggle_direction'],
+            state=tk.DISABLED,
+            **small_style
+        )
+        self.direction_btn.grid(row=0, column=1, padx=2)
+        
+        self.step_forward_btn = tk.Button(
+            step_frame,
+            text="Paso ▶",
+            bg=UI_COLORS['btn_info'],
+            fg=UI_COLORS['text_white'],
+            disabledforeground=UI_COLORS['text_white'],
+            command=self.callbacks['step_forward'],
+            state=tk.DISABLED,
+            **small_style
+        )
+        self.step_forward_btn.grid(row=0, column=2, padx=2)
+        self.timeline_buttons = [self.step_back_btn, self.direction_btn, self.step_forward_btn]
+    
+    def _on_timeline_change(self, value):
+        """Notifica el paso seleccionado en la línea de tiempo."""
+        self.callbacks['seek_timeline'](int(float(value)))
+    
     def _create_status_section(self):
         """Crea la sección de estado."""
         self.status_label = tk.Label(
@@ -287,10 +587,48 @@ class ControlPanel:
         )
         self.instruction_label.pack(pady=5)
     
-    def _create_legend_section(self):
+    def _create_perf_section(self):
+        """Crea la sección de métricas de rendimiento."""
+        perf_frame = tk.Frame(self.control_frame, bg=UI_COLORS['bg_main'])
+        perf_frame.pack(pady=3)
+        
+        self.perf_var = tk.BooleanVar(value=False)
+        perf_check = tk.Checkbutton(
+            perf_frame,
+            text="Mostrar rendimiento",
+            variable=self.perf_var,
+            command=self.callbacks['toggle_perf'],
+            font=('Helvetica', 8),
+            fg=UI_COLORS['text_primary'],
+            bg=UI_COLORS['bg_main'],
+            activebackground=UI_COLORS['bg_main']
+        )
+        perf_check.pack(side=tk.LEFT)
+        
+        dump_btn = tk.Button(
+            perf_frame,
+            text="Guardar",
+            bg=UI_COLORS['btn_info'],
+            fg=UI_COLORS['text_white'],
+            command=self.callbacks['dump_perf'],
+            **dict(BUTTON_STYLE_SMALL, width=7, height=1)
+        )
+        dump_btn.pack(side=tk.LEFT, padx=5)
+        
+        self.perf_label = tk.Label(
+            self.control_frame,
+            text="",
+            font=('Courier', 8),
+            fg=UI_COLORS['text_secondary'],
+            bg=UI_COLORS['bg_main'],
+            justify=tk.LEFT
+        )
+        self.perf_label.pack()
+    
+    def _create_legend_section(self, parent):
         """Crea la sección de leyenda."""
         legend_label = tk.Label(
-            self.control_frame,
+            parent,
             text="Leyenda BFS:",
             font=('Helvetica', 8, 'bold'),
             fg=UI_COLORS['text_primary'],
@@ -303,10 +641,13 @@ class ControlPanel:
             ('En cola', COLORS['queued']),
             ('Actual', COLORS['current']),
             ('Visitado', COLORS['visited']),
+            ('Frontera origen', COLORS['source_frontier']),
+            ('Frontera destino', COLORS['target_frontier']),
+            ('Camino más corto', COLORS['path']),
         ]
         
         for text, bg_color in legend_items:
-            item_frame = tk.Frame(self.control_frame, bg=UI_COLORS['bg_main'])
+            item_frame = tk.Frame(parent, bg=UI_COLORS['bg_main'])
             item_frame.pack(anchor='w', padx=30, pady=1)
             
             color_box = tk.Label(
@@ -327,10 +668,10 @@ class ControlPanel:
             )
             text_label.pack(side=tk.LEFT)
     
-    def _create_queue_section(self):
+    def _create_queue_section(self, parent):
         """Crea la sección de visualización de cola."""
         queue_title = tk.Label(
-            self.control_frame,
+            parent,
             text="Cola BFS:",
             font=('Helvetica', 8, 'bold'),
             fg=UI_COLORS['text_primary'],
@@ -338,15 +679,7 @@ class ControlPanel:
         )
         queue_title.pack(pady=3)
         
-        self.queue_label = tk.Label(
-            self.control_frame,
-            text="[ ]",
-            font=('Courier', 8),
-            fg=UI_COLORS['queue_text'],
-            bg=UI_COLORS['bg_main'],
-            wraplength=250
-        )
-        self.queue_label.pack(pady=3)
+        self.queue_view = QueueView(parent)
     
     # === Métodos públicos para actualizar el estado ===
     
@@ -362,11 +695,115 @@ class ControlPanel:
         self.instruction_label.config(text=text)
     
     def update_queue_display(self, labels):
-        """Actualiza la visualización de la cola."""
-        if labels:
-            self.queue_label.config(text="[ " + " → ".join(labels) + " ]")
+        """Reemplaza por completo la visualización de la cola."""
+        if self.queue_view is None:
+            self._create_deferred_sections()
+        self.queue_view.reset(labels)
+    
+    def apply_queue_delta(self, queue_op, label, backward=False):
+        """
+        Aplica a la cola visible el cambio de un paso en O(1).
+        
+        Args:
+            queue_op: 'pop' (cabeza), 'push' (final) o None
+            label: Etiqueta del nodo afectado
+            backward: True si se está deshaciendo el paso
+        """
+        if self.queue_view is None:
+            self._create_deferred_sections()
+        if queue_op == 'pop':
+            if backward:
+                self.queue_view.undo_pop(label)
+            else:
+                self.queue_view.pop()
+        elif queue_op == 'push':
+            if backward:
+                self.queue_view.undo_push()
+            else:
+                self.queue_view.push(label)
+    
+    def configure_timeline(self, total_steps):
+        """Habilita la línea de tiempo para un recorrido de `total_steps` pasos."""
+        self._timeline_total = total_steps
+        self.timeline_scale.config(state=tk.NORMAL, to=total_steps)
+        self.timeline_scale.set(0)
+        self.timeline_label.config(text=f"Paso: 0 / {total_steps}")
+        for btn in self.timeline_buttons:
+            btn.config(state=tk.NORMAL)
+    
+    def configure_trace_replay(self, total_steps):
+        """
+        Prepara la línea de tiempo para reproducir una traza (solo hacia adelante).
+        
+        Args:
+            total_steps: Cantidad de pasos de la traza, o None si no se conoce
+        """
+        self.reset_timeline()
+        self._timeline_total = '?' if total_steps is None else total_steps
+        self.timeline_label.config(text=f"Paso: 0 / {self._timeline_total}")
+        self.step_forward_btn.config(state=tk.NORMAL)
+    
+    def set_timeline_position(self, position):
+        """Mueve el cursor de la línea de tiempo al paso indicado."""
+        self.timeline_scale.set(position)
+        self.timeline_label.config(text=f"Paso: {position} / {self._timeline_total}")
+    
+    def set_timeline_total(self, total_steps):
+        """Actualiza la cantidad de pasos disponibles en la línea de tiempo."""
+        self._timeline_total = total_steps
+        self.timeline_scale.config(to=total_steps)
+        self.timeline_label.config(
+            text=f"Paso: {int(self.timeline_scale.get())} / {total_steps}"
+        )
+    
+    def set_generation_progress(self, generated, total):
+        """
+        Actualiza el indicador de progreso de la generación de pasos.
+        
+        Args:
+            generated: Pasos generados hasta ahora
+            total: Total estimado de pasos, o None si la generación se detuvo
+        """
+        if total is None:
+            self.progress_label.config(text=f"Pasos generados: {generated} (cancelado)")
+            return
+        percent = 100 if total <= 0 else min(100, generated * 100 / total)
+        self.progress_bar.config(value=percent)
+        self.progress_label.config(text=f"Pasos generados: {generated}")
+    
+    def update_level_display(self, level, frontier):
+        """
+        Muestra el nivel BFS del paso actual y el tamaño de su frontera.
+        
+        Args:
+            level: Nivel (distancia al origen), o None para ocultar el indicador
+            frontier: Cantidad de nodos del nivel
+        """
+        if level is None:
+            self.level_label.config(text="")
+        else:
+            self.level_label.config(text=f"Nivel: {level}   Frontera: {frontier} nodos")
+    
+    def reset_timeline(self):
+        """Deshabilita y reinicia la línea de tiempo."""
+        self._timeline_total = 0
+        self.timeline_scale.config(state=tk.NORMAL)
+        self.timeline_scale.set(0)
+        self.timeline_scale.config(to=0, state=tk.DISABLED)
+        self.timeline_label.config(text="Paso: 0 / 0")
+        self.progress_bar.config(value=0)
+        self.progress_label.config(text="Pasos generados: 0")
+        self.level_label.config(text="")
+        for btn in self.timeline_buttons:
+            btn.config(state=tk.DISABLED)
+        self.set_direction_button(1)
+    
+    def set_direction_button(self, direction):
+        """Muestra en el botón la dirección a la que se puede cambiar."""
+        if direction > 0:
+            self.direction_btn.config(text="◀◀ Reversa", bg=UI_COLORS['btn_primary'])
         else:
-            self.queue_label.config(text="[ ]")
+            self.direction_btn.config(text="Adelante ▶▶", bg=UI_COLORS['btn_resume'])
     
     def set_button_active(self, mode):
         """Resalta el botón del modo activo."""
@@ -388,8 +825,18 @@ class ControlPanel:
                 btn.config(bg=UI_COLORS['btn_primary'])
     
     def set_start_button_state(self, enabled):
-        """Habilita/deshabilita el botón de inicio."""
-        self.start_btn.config(state=tk.NORMAL if enabled else tk.DISABLED)
+        """Habilita/deshabilita los botones de inicio."""
+        state = tk.NORMAL if enabled else tk.DISABLED
+        self.start_btn.config(state=state)
+        self.path_btn.config(state=state)
+        self.replay_trace_btn.config(state=state)
+    
+    def set_layout_button(self, running):
+        """Alterna el botón de distribución entre iniciar y detener."""
+        if running:
+            self.layout_btn.config(text="Detener distribución", bg=UI_COLORS['btn_warning'])
+        else:
+            self.layout_btn.config(text="Distribuir automáticamente", bg=UI_COLORS['btn_info'])
     
     def set_pause_button(self, enabled, text="Pausar", is_paused=False):
         """Configura el botón de pausa."""
@@ -401,6 +848,45 @@ class ControlPanel:
             bg=bg_color, 
             fg=UI_COLORS['text_white']
         )
+        self.cancel_btn.config(state=state)
+    
+    def get_forest_mode(self):
+        """Retorna True si el BFS debe recorrer todas las componentes."""
+        return self.forest_var.get()
+    
+    def get_max_depth(self):
+        """Retorna la profundidad máxima del BFS o None si no hay límite."""
+        try:
+            depth = int(self.depth_var.get())
+        except (tk.TclError, ValueError):
+            return None
+        return depth if depth > 0 else None
+    
+    def get_level_stats_enabled(self):
+        """Retorna True si el BFS debe emitir estadísticas por nivel."""
+        return self.level_stats_var.get()
+    
+    def get_perf_enabled(self):
+        """Retorna True si el panel de rendimiento está activado."""
+        return self.perf_var.get()
+    
+    def update_perf_overlay(self, summary):
+        """
+        Muestra el resumen de métricas (o lo oculta si es None).
+        
+        Args:
+            summary: Diccionario retornado por PerfRecorder.summary()
+        """
+        if summary is None:
+            self.perf_label.config(text="")
+            return
+        generate = summary['timers'].get('trace.generate', {}).get('seconds', 0.0)
+        self.perf_label.config(text=(
+            f"FPS: {summary['fps']:6.1f}   pasos/s: {summary['steps_per_second']:7.1f}\n"
+            f"p50: {summary['p50_ms']:6.2f} ms   p99: {summary['p99_ms']:6.2f} ms\n"
+            f"lag: {summary['lag_ms']:6.2f} ms   Tk/cuadro: {summary['tk_calls_per_frame']:5.1f}\n"
+            f"generación de traza: {generate * 1000:.1f} ms"
+        ))
     
     def get_speed_value(self):
         """Obtiene el valor de velocidad del entry."""
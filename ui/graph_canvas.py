@@ -4,6 +4,40 @@ import tkinter as tk
 import math
 
 from config.colors import COLORS, UI_COLORS, NODE_RADIUS
+from profiling import PROFILER
+
+
+def node_text_color(fill_color):
+    """Retorna el color de la etiqueta que contrasta con el relleno de un nodo."""
+    return '#ffffff' if fill_color in (COLORS['current'], COLORS['visited']) else '#333333'
+
+
+def ops_script(path, ops):
+    """
+    Arma el script Tcl que aplica operaciones (elemento, opciones) a un canvas.
+    
+    Args:
+        path: Nombre Tcl del canvas (str(canvas))
+        ops: Lista de tuplas (ID de elemento, opciones Tcl como '-fill #fff')
+        
+    Returns:
+        Texto con un comando itemconfigure por línea
+    """
+    return '\n'.join([f'{path} itemconfigure {item} {options}' for item, options in ops])
+
+
+# Mueve un nodo y sus aristas; las aristas están en bfs_drag_lines($canvas)
+# como lista plana "línea x y" con la posición del otro extremo
+_DRAG_PROC = """
+proc ::bfs_drag_move {canvas circle text radius x y} {
+    global bfs_drag_lines
+    $canvas coords $circle [expr {$x - $radius}] [expr {$y - $radius}] [expr {$x + $radius}] [expr {$y + $radius}]
+    $canvas coords $text $x $y
+    foreach {line x2 y2} $bfs_drag_lines($canvas) {
+        $canvas coords $line $x $y $x2 $y2
+    }
+}
+"""
 
 
 class GraphCanvas:
@@ -24,11 +58,19 @@ class GraphCanvas:
             highlightthickness=0
         )
         self.canvas.pack(fill=tk.BOTH, expand=True, padx=2, pady=2)
+        self._path = str(self.canvas)
+        self._drag_proc_ready = False  # _DRAG_PROC ya definido en el intérprete
+        self._drag_items = None  # (circle_id, text_id) del nodo arrastrado
     
     def bind_click(self, callback):
         """Vincula un callback al evento de click."""
         self.canvas.bind('<Button-1>', callback)
     
+    def bind_drag(self, on_motion, on_release):
+        """Vincula callbacks al arrastre con el botón izquierdo y a su fin."""
+        self.canvas.bind('<B1-Motion>', on_motion)
+        self.canvas.bind('<ButtonRelease-1>', on_release)
+    
     def create_node(self, x, y, label):
         """
         Crea un nodo visual en el canvas.
@@ -55,6 +97,8 @@ class GraphCanvas:
             fill='#333333'
         )
         
+        if PROFILER.enabled:
+            PROFILER.count_tk_calls(2)
         return circle_id, text_id
     
     def create_edge(self, x1, y1, x2, y2):
@@ -74,12 +118,74 @@ class GraphCanvas:
             width=3
         )
         self.canvas.tag_lower(line_id)
+        if PROFILER.enabled:
+            PROFILER.count_tk_calls(2)
         return line_id
     
+    def move_node(self, circle_id, text_id, x, y):
+        """Mueve el círculo y la etiqueta de un nodo a (x, y)."""
+        self.canvas.coords(
+            circle_id,
+            x - NODE_RADIUS, y - NODE_RADIUS,
+            x + NODE_RADIUS, y + NODE_RADIUS
+        )
+        self.canvas.coords(text_id, x, y)
+        if PROFILER.enabled:
+            PROFILER.count_tk_calls(2)
+    
+    def begin_drag(self, circle_id, text_id, lines):
+        """
+        Prepara el arrastre de un nodo.
+        
+        Las aristas incidentes se guardan una vez en una variable Tcl y un
+        procedimiento Tcl las recorre en cada cuadro, así que mover el nodo
+        es una sola llamada desde Python sin importar su grado.
+        
+        Args:
+            circle_id, text_id: Elementos del nodo
+            lines: Lista de tuplas (line_id, x, y) con la línea de cada
+                arista incidente y la posición de su otro extremo
+        """
+        tk_app = self.canvas.tk
+        if not self._drag_proc_ready:
+            tk_app.eval(_DRAG_PROC)
+            self._drag_proc_ready = True
+        tk_app.call('set', f'bfs_drag_lines({self._path})', [value for line in lines for value in line])
+        self._drag_items = (circle_id, text_id)
+    
+    def drag_node(self, x, y):
+        """Mueve el nodo arrastrado y sus aristas a (x, y) con una sola llamada a Tcl."""
+        if self._drag_items is None:
+            return
+        circle_id, text_id = self._drag_items
+        self.canvas.tk.call('::bfs_drag_move', self._path, circle_id, text_id, NODE_RADIUS, x, y)
+        if PROFILER.enabled:
+            PROFILER.count_tk_calls(1)
+    
+    def end_drag(self):
+        """Libera las aristas guardadas para el arrastre."""
+        self.canvas.tk.call('unset', '-nocomplain', f'bfs_drag_lines({self._path})')
+        self._drag_items = None
+    
+    def move_edge(self, line_id, x1, y1, x2, y2):
+        """Mueve los extremos de una arista."""
+        self.canvas.coords(line_id, x1, y1, x2, y2)
+        if PROFILER.enabled:
+            PROFILER.count_tk_calls(1)
+    
+    def get_size(self):
+        """Retorna (ancho, alto) visibles del canvas."""
+        return self.canvas.winfo_width(), self.canvas.winfo_height()
+    
     def delete_item(self, item_id):
         """Elimina un elemento del canvas."""
         self.canvas.delete(item_id)
     
+    def delete_items(self, item_ids):
+        """Elimina varios elementos del canvas con una sola llamada."""
+        if item_ids:
+            self.canvas.delete(*item_ids)
+    
     def delete_all(self):
         """Elimina todos los elementos del canvas."""
         self.canvas.delete('all')
@@ -94,34 +200,64 @@ class GraphCanvas:
             color: Nuevo color de relleno
         """
         self.canvas.itemconfig(circle_id, fill=color)
-        text_color = '#ffffff' if color in [COLORS['current'], COLORS['visited']] else '#333333'
-        self.canvas.itemconfig(text_id, fill=text_color)
+        self.canvas.itemconfig(text_id, fill=node_text_color(color))
+        if PROFILER.enabled:
+            PROFILER.count_tk_calls(2)
     
     def set_edge_color(self, line_id, color):
         """Cambia el color de una arista."""
         self.canvas.itemconfig(line_id, fill=color)
+        if PROFILER.enabled:
+            PROFILER.count_tk_calls(1)
+    
+    def apply_ops(self, ops):
+        """
+        Aplica varias opciones de elementos con un único comando Tcl.
+        
+        Args:
+            ops: Lista de tuplas (ID de elemento, opciones Tcl como '-fill #fff')
+        """
+        if not ops:
+            return
+        self.canvas.tk.eval(ops_script(self._path, ops))
+        if PROFILER.enabled:
+            PROFILER.count_tk_calls(1)
     
     def set_node_outline(self, circle_id, outline_color, width):
         """Cambia el contorno de un nodo."""
         self.canvas.itemconfig(circle_id, outline=outline_color, width=width)
+        if PROFILER.enabled:
+            PROFILER.count_tk_calls(1)
     
-    def get_node_at(self, x, y, nodes):
+    def get_node_at(self, x, y, nodes, candidates=None):
         """
         Encuentra el nodo en una posición dada.
         
         Args:
             x, y: Coordenadas del click
             nodes: Diccionario de nodos del grafo
-            
+            candidates: IDs a revisar (p. ej. Graph.nodes_near); por
+                defecto se revisan todos los nodos
+                
         Returns:
-            ID del nodo o None
+            ID del nodo o None (si hay varios, el creado primero)
         """
-        for node_id, data in nodes.items():
+        if candidates is None:
+            for node_id, data in nodes.items():
+                dx = x - data['x']
+                dy = y - data['y']
+                if math.sqrt(dx*dx + dy*dy) <= NODE_RADIUS:
+                    return node_id
+            return None
+        
+        found = None
+        for node_id in candidates:
+            data = nodes[node_id]
             dx = x - data['x']
             dy = y - data['y']
-            if math.sqrt(dx*dx + dy*dy) <= NODE_RADIUS:
-                return node_id
-        return None
+            if math.sqrt(dx*dx + dy*dy) <= NODE_RADIUS and (found is None or node_id < found):
+                found = node_id
+        return found
     
     def get_edge_at(self, x, y, edges, nodes):
         """
@@ -0,0 +1,446 @@
+"""Ventana del modo grilla: BFS sobre laberintos dibujados en una imagen."""
+
+import tkinter as tk
+
+from config.colors import COLORS, UI_COLORS
+from config.styles import BUTTON_STYLE_SMALL
+from models.grid import Grid
+from algorithms.grid_bfs import GridBFS
+
+
+# Códigos de sombreado de cada celda (índices de la paleta)
+FREE, WALL, FRONTIER, VISITED, PATH, ENDPOINT = range(6)
+
+GRID_PALETTE = (
+    COLORS['grid_free'],
+    COLORS['grid_wall'],
+    COLORS['queued'],
+    COLORS['visited'],
+    COLORS['path'],
+    COLORS['current'],
+)
+
+
+class GridRenderer:
+    """
+    Dibuja una Grid como una única PhotoImage.
+    
+    Cada celda ocupa `cell_size` x `cell_size` píxeles. Los cambios se
+    acumulan por fila; `flush` los une en tramos (separados si hay más de
+    `max_gap` celdas sin cambios entre ellos) y envía con un solo
+    `PhotoImage.put` cada bloque de filas consecutivas con el mismo tramo.
+    Así el costo por cuadro depende de las celdas que cambiaron y no del
+    tamaño de la grilla.
+    """
+    
+    max_gap = 16
+    
+    def __init__(self, canvas, grid, cell_size):
+        """
+        Inicializa la imagen y la coloca en el canvas.
+        
+        Args:
+            canvas: Canvas de tkinter
+            grid: Objeto Grid a dibujar
+            cell_size: Lado de cada celda en píxeles
+        """
+        self.grid = grid
+        self.cell_size = cell_size
+        self.shade = bytearray(grid.size)
+        self._dirty = {}  # {fila con borde: [columnas con borde modificadas]}
+        self.image = tk.PhotoImage(
+            width=grid.width * cell_size, height=grid.height * cell_size
+        )
+        self.item = canvas.create_image(0, 0, anchor='nw', image=self.image)
+    
+    def redraw(self, batch_rows=64):
+        """
+        Redibuja toda la grilla (muros y celdas libres) por bloques de filas.
+        
+        Args:
+            batch_rows: Cantidad de filas enviadas en cada llamada a put
+        """
+        grid = self.grid
+        self.shade[:] = grid.cells
+        self._dirty.clear()
+        self.image.put(GRID_PALETTE[FREE], to=(0, 0, self.image.width(), self.image.height()))
+        
+        # Solo se envían las filas que tienen algún muro
+        rows = [y for y, walls in grid.wall_rows() if any(walls)]
+        for k in range(0, len(rows), batch_rows):
+            block = rows[k:k + batch_rows]
+            if block[-1] - block[0] == len(block) - 1:
+                self._put_rows(block[0], block[-1], 0, grid.width - 1)
+            else:
+                for y in block:
+                    self._put_rows(y, y, 0, grid.width - 1)
+    
+    def set_cells(self, cells, code):
+        """
+        Cambia el sombreado de varias celdas (se envía en el próximo flush).
+        
+        Args:
+            cells: Iterable de índices de celda
+            code: Código de sombreado (FREE, WALL, FRONTIER, ...)
+        """
+        shade = self.shade
+        dirty = self._dirty
+        stride = self.grid.stride
+        for cell in cells:
+            shade[cell] = code
+            y, x = divmod(cell, stride)
+            columns = dirty.get(y)
+            if columns is None:
+                dirty[y] = [x]
+            else:
+                columns.append(x)
+    
+    def flush(self):
+        """Envía a la imagen las filas modificadas desde el último flush."""
+        if not self._dirty:
+            return
+        dirty = self._dirty
+        self._dirty = {}
+        
+        # Bloques abiertos {(x0, x1): [fila inicial, fila final]}: las filas
+        # consecutivas con el mismo tramo se envían en un solo put
+        open_runs = {}
+        for y in sorted(dirty):
+            for span in _spans(dirty[y], self.max_gap):
+                run = open_runs.get(span)
+                if run is not None and run[1] == y - 1:
+                    run[1] = y
+                    continue
+                if run is not None:
+                    self._put_rows(run[0] - 1, run[1] - 1, span[0] - 1, span[1] - 1)
+                open_runs[span] = [y, y]
+        for (x0, x1), (y0, y1) in open_runs.items():
+            self._put_rows(y0 - 1, y1 - 1, x0 - 1, x1 - 1)
+    
+    def _put_rows(self, y0, y1, x0, x1):
+        """Copia a la imagen el rectángulo de celdas [x0, x1] x [y0, y1]."""
+        shade = self.shade
+        size = self.cell_size
+        index = self.grid.index
+        rows = []
+        for y in range(y0, y1 + 1):
+            start = index(x0, y)
+            colors = [GRID_PALETTE[code] for code in shade[start:start + x1 - x0 + 1]]
+            if size > 1:
+                colors = [color for color in colors for _ in range(size)]
+            row = '{' + ' '.join(colors) + '}'
+            rows.extend([row] * size)
+        self.image.put(' '.join(rows), to=(x0 * size, y0 * size))
+
+
+def _spans(columns, max_gap):
+    """Une columnas modificadas en tramos (x0, x1) separados por más de max_gap."""
+    columns = sorted(set(columns))
+    spans = []
+    start = end = columns[0]
+    for x in columns[1:]:
+        if x - end > max_gap:
+            spans.append((start, end))
+            start = x
+        end = x
+    spans.append((start, end))
+    return spans
+
+
+class GridWindow:
+    """Ventana independiente para editar una grilla y animar BFS sobre ella."""
+    
+    def __init__(self, parent, width=200, height=150):
+        """
+        Crea la ventana con sus controles y una grilla vacía.
+        
+        Args:
+            parent: Ventana principal de tkinter
+            width: Columnas iniciales de la grilla
+            height: Filas iniciales de la grilla
+        """
+        self.window = tk.Toplevel(parent)
+        self.window.title("Modo grilla - BFS sobre laberintos")
+        self.window.configure(bg=UI_COLORS['bg_main'])
+        
+        self.grid = None
+        self.renderer = None
+        self.start = None
+        self.target = None
+        self._search = None
+        self._after_id = None
+        self._last_cell = None
+        
+        self._create_controls(width, height)
+        self._create_canvas()
+        self._new_grid()
+        self.window.protocol("WM_DELETE_WINDOW", self._close)
+    
+    def exists(self):
+        """Retorna True si la ventana sigue abierta."""
+        try:
+            return bool(self.window.winfo_exists())
+        except tk.TclError:
+            return False
+    
+    def lift(self):
+        """Trae la ventana al frente."""
+        self.window.deiconify()
+        self.window.lift()
+    
+    # === Construcción de la interfaz ===
+    
+    def _create_controls(self, width, height):
+        """Crea la barra de controles superior."""
+        bar = tk.Frame(self.window, bg=UI_COLORS['bg_main'])
+        bar.pack(fill=tk.X, padx=5, pady=5)
+        
+        self.width_var = tk.IntVar(value=width)
+        self.height_var = tk.IntVar(value=height)
+        for text, var in (("Ancho:", self.width_var), ("Alto:", self.height_var)):
+            tk.Label(
+                bar, text=text, font=('Helvetica', 8),
+                fg=UI_COLORS['text_primary'], bg=UI_COLORS['bg_main']
+            ).pack(side=tk.LEFT)
+            tk.Spinbox(
+                bar, from_=2, to=2000, width=5, textvariable=var, font=('Helvetica', 8)
+            ).pack(side=tk.LEFT, padx=(2, 6))
+        
+        self._button(bar, "Nueva grilla", UI_COLORS['btn_primary'], self._new_grid)
+        
+        self.density_var = tk.IntVar(value=30)
+        tk.Scale(
+            bar, from_=0, to=60, orient=tk.HORIZONTAL, variable=self.density_var,
+            label="Muros %", length=90, font=('Helvetica', 7),
+            bg=UI_COLORS['bg_main'], highlightthickness=0
+        ).pack(side=tk.LEFT, padx=4)
+        self._button(bar, "Muros al azar", UI_COLORS['btn_primary'], self._randomize)
+        self._button(bar, "Limpiar", UI_COLORS['btn_danger'], self._clear_walls)
+        
+        self.edit_var = tk.StringVar(value='wall')
+        for text, value in (("Muros", 'wall'), ("Inicio", 'start'), ("Destino", 'target')):
+            tk.Radiobutton(
+                bar, text=text, value=value, variable=self.edit_var,
+                font=('Helvetica', 8), fg=UI_COLORS['text_primary'],
+                bg=UI_COLORS['bg_main'], activebackground=UI_COLORS['bg_main']
+            ).pack(side=tk.LEFT)
+        
+        self.levels_var = tk.IntVar(value=2)
+        tk.Label(
+            bar, text="Niveles/cuadro:", font=('Helvetica', 8),
+            fg=UI_COLORS['text_primary'], bg=UI_COLORS['bg_main']
+        ).pack(side=tk.LEFT, padx=(6, 0))
+        tk.Spinbox(
+            bar, from_=1, to=500, width=4, textvariable=self.levels_var, font=('Helvetica', 8)
+        ).pack(side=tk.LEFT, padx=2)
+        self._button(bar, "Iniciar BFS", UI_COLORS['btn_success'], self._start_bfs)
+        
+        self.status_label = tk.Label(
+            self.window, text="", font=('Helvetica', 9),
+            fg=UI_COLORS['text_secondary'], bg=UI_COLORS['bg_main'], anchor='w'
+        )
+        self.status_label.pack(fill=tk.X, padx=8)
+    
+    def _button(self, parent, text, color, command):
+        """Crea un botón pequeño de la barra de controles."""
+        tk.Button(
+            parent, text=text, bg=color, fg=UI_COLORS['text_white'], command=command,
+            **dict(BUTTON_STYLE_SMALL, width=len(text) + 1, height=1)
+        ).pack(side=tk.LEFT, padx=2)
+    
+    def _create_canvas(self):
+        """Crea el canvas con barras de desplazamiento."""
+        frame = tk.Frame(self.window, bg=UI_COLORS['bg_separator'])
+        frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.canvas = tk.Canvas(frame, bg=UI_COLORS['bg_canvas'], highlightthickness=0)
+        x_scroll = tk.Scrollbar(frame, orient=tk.HORIZONTAL, command=self.canvas.xview)
+        y_scroll = tk.Scrollbar(frame, orient=tk.VERTICAL, command=self.canvas.yview)
+        self.canvas.configure(xscrollcommand=x_scroll.set, yscrollcommand=y_scroll.set)
+        x_scroll.pack(side=tk.BOTTOM, fill=tk.X)
+        y_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+        self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        self.canvas.bind('<Button-1>', lambda e: self._on_press(e, True))
+        self.canvas.bind('<B1-Motion>', lambda e: self._on_drag(e, True))
+        self.canvas.bind('<Button-3>', lambda e: self._on_press(e, False))
+        self.canvas.bind('<B3-Motion>', lambda e: self._on_drag(e, False))
+    
+    # === Grilla ===
+    
+    def _new_grid(self):
+        """Crea una grilla vacía con el tamaño indicado."""
+        self._stop_bfs()
+        try:
+            width = max(2, int(self.width_var.get()))
+            height = max(2, int(self.height_var.get()))
+        except (tk.TclError, ValueError):
+            width, height = 200, 150
+        
+        self.grid = Grid(width, height)
+        cell_size = max(1, min(800 // width, 600 // height))
+        self.canvas.delete('all')
+        self.renderer = GridRenderer(self.canvas, self.grid, cell_size)
+        self.canvas.configure(scrollregion=(0, 0, width * cell_size, height * cell_size))
+        self.start = self.grid.index(0, 0)
+        self.target = self.grid.index(width - 1, height - 1)
+        self._redraw()
+        self._set_status(f"Grilla de {width} x {height} ({width * height} celdas)")
+    
+    def _randomize(self):
+        """Coloca muros al azar con la densidad elegida."""
+        self._stop_bfs()
+        self.grid.randomize(self.density_var.get() / 100)
+        self._redraw()
+    
+    def _clear_walls(self):
+        """Elimina todos los muros."""
+        self._stop_bfs()
+        self.grid.clear()
+        self._redraw()
+    
+    def _redraw(self):
+        """Redibuja la grilla completa y marca inicio y destino."""
+        for cell in (self.start, self.target):
+            self.grid.set_wall(cell, False)
+        self.renderer.redraw()
+        self.renderer.set_cells((self.start, self.target), ENDPOINT)
+        self.renderer.flush()
+    
+    # === Edición con el mouse ===
+    
+    def _cell_at(self, event):
+        """Retorna el índice de la celda bajo el mouse o None."""
+        size = self.renderer.cell_size
+        x = int(self.canvas.canvasx(event.x)) // size
+        y = int(self.canvas.canvasy(event.y)) // size
+        if not self.grid.contains(x, y):
+            return None
+        return self.grid.index(x, y)
+    
+    def _on_press(self, event, primary):
+        """Inicia una edición: muro, inicio o destino según el modo."""
+        cell = self._cell_at(event)
+        if cell is None:
+            return
+        if self._search is not None:
+            self._stop_bfs()
+            self._redraw()
+        
+        mode = self.edit_var.get()
+        if primary and mode in ('start', 'target'):
+            self._move_endpoint(mode, cell)
+            self._last_cell = None
+            return
+        self._last_cell = cell
+        self._paint_walls([cell], primary)
+    
+    def _on_drag(self, event, primary):
+        """Pinta o borra muros a lo largo del trazo del mouse."""
+        if self._last_cell is None:
+            return
+        cell = self._cell_at(event)
+        if cell is None or cell == self._last_cell:
+            return
+        self._paint_walls(self._line(self._last_cell, cell), primary)
+        self._last_cell = cell
+    
+    def _line(self, cell1, cell2):
+        """Celdas entre dos celdas (interpolación lineal) para trazos continuos."""
+        x1, y1 = self.grid.coords(cell1)
+        x2, y2 = self.grid.coords(cell2)
+        count = max(abs(x2 - x1), abs(y2 - y1))
+        return [
+            self.grid.index(x1 + round((x2 - x1) * k / count), y1 + round((y2 - y1) * k / count))
+            for k in range(1, count + 1)
+        ]
+    
+    def _paint_walls(self, cells, wall):
+        """Marca o borra muros, respetando el inicio y el destino."""
+        cells = [cell for cell in cells if cell not in (self.start, self.target)]
+        for cell in cells:
+            self.grid.set_wall(cell, wall)
+        self.renderer.set_cells(cells, WALL if wall else FREE)
+        self.renderer.flush()
+    
+    def _move_endpoint(self, which, cell):
+        """Mueve el inicio o el destino a otra celda."""
+        old = self.start if which == 'start' else self.target
+        if cell == (self.target if which == 'start' else self.start):
+            return
+        self.grid.set_wall(cell, False)
+        if which == 'start':
+            self.start = cell
+        else:
+            self.target = cell
+        self.renderer.set_cells([old], FREE)
+        self.renderer.set_cells([cell], ENDPOINT)
+        self.renderer.flush()
+    
+    # === BFS animado ===
+    
+    def _start_bfs(self):
+        """Inicia la animación del BFS desde el inicio hacia el destino."""
+        self._stop_bfs()
+        self._redraw()
+        self._search = GridBFS(self.grid, self.start)
+        self._set_status("Ejecutando BFS...")
+        self._animate()
+    
+    def _stop_bfs(self):
+        """Detiene la animación en curso, si la hay."""
+        if self._after_id is not None:
+            self.window.after_cancel(self._after_id)
+            self._after_id = None
+        self._search = None
+    
+    def _close(self):
+        """Detiene la animación y cierra la ventana."""
+        self._stop_bfs()
+        self.window.destroy()
+    
+    def _animate(self):
+        """Expande algunos niveles y dibuja solo las celdas que cambiaron."""
+        self._after_id = None
+        search = self._search
+        renderer = self.renderer
+        try:
+            levels = max(1, int(self.levels_var.get()))
+        except (tk.TclError, ValueError):
+            levels = 1
+        
+        for _ in range(levels):
+            previous = search.frontier
+            discovered = search.step_level()
+            renderer.set_cells(previous, VISITED)
+            renderer.set_cells(discovered, FRONTIER)
+            if search.reached(self.target):
+                path = search.path_to(self.target)
+                renderer.set_cells(path, PATH)
+                renderer.set_cells((self.start, self.target), ENDPOINT)
+                renderer.flush()
+                self._search = None
+                self._set_status(
+                    f"Distancia: {len(path) - 1} pasos - "
+                    f"celdas exploradas: {search.visited_count}"
+                )
+                return
+            if search.is_finished():
+                renderer.set_cells((self.start, self.target), ENDPOINT)
+                renderer.flush()
+                self._search = None
+                self._set_status(
+                    f"El destino no es alcanzable - celdas exploradas: {search.visited_count}"
+                )
+                return
+        
+        renderer.set_cells((self.start,), ENDPOINT)
+        renderer.flush()
+        self._set_status(
+            f"Nivel {search.depth} - frontera: {len(search.frontier)} - "
+            f"exploradas: {search.visited_count}"
+        )
+        self._after_id = self.window.after(16, self._animate)
+    
+    def _set_status(self, text):
+        """Actualiza la línea de estado de la ventana."""
+        self.status_label.config(text=text)
@@ -0,0 +1,101 @@
+"""Vista virtualizada de la cola BFS."""
+
+import tkinter as tk
+from collections import deque
+
+from config.colors import UI_COLORS
+
+
+class QueueView:
+    """
+    Muestra la cola BFS como una ventana fija: cabeza, cola y cantidad.
+    
+    Recibe los cambios de la cola como deltas (push en la cola, pop en la
+    cabeza y sus inversos para retroceder), así que cada paso cuesta O(1)
+    sin importar cuántos nodos haya en la cola; solo se renderizan los
+    `head_size` primeros y los `tail_size` últimos elementos.
+    """
+    
+    def __init__(self, parent, head_size=6, tail_size=3):
+        """
+        Inicializa la vista de la cola.
+        
+        Args:
+            parent: Widget padre de tkinter
+            head_size: Cantidad de elementos visibles desde la cabeza
+            tail_size: Cantidad de elementos visibles del final
+        """
+        self.head_size = head_size
+        self.tail_size = tail_size
+        self._labels = deque()
+        
+        self.label = tk.Label(
+            parent,
+            text="[ ]",
+            font=('Courier', 8),
+            fg=UI_COLORS['queue_text'],
+            bg=UI_COLORS['bg_main'],
+            wraplength=250
+        )
+        self.label.pack(pady=3)
+        
+        self.count_label = tk.Label(
+            parent,
+            text="0 en cola",
+            font=('Helvetica', 8),
+            fg=UI_COLORS['text_secondary'],
+            bg=UI_COLORS['bg_main']
+        )
+        self.count_label.pack()
+    
+    def __len__(self):
+        """Retorna la cantidad de elementos en la cola."""
+        return len(self._labels)
+    
+    def reset(self, labels):
+        """Reemplaza todo el contenido de la cola (O(Q), solo al saltar)."""
+        self._labels = deque(labels)
+        self._render()
+    
+    def push(self, label):
+        """Agrega un elemento al final de la cola."""
+        self._labels.append(label)
+        self._render()
+    
+    def pop(self):
+        """Quita el elemento de la cabeza de la cola."""
+        if self._labels:
+            self._labels.popleft()
+        self._render()
+    
+    def undo_push(self):
+        """Deshace un push: quita el último elemento."""
+        if self._labels:
+            self._labels.pop()
+        self._render()
+    
+    def undo_pop(self, label):
+        """Deshace un pop: vuelve a poner un elemento en la cabeza."""
+        self._labels.appendleft(label)
+        self._render()
+    
+    def visible_text(self):
+        """Construye el texto de la ventana visible en O(head_size + tail_size)."""
+        labels = self._labels
+        count = len(labels)
+        if count == 0:
+            return "[ ]"
+        
+        if count <= self.head_size + self.tail_size:
+            shown = list(labels)
+        else:
+            head = [labels[i] for i in range(self.head_size)]
+            tail = [labels[i] for i in range(count - self.tail_size, count)]
+            hidden = count - self.head_size - self.tail_size
+            shown = head + [f"… +{hidden} …"] + tail
+        return "[ " + " → ".join(shown) + " ]"
+    
+    def _render(self):
+        """Actualiza los widgets con la ventana visible."""
+        self.label.config(text=self.visible_text())
+        self.count_label.config(text=f"{len(self._labels)} en cola")
@@ -0,0 +1,200 @@
+"""Planes de renderizado precompilados para la animación del BFS."""
+
+from array import array
+
+from config.colors import COLORS
+from models.timeline import edge_key
+from ui.graph_canvas import node_text_color
+
+
+class RenderPlan:
+    """
+    Traduce los deltas de una línea de tiempo a operaciones de canvas.
+    
+    Cada paso se compila de antemano a una lista plana de operaciones
+    (ID de elemento, opción): los IDs se guardan en un array y las opciones
+    ('-fill #RRGGBB') como índices a una paleta compartida, con una
+    variante para avanzar y otra para retroceder. Al reproducir, un paso
+    es un solo comando Tcl con todas sus operaciones, sin búsquedas en el
+    grafo ni llamadas por elemento. La etiqueta de un nodo solo se
+    repinta si su color de texto cambia. Editar el grafo no obliga a
+    recompilar: las líneas nuevas se registran para los pasos que falten
+    y las operaciones sobre elementos eliminados se descartan al emitirlas.
+    """
+    
+    def __init__(self, graph):
+        """
+        Inicializa un plan vacío.
+        
+        Args:
+            graph: Objeto Graph con los IDs de canvas de nodos y aristas
+        """
+        self.graph = graph
+        self.source = None  # Línea de tiempo cuyos deltas se compilaron
+        self._line_ids = {edge_key(n1, n2): line_id for n1, n2, line_id in graph.edges}
+        self._palette = []
+        self._palette_index = {}
+        self._removed = set()  # IDs de canvas eliminados después de compilar
+        self.reset()
+    
+    def __len__(self):
+        """Retorna la cantidad de pasos compilados."""
+        return len(self._offsets) - 1
+    
+    def reset(self, source=None):
+        """Descarta los pasos compilados y asocia el plan a otra línea de tiempo."""
+        self.source = source
+        self._items = array('q')
+        self._forward = array('H')
+        self._backward = array('H')
+        self._offsets = array('q', [0])
+    
+    def _option(self, color):
+        """Retorna el índice en la paleta de la opción '-fill color'."""
+        index = self._palette_index.get(color)
+        if index is None:
+            index = self._palette_index[color] = len(self._palette)
+            self._palette.append(f'-fill {color}')
+        return index
+    
+    def extend(self, deltas):
+        """
+        Compila los deltas que aún no estén en el plan.
+        
+        Args:
+            deltas: Lista completa de StepDelta de la línea de tiempo; solo
+                se compilan los posteriores a los ya compilados
+        """
+        nodes = self.graph.nodes
+        line_ids = self._line_ids
+        items = self._items
+        forward = self._forward
+        backward = self._backward
+        option = self._option
+        for i in range(len(self), len(deltas)):
+            delta = deltas[i]
+            node = nodes.get(delta.node) if delta.node is not None else None
+            if node is not None:
+                new_color = COLORS[delta.new_state]
+                prev_color = COLORS[delta.prev_state]
+                items.append(node['circle_id'])
+                forward.append(option(new_color))
+                backward.append(option(prev_color))
+                new_text = node_text_color(new_color)
+                prev_text = node_text_color(prev_color)
+                if new_text != prev_text:
+                    items.append(node['text_id'])
+                    forward.append(option(new_text))
+                    backward.append(option(prev_text))
+                line_id = line_ids.get(delta.edge) if delta.edge is not None else None
+                if line_id is not None:
+                    items.append(line_id)
+                    forward.append(option(COLORS[delta.new_edge_state]))
+                    backward.append(option(COLORS[delta.prev_edge_state]))
+            self._offsets.append(len(items))
+    
+    def add_lines(self, edges):
+        """
+        Registra aristas nuevas para los pasos que se compilen después.
+        
+        Args:
+            edges: Lista de tuplas (node1, node2, line_id)
+        """
+        line_ids = self._line_ids
+        for n1, n2, line_id in edges:
+            if line_id is not None:
+                line_ids[edge_key(n1, n2)] = line_id
+    
+    def remove_items(self, item_ids, edges=()):
+        """
+        Olvida elementos de canvas eliminados sin recompilar los pasos.
+        
+        Los IDs de canvas no se reutilizan, así que basta con omitir sus
+        operaciones al emitir cada paso.
+        
+        Args:
+            item_ids: IDs de canvas de los nodos y líneas eliminados
+            edges: Lista de tuplas (node1, node2, line_id) de las aristas eliminadas
+        """
+        line_ids = self._line_ids
+        for n1, n2, line_id in edges:
+            key = edge_key(n1, n2)
+            if line_ids.get(key) == line_id:
+                del line_ids[key]
+        self._removed.update(item_ids)
+    
+    def step_ops(self, index, backward=False):
+        """
+        Retorna las operaciones de un paso compilado.
+        
+        Args:
+            index: Índice del paso
+            backward: True para deshacer el paso en lugar de aplicarlo
+            
+        Returns:
+            Lista de tuplas (ID de elemento, opción)
+        """
+        options = self._backward if backward else self._forward
+        palette = self._palette
+        items = self._items
+        span = range(self._offsets[index], self._offsets[index + 1])
+        removed = self._removed
+        if removed:
+            return [
+                (items[j], palette[options[j]]) for j in span if items[j] not in removed
+            ]
+        return [(items[j], palette[options[j]]) for j in span]
+    
+    def path_ops(self, path, node_state='path', edge_state='edge_path'):
+        """
+        Retorna las operaciones que resaltan un camino completo.
+        
+        Args:
+            path: Lista de IDs de nodo consecutivos
+            node_state, edge_state: Claves de COLORS para nodos y aristas
+            
+        Returns:
+            Lista de tuplas (ID de elemento, opción) para aplicar de una vez
+        """
+        nodes = self.graph.nodes
+        palette = self._palette
+        color = COLORS[node_state]
+        fill = palette[self._option(color)]
+        text_fill = palette[self._option(node_text_color(color))]
+        edge_fill = palette[self._option(COLORS[edge_state])]
+        ops = []
+        for node_id in path:
+            node = nodes.get(node_id)
+            if node is not None:
+                ops.append((node['circle_id'], fill))
+                ops.append((node['text_id'], text_fill))
+        for n1, n2 in zip(path, path[1:]):
+            line_id = self._line_ids.get(edge_key(n1, n2))
+            if line_id is not None:
+                ops.append((line_id, edge_fill))
+        return ops
+    
+    def changes_ops(self, changes):
+        """
+        Traduce cambios de estado sueltos (saltos, trazas) a operaciones.
+        
+        Args:
+            changes: Tupla (node_changes, edge_changes) de la línea de tiempo
+            
+        Returns:
+            Lista de tuplas (ID de elemento, opción)
+        """
+        node_changes, edge_changes = changes
+        nodes = self.graph.nodes
+        ops = []
+        for node_id, state in node_changes:
+            node = nodes.get(node_id)
+            if node is not None:
+                color = COLORS[state]
+                ops.append((node['circle_id'], self._palette[self._option(color)]))
+                ops.append((node['text_id'], self._palette[self._option(node_text_color(color))]))
+        for key, state in edge_changes:
+            line_id = self._line_ids.get(key)
+            if line_id is not None:
+                ops.append((line_id, self._palette[self._option(COLORS[state])]))
+        return ops